@@ -15,8 +15,10 @@ st.set_page_config(
 
 from constants import REQUIRED_SESSION_KEYS
 from src.components.footer import footer
-from src.components.global_assets import load_global_assets
+from src.components.global_assets import confirm_global_assets, load_global_assets
 from src.components.header import header
+from src.diagnostics.session_token import restore_session, save_session
+from src.utils.telemetry import record_session_start, start_metrics_server, track_page
 
 
 @st.cache_resource
@@ -24,7 +26,11 @@ def init_database():
     """Initialize database once per session"""
     try:
         from src.db_queries.db_init import setup_database
+        from src.db_queries.profiler import run_startup_plan_check
+        from src.db_queries.reload import start_data_watcher
         setup_database()
+        run_startup_plan_check()
+        start_data_watcher()
         return True
     except Exception as e:
         st.error(f"Critical error: {str(e)}")
@@ -43,13 +49,15 @@ def initialize_session_state():
         'current_page': None,
     }
 
+    record_session_start(st.session_state)
     for key in REQUIRED_SESSION_KEYS:
         if key not in st.session_state:
-            st.session_state[key] = defaults.get(key, None if key != 'metrics_cache' else {})
+            st.session_state[key] = defaults.get(key)
 
 
 if __name__ == "__main__":
     # Initialize
+    start_metrics_server()
     load_global_assets()
     initialize_session_state()
 
@@ -57,6 +65,9 @@ if __name__ == "__main__":
     if 'db_conn' not in st.session_state:
         st.session_state.db_conn = init_database()  # Will be cached
 
+    # Rebuild progress carried in the URL token (sessions need no replica affinity)
+    restore_session(st.session_state, st.query_params)
+
     # Render global header
     header()
 
@@ -98,6 +109,12 @@ if __name__ == "__main__":
             title="Generate Report",
             icon="📊",
             url_path="report",
+        ),
+        st.Page(
+            "search_page.py",
+            title="Search",
+            icon="🔎",
+            url_path="search",
         )
     ]
 
@@ -109,7 +126,14 @@ if __name__ == "__main__":
     )
 
     # Execute selected page
-    nav.run()
+    with track_page(nav.url_path or "company_profile"):
+        nav.run()
+
+    # Keep the URL token in step with the session
+    save_session(st.session_state, st.query_params)
 
     # Render global footer
     footer()
+
+    # Everything this run emitted reached the browser, the inline assets included
+    confirm_global_assets()
@@ -0,0 +1,136 @@
+"""Cold-start profile: module import time and the first render of the company profile.
+
+Every measurement runs in a fresh interpreter so nothing is already imported or
+cached. Imports are profiled with ``python -X importtime``; the first render is
+``AppTest.from_file("app.py").run()``, which lands on ``company_profile.py``.
+
+    python -m benchmarks.startup                                               # print the profile
+    python -m benchmarks.startup --budget benchmarks/startup_budget.json       # exit 1 over budget
+    python -m benchmarks.startup --save-budget benchmarks/startup_budget.json  # record a new baseline
+"""
+import argparse
+import json
+import math
+import statistics
+import subprocess
+import sys
+
+# Modules a replica imports before it can serve the first page
+STARTUP_MODULES = [
+    "streamlit",
+    "constants",
+    "src.components.footer",
+    "src.components.global_assets",
+    "src.components.header",
+    "src.diagnostics.session_token",
+    "src.utils.telemetry",
+    "src.db_queries.db_init",
+    "src.db_queries.profiler",
+    "company_profile",
+]
+
+# Heavy modules that must not be loaded until a page actually uses them
+DEFERRED_MODULES = ["pandas", "altair"]
+
+FIRST_RENDER_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file("app.py", default_timeout={timeout})
+at.run()
+elapsed = time.perf_counter() - started
+if at.exception:
+    raise SystemExit(f"first render raised: {{[e.value for e in at.exception]}}")
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {deferred!r} if m in sys.modules]}}))
+"""
+
+
+def parse_importtime(stderr):
+    """(total self time in ms, {top-level module: cumulative ms}) from ``-X importtime`` output"""
+    total_us = 0
+    top_level = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        total_us += int(self_us)
+        if not name[1:].startswith(" "):
+            top_level[name.strip()] = int(cumulative_us) / 1000
+    return total_us / 1000, top_level
+
+
+def profile_imports(modules=STARTUP_MODULES):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "; ".join(f"import {module}" for module in modules)],
+        capture_output=True, text=True, check=True)
+    return parse_importtime(result.stderr)
+
+
+def profile_first_render(timeout):
+    result = subprocess.run(
+        [sys.executable, "-c", FIRST_RENDER_SCRIPT.format(timeout=timeout, deferred=DEFERRED_MODULES)],
+        capture_output=True, text=True)
+    if result.returncode:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "first render failed")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def check_budget(summary, budget):
+    """List every startup metric above its budget, and deferred modules loaded too early"""
+    violations = [
+        f"{metric} = {summary[metric]} > budget {limit}"
+        for metric, limit in budget.items()
+        if metric in summary and summary[metric] > limit
+    ]
+    violations.extend(f"{module} imported during the first render" for module in summary['loaded_early'])
+    return violations
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile process start and the first company profile render")
+    parser.add_argument('--runs', type=int, default=3, help='fresh interpreters per measurement (median is kept)')
+    parser.add_argument('--top', type=int, default=10, help='slowest top-level imports to list')
+    parser.add_argument('--timeout', type=float, default=60, help='seconds allowed for the first render')
+    parser.add_argument('--budget', help='JSON budget {import_ms|first_render_ms: limit}')
+    parser.add_argument('--save-budget', help='write the measured results (times --headroom) as a budget')
+    parser.add_argument('--headroom', type=float, default=1.5)
+    args = parser.parse_args(argv)
+
+    imports = [profile_imports() for _ in range(args.runs)]
+    renders = [profile_first_render(args.timeout) for _ in range(args.runs)]
+
+    summary = {
+        'import_ms': round(statistics.median(total for total, _ in imports), 1),
+        'first_render_ms': round(statistics.median(render['seconds'] for render in renders) * 1000, 1),
+        'loaded_early': sorted({module for render in renders for module in render['loaded']}),
+    }
+    slowest = sorted(imports[-1][1].items(), key=lambda item: item[1], reverse=True)[:args.top]
+
+    print(f"{'module':40}{'cumulative ms':>15}")
+    for module, ms in slowest:
+        print(f"{module:40}{ms:>15.1f}")
+    print(f"\nprocess start imports  {summary['import_ms']:>8.1f} ms (median of {args.runs})")
+    print(f"first render           {summary['first_render_ms']:>8.1f} ms (median of {args.runs})")
+    print(f"deferred modules loaded early: {', '.join(summary['loaded_early']) or 'none'}")
+
+    if args.save_budget:
+        budget = {metric: math.ceil(summary[metric] * args.headroom) for metric in ('import_ms', 'first_render_ms')}
+        with open(args.save_budget, 'w') as f:
+            json.dump(budget, f, indent=2)
+            f.write("\n")
+        print(f"\nBudget written to {args.save_budget}")
+
+    if args.budget:
+        with open(args.budget) as f:
+            violations = check_budget(summary, json.load(f))
+        if violations:
+            print("\nStartup budget exceeded:")
+            for violation in violations:
+                print(f"  {violation}")
+            return 1
+        print("\nWithin startup budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+"""End-to-end wizard benchmark driven headlessly through ``streamlit.testing.v1.AppTest``.
+
+Each simulated session fills in the company profile, visits the four pillar pages
+(moving one slider on each) and renders the report. Every rerun is timed and its
+emitted elements are counted; the peak Python memory a rerun allocates comes from
+tracemalloc.
+
+    python -m benchmarks.wizard --sessions 20 --profile stage=3,saas=1 --profile stage=4
+    python -m benchmarks.wizard --budget benchmarks/budget.json        # exit 1 on regression
+    python -m benchmarks.wizard --save-budget benchmarks/budget.json   # record a new baseline
+
+A profile is ``stage=<growth stage id>[,saas=<saas type id>][,industry=<industry id>]``;
+the ARR is chosen inside the stage's revenue band.
+"""
+import argparse
+import json
+import logging
+import math
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+
+from streamlit.testing.v1 import AppTest
+
+from src.db_queries.catalog import get_catalog
+
+logger = logging.getLogger(__name__)
+
+APP_SCRIPT = "app.py"
+PILLAR_PAGES = ["revenue_metrics.py", "product_metrics.py", "system_metrics.py", "people_metrics.py"]
+PAGE_NAMES = ["company_profile", *(page[:-3] for page in PILLAR_PAGES), "report_page"]
+PERCENTILES = (50, 95, 99)
+
+ARR_STEP = 0.25
+ARR_MAX = 12.0
+
+
+def parse_profile(spec):
+    """``stage=3,saas=1,industry=2`` -> {'stage': 3, 'saas': 1, 'industry': 2}"""
+    profile = {'stage': None, 'saas': None, 'industry': None}
+    for part in filter(None, spec.split(',')):
+        key, _, value = part.partition('=')
+        if key not in profile:
+            raise argparse.ArgumentTypeError(f"Unknown profile field {key!r} in {spec!r}")
+        profile[key] = int(value) or None
+    if profile['stage'] is None:
+        raise argparse.ArgumentTypeError(f"Profile {spec!r} needs a stage")
+    return profile
+
+
+def profile_label(profile):
+    return ",".join(f"{key}={value}" for key, value in profile.items() if value is not None)
+
+
+def revenue_for_stage(stage_id):
+    """An ARR slider value (in $M) that lands inside the stage's revenue band"""
+    stage = get_catalog().growth_stages[stage_id]
+    low, high = float(stage.low_range), min(float(stage.high_range), ARR_MAX)
+    value = math.ceil(((low + high) / 2) / ARR_STEP) * ARR_STEP
+    if not low <= value <= high:
+        value = math.ceil(low / ARR_STEP) * ARR_STEP
+    if not low <= value <= high:
+        raise ValueError(f"No ARR slider value falls inside stage {stage.growth_stage_name}")
+    return value
+
+
+def count_elements(node):
+    children = getattr(node, 'children', None)
+    if not children:
+        return 1
+    return 1 + sum(count_elements(child) for child in children.values())
+
+
+class SessionRecorder:
+    """Times reruns of one AppTest session and records elements / peak memory"""
+
+    def __init__(self, at, samples, elements, trace_memory):
+        self.at = at
+        self.samples = samples
+        self.elements = elements
+        self.trace_memory = trace_memory
+
+    def __call__(self, page, step):
+        baseline = 0
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter()
+        step()
+        elapsed = time.perf_counter() - started
+        # Peak allocated above what was live before the rerun
+        peak = tracemalloc.get_traced_memory()[1] - baseline if self.trace_memory else 0
+
+        if self.at.exception:
+            raise RuntimeError(f"{page} raised: {[e.value for e in self.at.exception]}")
+        self.samples[page].append((elapsed, peak))
+        self.elements[page].append(count_elements(self.at._tree))
+
+
+def run_session(profile, samples, elements, trace_memory, timeout):
+    """Drive one simulated user through the whole wizard"""
+    at = AppTest.from_file(APP_SCRIPT, default_timeout=timeout)
+    record = SessionRecorder(at, samples, elements, trace_memory)
+
+    record('company_profile', at.run)
+    if profile['saas'] is not None:
+        record('company_profile', lambda: at.selectbox(key="selected_saas_type_key").set_value(profile['saas']).run())
+    if profile['industry'] is not None:
+        record('company_profile', lambda: at.selectbox(key="selected_industry_key").set_value(profile['industry']).run())
+    record('company_profile', lambda: at.number_input(key="months_existed_key").set_value(36).run())
+    record('company_profile', lambda: at.slider(key="arr_key").set_value(revenue_for_stage(profile['stage'])).run())
+
+    if at.session_state["growth_stage_id"] != profile['stage']:
+        raise RuntimeError(f"Profile landed in stage {at.session_state['growth_stage_id']}, not {profile['stage']}")
+
+    for pillar_id, page in enumerate(PILLAR_PAGES, start=1):
+        name = page[:-3]
+        at.switch_page(page)
+        record(name, at.run)
+        if at.slider:
+            slider = at.slider[0]
+            record(name, lambda: slider.set_value(slider.min).run())
+        at.session_state[f"pillar_{pillar_id}_complete"] = True
+
+    # The report page is registered under the "report" url path, which AppTest.switch_page cannot
+    # address by file name; reach it the way a user does, through the last pillar's Continue button
+    record('report_page', at.button(key=f"pillar_{len(PILLAR_PAGES)}_continue").click().run)
+    if not at.header:
+        raise RuntimeError("Report page rendered no sections")
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return float('nan')
+    rank = max(math.ceil(pct / 100 * len(ordered)) - 1, 0)
+    return ordered[rank]
+
+
+def summarize(samples, elements):
+    summary = {}
+    for page in PAGE_NAMES:
+        if not samples[page]:
+            continue
+        latencies = [elapsed * 1000 for elapsed, _ in samples[page]]
+        summary[page] = {
+            'reruns': len(latencies),
+            **{f"p{pct}_ms": round(percentile(latencies, pct), 2) for pct in PERCENTILES},
+            'max_elements': max(elements[page]),
+            'peak_kib': round(max(peak for _, peak in samples[page]) / 1024, 1),
+        }
+    return summary
+
+
+def check_budget(summary, budget):
+    """List every page metric above its budget ({page: {metric: limit}})"""
+    violations = []
+    for page, limits in budget.items():
+        for metric, limit in limits.items():
+            value = summary.get(page, {}).get(metric)
+            if value is not None and value > limit:
+                violations.append(f"{page}.{metric} = {value} > budget {limit}")
+    return violations
+
+
+def budget_from(summary, headroom):
+    return {
+        page: {
+            'p95_ms': round(stats['p95_ms'] * headroom, 1),
+            'max_elements': math.ceil(stats['max_elements'] * headroom),
+            'peak_kib': round(stats['peak_kib'] * headroom, 1),
+        }
+        for page, stats in summary.items()
+    }
+
+
+def print_summary(summary, label):
+    print(f"\n{label}")
+    print(f"{'page':18}{'reruns':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'elements':>10}{'peak KiB':>10}")
+    for page, stats in summary.items():
+        print(f"{page:18}{stats['reruns']:>8}{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}"
+              f"{stats['p99_ms']:>10.1f}{stats['max_elements']:>10}{stats['peak_kib']:>10.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark reruns of every wizard page with AppTest")
+    parser.add_argument('--sessions', type=int, default=10, help='measured sessions per profile')
+    parser.add_argument('--warmup', type=int, default=1, help='unmeasured sessions per profile (fills caches)')
+    parser.add_argument('--profile', type=parse_profile, action='append',
+                        help='stage=<id>[,saas=<id>][,industry=<id>] (repeatable, default stage=3)')
+    parser.add_argument('--timeout', type=float, default=60, help='seconds allowed per rerun')
+    parser.add_argument('--no-memory', action='store_true', help='skip tracemalloc (faster, no peak memory)')
+    parser.add_argument('--budget', help='JSON budget {page: {p95_ms|max_elements|peak_kib: limit}}')
+    parser.add_argument('--save-budget', help='write the measured results (times --headroom) as a budget')
+    parser.add_argument('--headroom', type=float, default=1.5)
+    parser.add_argument('--json', help='also write the summary to this JSON file')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    profiles = args.profile or [parse_profile('stage=3')]
+    trace_memory = not args.no_memory
+    if trace_memory:
+        tracemalloc.start()
+
+    samples = defaultdict(list)
+    elements = defaultdict(list)
+    results = {}
+    for profile in profiles:
+        label = profile_label(profile)
+        for _ in range(args.warmup):
+            run_session(profile, defaultdict(list), defaultdict(list), trace_memory, args.timeout)
+        profile_samples = defaultdict(list)
+        profile_elements = defaultdict(list)
+        for _ in range(args.sessions):
+            run_session(profile, profile_samples, profile_elements, trace_memory, args.timeout)
+        results[label] = summarize(profile_samples, profile_elements)
+        print_summary(results[label], f"profile {label} ({args.sessions} sessions)")
+        for page in profile_samples:
+            samples[page].extend(profile_samples[page])
+            elements[page].extend(profile_elements[page])
+
+    overall = summarize(samples, elements)
+    if len(profiles) > 1:
+        print_summary(overall, "all profiles")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'overall': overall, 'profiles': results}, f, indent=2)
+    if args.save_budget:
+        with open(args.save_budget, 'w') as f:
+            json.dump(budget_from(overall, args.headroom), f, indent=2)
+            f.write("\n")
+        print(f"\nBudget written to {args.save_budget}")
+
+    if args.budget:
+        with open(args.budget) as f:
+            violations = check_budget(overall, json.load(f))
+        if violations:
+            print("\nRegression budget exceeded:")
+            for violation in violations:
+                print(f"  {violation}")
+            return 1
+        print("\nWithin regression budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
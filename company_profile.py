@@ -1,8 +1,7 @@
 import logging
 
 import streamlit as st
-from streamlit_extras.add_vertical_space import add_vertical_space
-from streamlit_extras.stylable_container import stylable_container
+from src.components.extras import add_vertical_space, stylable_container
 
 from constants import REQUIRED_SESSION_KEYS
 from src.db_queries.growth_stages import determine_company_stage
@@ -13,20 +12,25 @@ from src.db_queries.saas_types import get_saas_types
 logger = logging.getLogger(__name__)
 
 
+def option_index(options, value, restored):
+    """Selectbox index of a stored id (first option when nothing was stored)"""
+    return options.index(value) if restored and value in options else 0
+
+
 def main():
     # --- Initialize all required session keys ---
     for key in REQUIRED_SESSION_KEYS:
         if key not in st.session_state:
-            if key == 'metrics_cache':
-                st.session_state[key] = {}
-            else:
-                st.session_state[key] = None
+            st.session_state[key] = None
 
     st.session_state.current_page = "company_profile.py"
     st.session_state.page_history.append("company_profile.py")
     st.title("🏢 Company Profile")
     st.markdown("Please enter your company details to begin your diagnostics.")
 
+    # Once the profile was filled in (or restored from the URL token) the widgets start from it
+    restored = st.session_state.get('months_existed') is not None
+
     # --- Layout ---
     left_gutter, main_content, right_gutter = st.columns([0.05, 0.9, 0.05], gap="small")
     with main_content:
@@ -35,26 +39,29 @@ def main():
         # --- Column 1: SaaS Type and Orientation ---
         with col1:
             saas_types = get_saas_types()
-            saas_types_with_all = {None: {'type_name': 'All SaaS Types'}}
-            saas_types_with_all.update(saas_types)
+            saas_type_options = [None, *saas_types.keys()]
             selected_saas_type = st.selectbox(
                 "Select your SaaS company type:",
-                index=0,
-                options=list(saas_types_with_all.keys()),
-                format_func=lambda x: saas_types_with_all[x]['type_name'] if x is not None else 'All SaaS Types',
+                index=option_index(saas_type_options, st.session_state.get('saas_type_id'), restored),
+                options=saas_type_options,
+                format_func=lambda x: saas_types[x].type_name if x is not None else 'All SaaS Types',
                 key="selected_saas_type_key"
             )
-            st.session_state['selected_saas_type'] = saas_types_with_all[selected_saas_type]['type_name']
+            st.session_state['selected_saas_type'] = (saas_types[selected_saas_type].type_name
+                                                      if selected_saas_type is not None else 'All SaaS Types')
+            st.session_state['saas_type_id'] = selected_saas_type
 
             orientations = get_orientations()
+            orientation_options = list(orientations.keys())
             selected_orientation = st.selectbox(
                 "Is your company Horizontal or Vertical SaaS?",
-                index=0,
-                options=list(orientations.keys()),
-                format_func=lambda x: orientations[x]['orientation_name'],
+                index=option_index(orientation_options, st.session_state.get('orientation_id'), restored),
+                options=orientation_options,
+                format_func=lambda x: orientations[x].orientation_name,
                 key="selected_orientation_key"
             )
-            st.session_state['selected_orientation'] = orientations[selected_orientation]['orientation_name']
+            st.session_state['selected_orientation'] = orientations[selected_orientation].orientation_name
+            st.session_state['orientation_id'] = selected_orientation
 
         # --- Column 2: Industry, Age, Revenue ---
         with col2:
@@ -65,31 +72,38 @@ def main():
             if not industries:
                 st.error("No valid industries found for this combination. Please check your previous selections.")
                 st.session_state['selected_industry'] = None
+                st.session_state['industry_id'] = None
                 st.session_state['annual_revenue'] = None
                 st.session_state['growth_stage_id'] = None
                 return
 
-            industries_with_all = {None: {'industry_name': 'All Industries'}}
-            industries_with_all.update(industries)
+            industry_options = [None, *industries.keys()]
             selected_industry = st.selectbox(
                 "Select your primary industry/sector:",
-                index=0,
-                options=list(industries_with_all.keys()),
-                format_func=lambda x: industries_with_all[x]['industry_name'] if x is not None else 'All Industries',
+                index=option_index(industry_options, st.session_state.get('industry_id'), restored),
+                options=industry_options,
+                format_func=lambda x: industries[x].industry_name if x is not None else 'All Industries',
                 key="selected_industry_key"
             )
-            st.session_state['selected_industry'] = industries_with_all[selected_industry]['industry_name']
+            st.session_state['selected_industry'] = (industries[selected_industry].industry_name
+                                                     if selected_industry is not None else 'All Industries')
+            st.session_state['industry_id'] = selected_industry
 
             months_existed = st.number_input(
                 "How long has your company been in existence? (months)",
-                min_value=1, max_value=240, value=12, key="months_existed_key"
+                min_value=1, max_value=240, value=st.session_state['months_existed'] if restored else 12,
+                key="months_existed_key"
             )
+            st.session_state['months_existed'] = months_existed
 
             # --- Revenue input ---
+            stored_revenue = st.session_state.get('annual_revenue') or 0.0
             if months_existed < 24:
                 mrr = st.slider(
                     "**Monthly Recurring Revenue (MRR in \\$K)**",
-                    min_value=0.0, max_value=1000.0, value=83.33, step=20.83,
+                    min_value=0.0, max_value=1000.0,
+                    value=min(round(stored_revenue * 1000 / 12, 2), 1000.0) if restored else 83.33,
+                    step=20.83,
                     format="$%.2fK", key="mrr_key"
                 )
                 annual_revenue = (mrr * 12) / 1000  # in millions
@@ -98,7 +112,8 @@ def main():
             else:
                 annual_revenue = st.slider(
                     "**Annual Recurring Revenue (ARR in \\$M)**",
-                    min_value=0.0, max_value=12.0, value=1.5, step=0.25,
+                    min_value=0.0, max_value=12.0,
+                    value=min(stored_revenue, 12.0) if restored else 1.5, step=0.25,
                     format="$%.2fM", key="arr_key"
                 )
                 add_vertical_space(3)
@@ -6,6 +6,5 @@ REQUIRED_SESSION_KEYS = [
     'selected_orientation',
     'selected_industry',
     'annual_revenue',
-    'growth_stage_id',
-    'metrics_cache'
+    'growth_stage_id'
 ]
@@ -5,6 +5,7 @@ import streamlit as st
 from constants import REQUIRED_SESSION_KEYS
 from src.components.cta_toast import show_sequential_cta_toasts
 from src.components.report import generate_report
+from src.db_queries.assessment_store import record_assessment
 
 
 def main():
@@ -37,6 +38,9 @@ def main():
             st.session_state.page_history.append(st.session_state.current_page)
             generate_report(st.session_state)
 
+        # Persist the finished assessment; the write happens on the background writer
+        record_assessment(st.session_state)
+
     except Exception as e:
         st.error(f"Report generation failed: {str(e)}")
         st.stop()
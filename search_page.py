@@ -0,0 +1,49 @@
+import streamlit as st
+
+from src.db_queries.architecture_pillars import get_architecture_pillars
+from src.db_queries.search import search
+
+# Pillar id -> page that shows its metrics
+PILLAR_PAGES = {
+    1: "revenue_metrics.py",
+    2: "product_metrics.py",
+    3: "system_metrics.py",
+    4: "people_metrics.py",
+}
+
+
+def main():
+    """Search metrics and recommendations without walking the wizard"""
+    st.title("🔎 Search")
+    st.markdown("Search metric names, descriptions and recommendations.")
+
+    query = st.text_input(
+        "Search",
+        key="search_query",
+        placeholder="e.g. churn, onboarding, CAC",
+        label_visibility="collapsed"
+    )
+    if not query.strip():
+        return
+
+    results = search(query)
+    if not results:
+        st.info(f"No matches for “{query}”.")
+        return
+
+    pillars = get_architecture_pillars()
+    for result in results:
+        with st.container(border=True):
+            kind = "Recommendation" if result.kind == 'recommendation' else "Metric"
+            st.markdown(f"**{result.metric_name}** · _{kind}_")
+            st.markdown(result.snippet.replace("$", "\\$"))
+
+            pillar = pillars.get(result.pillar_id)
+            if pillar and result.pillar_id in PILLAR_PAGES:
+                st.page_link(PILLAR_PAGES[result.pillar_id],
+                             label=f"{pillar.pillar_name} Metrics",
+                             icon=pillar.display_icon)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,44 @@
-import time
+import json
 
 import streamlit as st
+import streamlit.components.v1 as components
+
+from src.utils.assets import get_asset
+
+# (message, icon, delay before showing in ms); each toast stays up for TOAST_DURATION_MS
+CTA_TOASTS = [
+    ("While your report is being generated, you can book a **FREE** strategy call to walk through your results and get a clear, **PERSONALIZED** plan.",
+     "✨", 0),
+    ("Click the **✅ Expert Analysis of Your Metrics - Book Your FREE Call** button in the top toolbar.",
+     "👆", 500),
+    ("30 minutes, no pressure - just clarity.",
+     "👍", 1500),
+]
+TOAST_DURATION_MS = 4000
+
+
+@st.cache_resource
+def load_toast_script():
+    """Sequencer script plus the CTA sequence, built once per process"""
+    sequencer = get_asset('toasts').content
+    toasts = [
+        {"body": body, "icon": icon, "delay": delay, "duration": TOAST_DURATION_MS}
+        for body, icon, delay in CTA_TOASTS
+    ]
+    # Runs inside the component iframe and hands the sequencer to the app document,
+    # so the timers survive the iframe being removed on the next rerun.
+    payload = json.dumps(f"{sequencer}\nataShowToasts({json.dumps(toasts)});").replace("</", "<\\/")
+    return f"""<script>
+const doc = window.parent.document;
+const script = doc.createElement('script');
+script.textContent = {payload};
+doc.body.appendChild(script);
+</script>"""
 
 
 def show_sequential_cta_toasts():
-    # First toast - Explanation
-    st.toast(
-        "While your report is being generated, you can book a **FREE** strategy call to walk through your results and get a clear, **PERSONALIZED** plan.",
-        icon="✨"
-    )
-
-    # Add a small delay between toasts
-    time.sleep(.5)
-
-    # Second toast - Direct to toolbar
-    st.toast(
-        "Click the **✅ Expert Analysis of Your Metrics - Book Your FREE Call** button in the top toolbar.",
-        icon="👆"
-    )
-
-    # Add another small delay
-    time.sleep(1)
-
-    # Third toast - Reassurance
-    st.toast(
-        "30 minutes, no pressure - just clarity.",
-        icon="👍"
-    )
-
-    # Add another small delay
-    time.sleep(1)  # Allow final toast to display
+    """Send the CTA toast sequence to the browser once per session; returns immediately"""
+    if st.session_state.get('cta_toasts_shown'):
+        return
+    st.session_state['cta_toasts_shown'] = True
+    components.html(load_toast_script(), height=0)
@@ -0,0 +1,12 @@
+# Lazy wrappers around streamlit_extras: the package is imported on first use,
+# not when a page module is loaded
+
+
+def stylable_container(key, css_styles):
+    from streamlit_extras.stylable_container import stylable_container as _stylable_container
+    return _stylable_container(key=key, css_styles=css_styles)
+
+
+def add_vertical_space(num_lines=1):
+    from streamlit_extras.add_vertical_space import add_vertical_space as _add_vertical_space
+    return _add_vertical_space(num_lines)
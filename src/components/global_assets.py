@@ -1,22 +1,94 @@
-# Load CSS Dynamically
+# Load CSS/JS from the asset pipeline
+import json
+import re
+
 import streamlit as st
 import streamlit.components.v1 as components
 
+from src.utils.assets import ASSET_BASE_URL, get_asset
+
+# Set once a run carrying the inline installer has completed for the session
+INSTALLED_KEY = 'global_assets_installed'
+# Rendered width of the logo when its intrinsic size is unknown (as for an <img> of the SVG)
+LOGO_WIDTH_PX = 300
+
 
 @st.cache_resource
-def load_css(file_path):
-    with open(file_path) as f:
-        st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+def css_markup(name):
+    """Stylesheet <link> to the hashed file, built once"""
+    return f'<link rel="stylesheet" href="{get_asset(name).url}">'
 
 
 @st.cache_resource
-def load_js(file_path):
-    with open(file_path) as f:
-        js_code = f.read()
-        components.html(f"<script>{js_code}</script>", height=0)
+def js_markup(name):
+    return f'<script src="{get_asset(name).url}"></script>'
+
+
+def logo_markup():
+    """Company logo: the hashed file in link mode, else a box painted by the inline stylesheet"""
+    if ASSET_BASE_URL:
+        return f'<img src="{get_asset("logo").url}"/>'
+    return '<div class="ata-logo" role="img" aria-label="Minimalist Innovation"></div>'
+
+
+def logo_css():
+    """Rule drawing the logo from a data URI, sized by the SVG's viewBox"""
+    logo = get_asset('logo')
+    view_box = re.search(r'viewBox="[\d.]+ [\d.]+ ([\d.]+) ([\d.]+)"', logo.content)
+    ratio = f"{view_box.group(1)} / {view_box.group(2)}" if view_box else "auto"
+    return (f'.ata-logo{{width:{LOGO_WIDTH_PX}px;max-width:100%;aspect-ratio:{ratio};'
+            f'background:url("{logo.data_uri}") center/contain no-repeat}}')
+
+
+@st.cache_resource
+def install_markup():
+    """Installer for the inline assets, built once per process.
+
+    Runs inside the component iframe and adds the stylesheet (logo included) and
+    the script to the app document, where they outlive the iframe being removed on
+    the next rerun; a stylesheet from another build is replaced.
+    """
+    styles = get_asset('styles')
+    script = get_asset('script')
+    digest = f"{styles.digest}{script.digest}{get_asset('logo').digest}"
+    css = json.dumps(f"{styles.content}{logo_css()}").replace("</", "<\\/")
+    js = json.dumps(script.content).replace("</", "<\\/")
+    return f"""<script>
+const doc = window.parent.document;
+let style = doc.getElementById('ata-styles');
+if (!style || style.dataset.digest !== '{digest}') {{
+    if (!style) {{
+        style = doc.createElement('style');
+        style.id = 'ata-styles';
+        doc.head.appendChild(style);
+    }}
+    style.dataset.digest = '{digest}';
+    style.textContent = {css};
+    const script = doc.createElement('script');
+    script.textContent = {js};
+    doc.body.appendChild(script);
+}}
+</script>"""
+
+
+def load_css(name):
+    # Emitted on every run: elements a run does not emit are removed from the page
+    st.markdown(css_markup(name), unsafe_allow_html=True)
+
+
+def load_js(name):
+    components.html(js_markup(name), height=0)
 
 
 def load_global_assets():
-    # Load all the assets
-    load_css("src/static/styles.css")
-    load_js("src/static/script.js")
+    """Link the hashed files on every run, or send the inline assets until a run delivers them"""
+    if ASSET_BASE_URL:
+        load_css("styles")
+        load_js("script")
+    elif not st.session_state.get(INSTALLED_KEY):
+        components.html(install_markup(), height=0)
+
+
+def confirm_global_assets():
+    """Call at the end of a completed run: the inline installer has reached the browser"""
+    st.session_state[INSTALLED_KEY] = True
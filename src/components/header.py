@@ -1,8 +1,7 @@
-import base64
-import os
-
 import streamlit as st
 
+from src.components.global_assets import logo_markup
+
 
 def add_toolbar():
     # Create a placeholder for the toolbar
@@ -33,9 +32,6 @@ def add_logo(primary_color):
         # Create a container with two columns - these will only be visible on desktop
         col1, col2 = st.columns([3, 1])
 
-        # Get the absolute path to the logo
-        logo_path = os.path.join("media", "Minimalist_Horizontal_Blue.svg")
-
         # Desktop view - both columns
         with col1:
             # Left side: App logo (will be hidden on mobile via CSS)
@@ -54,19 +50,14 @@ def add_logo(primary_color):
             st.markdown(app_logo_html, unsafe_allow_html=True)
 
         with col2:
-            # Right side: Display company logo if exists (will be hidden on mobile via CSS)
-            if os.path.exists(logo_path):
-                with open(logo_path, "r") as f:
-                    svg = f.read()
-                    b64 = base64.b64encode(svg.encode('utf-8')).decode("utf-8")
-                    html = f"""
-                        <div class="desktop-only-logo">
-                            <img src="data:image/svg+xml;base64,{b64}"/>
-                        </div>
-                        """
-                    st.markdown(html, unsafe_allow_html=True)
-            else:
-                st.write("")  # Empty space if logo doesn't exist
+            # Right side: company logo (will be hidden on mobile via CSS); inline, the
+            # image itself arrives once per session with the stylesheet
+            html = f"""
+                <div class="desktop-only-logo">
+                    {logo_markup()}
+                </div>
+                """
+            st.markdown(html, unsafe_allow_html=True)
 
         # Mobile view - separate from columns, controlled by CSS media query
         # This will only be shown on mobile screens
@@ -1,69 +1,153 @@
 import logging
-from decimal import Decimal
+import os
 
 import streamlit as st
 
-from src.db_queries.architecture_pillars import get_architecture_pillars
+from src.db_queries.catalog import get_catalog
 from src.db_queries.metrics import get_metrics
+from src.diagnostics.answers import ANSWERS_KEY, get_session_answers
+from src.diagnostics.session_token import save_session
 
 logger = logging.getLogger(__name__)
 
+# "lazy" sends a thumbnail and loads the player when asked; "eager" embeds every video up front
+MEDIA_MODE = os.environ.get('ATA_MEDIA_MODE', 'lazy').lower()
+VIDEO_THUMBNAIL_WIDTH = 160
+# "live" commits each slider as it moves (one fragment rerun per change); "form" batches a
+# pillar's sliders into one st.form whose submit commits them all in a single rerun
+INPUT_MODE = os.environ.get('ATA_PILLAR_INPUT_MODE', 'live').lower()
 
-def get_step_size_for_slider(units):
-    """Determine the appropriate step size based on the metric units"""
-    if "Months" in units:
-        return 1.0
-    elif "Days" in units:
-        return 5.0
-    elif "Hours" in units:
-        return 1.0
-    elif "Milliseconds" in units:
-        return 100.00
-    elif "Currency" in units:
-        return 1000.00
-    elif "Percentage" in units:
-        return 0.3
-    else:
-        return 0.5
-
-
-def get_slider_format(units):
-    """Determine the appropriate slider format based on the metric units"""
-    if "Months" in units:
-        return "%d"
-    elif "Days" in units:
-        return "%d days"
-    elif "Hours" in units:
-        return "%d hours"
-    elif "Milliseconds" in units:
-        return "%d ms"
-    elif "Currency" in units:
-        return "$%.2f"
-    elif "Percentage" in units:
-        return "%.1f%%"
-    else:
-        return "%.2f"
 
+def update_metric(metric_id, widget_key):
+    get_session_answers(st.session_state).set(metric_id, st.session_state[widget_key])
+    st.session_state['answers_changed'] = True
+    # Fragment reruns do not reach the end of app.py, so update the URL token here
+    save_session(st.session_state, st.query_params)
 
-def create_slider(metric, pillar_name, step_size, default_value, slider_format):
-    slider_key = f"slider_{pillar_name}_{metric['id']}"
 
-    return st.slider(
-        label=f"{metric['metric_name']} ({metric['units']})",
-        min_value=Decimal(float(metric['min_value'])),
-        max_value=Decimal(float(metric['max_value'])),
-        value=Decimal(float(st.session_state.get(slider_key, default_value))),
-        step=Decimal(float(step_size)),
-        format=slider_format,
-        key=slider_key
-    )
+def commit_answers(widget_keys):
+    """Write every slider of a submitted form into a new answer vector and swap it in at once"""
+    answers = get_session_answers(st.session_state).copy()
+    for metric_id, widget_key in widget_keys:
+        answers.set(metric_id, st.session_state[widget_key])
+    st.session_state[ANSWERS_KEY] = answers
+    save_session(st.session_state, st.query_params)
 
 
-def update_metric(key):
-    st.session_state[key] = st.session_state[f"widget_{key}"]
+def video_guide(metric_id, metric, batched=False):
+    """Video of a metric: a thumbnail and button until opened, then the embedded player.
 
+    Forms cannot hold buttons, so a ``batched`` card links to the video instead.
+    """
+    video = get_catalog().video_embeds.get(metric_id)
+    if video is None:
+        return
+    help_text = f"Watch a short video about {metric['metric_name']}"
+    if batched:
+        if video.thumbnail_url:
+            st.image(video.thumbnail_url, width=VIDEO_THUMBNAIL_WIDTH)
+        st.markdown(f"[📹 Video Guide]({metric['video_link']})", help=help_text)
+        return
+    if MEDIA_MODE == 'eager':
+        with st.popover("📹 Video Guide", help=help_text):
+            st.video(video.embed_url)
+        return
 
-def display_metrics_for_pillar(architecture_pillar_id, growth_stage_id, saas_type_id=None, industry_id=None):
+    open_key = f"video_open_{metric_id}"
+    if st.session_state.get(open_key):
+        st.video(video.embed_url, autoplay=True)
+        st.button("Hide video", key=f"video_hide_{metric_id}",
+                  on_click=st.session_state.__setitem__, args=(open_key, False))
+    else:
+        if video.thumbnail_url:
+            st.image(video.thumbnail_url, width=VIDEO_THUMBNAIL_WIDTH)
+        st.button("📹 Video Guide", key=f"video_show_{metric_id}", help=help_text,
+                  on_click=st.session_state.__setitem__, args=(open_key, True))
+
+
+@st.fragment
+def metric_card(architecture_pillar_id, metric_id, metric, on_answer=None):
+    """One metric card; moving its slider reruns only this fragment.
+
+    ``on_answer`` is called after an answer changed so the page can refresh
+    anything derived from all answers (e.g. the live score placeholder).
+    """
+    render_metric_card(architecture_pillar_id, metric_id, metric)
+
+    if on_answer is not None and st.session_state.pop('answers_changed', False):
+        on_answer()
+
+
+def render_metric_card(architecture_pillar_id, metric_id, metric, batched=False):
+    """Description, video and slider of one metric; returns the slider's widget key.
+
+    A ``batched`` card sits inside a form, so its slider commits nothing on change.
+    """
+    # Create a container for the metric with border
+    with st.container(border=True):
+        # Metric header
+        st.markdown(f"## {metric['metric_name']}")
+
+        # Create two columns for each metric
+        desc_col, slider_col = st.columns([0.55, 0.45])
+
+        with desc_col:
+            # Description with read more
+            if metric['blog_link']:
+                st.markdown(f"{metric['description']} _[Learn more]({metric['blog_link']}).._")
+            else:
+                st.markdown(metric['description'])
+
+            # Video guide; the player only loads on request (see MEDIA_MODE)
+            if metric['video_link']:
+                video_guide(metric_id, metric, batched)
+
+        with slider_col:
+            # Add slight top padding for better alignment with description
+            st.markdown("<div style='margin-top: 10px;'></div>", unsafe_allow_html=True)
+
+            # Target range for slider
+            # Add null check before float conversion
+            target_low = float(metric.get('lo_range_value', 0.0))
+            target_high = float(metric.get('hi_range_value', target_low + 100.0))  # Default 100-unit range
+            target_range = f"**_{target_low}-{target_high} {metric['units']}_**"
+            default_value = (target_low + target_high) / 2
+
+            # Only the answer is kept per session; everything descriptive comes from the catalog
+            answers = get_session_answers(st.session_state)
+            if metric_id not in answers:
+                answers.set(metric_id, default_value)
+            widget_key = f"widget_metric_{architecture_pillar_id}_{metric_id}"
+
+            # Slider configuration
+            unit_format = get_catalog().unit_format(metric['units'])
+            slider_format = unit_format.slider_format
+            min_val = float(metric['min_value'])
+            max_val = float(metric['max_value'])
+            step_size = unit_format.step
+            callback = {} if batched else {'on_change': update_metric, 'args': (metric_id, widget_key)}
+
+            st.slider(
+                label=f"The target range is [{target_range}]. What is your value:",
+                key=widget_key,
+                min_value=min_val,
+                max_value=max_val,
+                value=answers.get(metric_id),
+                step=step_size,
+                format=slider_format,
+                **callback
+            )
+
+    return widget_key
+
+
+def display_metrics_for_pillar(architecture_pillar_id, growth_stage_id, saas_type_id=None, industry_id=None,
+                               on_answer=None, batched=False):
+    """Render a pillar's metric cards; returns (metric id, widget key) of every batched slider.
+
+    With ``batched`` the cards are plain (call this inside an ``st.form``) and the
+    answers are committed by ``commit_answers`` when the form is submitted.
+    """
     # Get metrics dictionary with ID keys
     metrics_dict = get_metrics(
         growth_stage_id=growth_stage_id,
@@ -74,85 +158,17 @@ def display_metrics_for_pillar(architecture_pillar_id, growth_stage_id, saas_typ
 
     if not metrics_dict:
         st.write(f"No metrics found for this combination.")
-        return
-
-    # Get pillar name for display purposes
-    pillar_name = (get_architecture_pillars()
-                   .get(architecture_pillar_id, {})
-                   .get('pillar_name',
-                        f"Pillar {architecture_pillar_id}"))
+        return []
 
     # Display each metric using dictionary values
+    widget_keys = []
     for metric_id, metric in metrics_dict.items():
-
-        # Create a container for the metric with border
-        with st.container(border=True):
-            # Metric header
-            st.markdown(f"## {metric['metric_name']}")
-
-            # Create two columns for each metric
-            desc_col, slider_col = st.columns([0.55, 0.45])
-
-            with desc_col:
-                # Description with read more
-                if metric['blog_link']:
-                    st.markdown(f"{metric['description']} _[Learn more]({metric['blog_link']}).._")
-                else:
-                    st.markdown(metric['description'])
-
-                # Video hover functionality
-                if metric['video_link']:
-                    video_url = metric['video_link'].replace('watch?v=', 'embed/')
-                    with st.popover("📹 Video Guide", help=f"Watch a short video about {metric['metric_name']}"):
-                        st.video(video_url)
-
-            with slider_col:
-                # Add slight top padding for better alignment with description
-                st.markdown("<div style='margin-top: 10px;'></div>", unsafe_allow_html=True)
-
-                # Target range for slider
-                # Add null check before float conversion
-                target_low = float(metric.get('lo_range_value', 0.0))
-                target_high = float(metric.get('hi_range_value', target_low + 100.0))  # Default 100-unit range
-                target_range = f"**_{target_low}-{target_high} {metric['units']}_**"
-                default_value = (target_low + target_high) / 2
-
-                persistent_key = f"metric_{architecture_pillar_id}_{metric_id}"
-                if persistent_key not in st.session_state:
-                    st.session_state[persistent_key] = default_value
-
-                # Slider configuration
-                slider_format = get_slider_format(metric['units'])
-                min_val = float(metric['min_value'])
-                max_val = float(metric['max_value'])
-                step_size = get_step_size_for_slider(metric['units'])
-
-                st.slider(
-                    label=f"The target range is [{target_range}]. What is your value:",
-                    key=f"widget_{persistent_key}",
-                    min_value=min_val,
-                    max_value=max_val,
-                    value=st.session_state[persistent_key],
-                    step=step_size,
-                    format=slider_format,
-                    on_change=lambda k=persistent_key: update_metric(k)
-                )
-
-                # Store metrics info in the session_state
-                metric_info = {
-                    "persistent_key": persistent_key,
-                    "pillar_id": architecture_pillar_id,
-                    "pillar_name": pillar_name,
-                    "metric_id": metric_id,
-                    "unit": metric['units'],
-                    "target_low_range": float(metric['lo_range_value']),
-                    "target_high_range": float(metric['hi_range_value']),
-                    "slider_format": slider_format,
-                    "blog_link": metric['blog_link'],
-                    "video_link": metric['video_link'],
-                }
-                # Store the target range separately in session_state
-                st.session_state['metrics_cache'][metric['metric_name']] = metric_info
+        if batched:
+            widget_keys.append((metric_id, render_metric_card(architecture_pillar_id, metric_id, metric, batched)))
+        else:
+            metric_card(architecture_pillar_id, metric_id, metric, on_answer)
 
         # Add space between metrics
         st.markdown("<div style='margin-bottom: 20px;'></div>", unsafe_allow_html=True)
+
+    return widget_keys
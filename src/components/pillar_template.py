@@ -1,13 +1,34 @@
 import logging
+import math
 
 import streamlit as st
-from streamlit_extras.stylable_container import stylable_container
+from src.components.extras import stylable_container
 
-from src.components.metrics import display_metrics_for_pillar
+from src.components.metrics import INPUT_MODE, commit_answers, display_metrics_for_pillar
 from src.db_queries.architecture_pillars import get_architecture_pillars
+from src.diagnostics.scoring import compute_ata_score
 
 logger = logging.getLogger(__name__)
 
+PAGE_ORDER = {
+    0: "company_profile.py",
+    1: "revenue_metrics.py",
+    2: "product_metrics.py",
+    3: "system_metrics.py",
+    4: "people_metrics.py",
+    5: "report_page.py"
+}
+
+
+def continue_to_next_page(pillar_id: int):
+    """Mark the pillar complete and switch to the page after it"""
+    next_page = PAGE_ORDER.get(pillar_id + 1)
+    # Update history before switching
+    st.session_state.page_history.append(next_page)
+    st.session_state.current_page = next_page
+    st.session_state[f"pillar_{pillar_id}_complete"] = True
+    st.switch_page(next_page)
+
 
 def pillar_page_template(pillar_id: int):
     """Reusable template for all pillar pages"""
@@ -32,33 +53,67 @@ def pillar_page_template(pillar_id: int):
             return
 
         # Page header
-        st.title(f"{pillar_data['display_icon']} {pillar_data['pillar_name']} Metrics")
-        st.caption(pillar_data['description'])
+        st.title(f"{pillar_data.display_icon} {pillar_data.pillar_name} Metrics")
+        st.caption(pillar_data.description)
+
+        # Live score, recomputed from the precomputed range vectors on every slider change.
+        # Metric cards rerun as fragments, so they refresh it through the placeholder.
+        score_slot = st.empty()
+
+        def refresh_score():
+            score = compute_ata_score(st.session_state)
+            if not math.isnan(score.overall):
+                score_slot.caption(f"ATA Score so far: **{score.overall:.0f}/100**")
+
+        refresh_score()
 
         # Display metrics
+        if INPUT_MODE == 'form':
+            pillar_form(pillar_id)
+            pillar_navigation(pillar_id, show_continue=False)
+            return
+
         display_metrics_for_pillar(
             architecture_pillar_id=pillar_id,
             growth_stage_id=st.session_state['growth_stage_id'],
-            saas_type_id=st.session_state.get('selected_saas_type'),
-            industry_id=st.session_state.get('selected_industry')
+            saas_type_id=st.session_state.get('saas_type_id'),
+            industry_id=st.session_state.get('industry_id'),
+            on_answer=refresh_score
         )
 
-        next_page = {
-            0: "company_profile.py",
-            1: "revenue_metrics.py",
-            2: "product_metrics.py",
-            3: "system_metrics.py",
-            4: "people_metrics.py",
-            5: "report_page.py"
-        }.get(pillar_id + 1)
-        previous_page = {
-            0: "company_profile.py",
-            1: "revenue_metrics.py",
-            2: "product_metrics.py",
-            3: "system_metrics.py",
-            4: "people_metrics.py",
-            5: "report_page.py"
-        }.get(pillar_id - 1)
+        pillar_navigation(pillar_id)
+
+    except Exception as e:
+        logger.error(f"Pillar page error: {str(e)}")
+        st.error("Error loading pillar metrics")
+
+
+def pillar_form(pillar_id: int):
+    """All of a pillar's sliders in one form: moving them costs no rerun, submitting commits them together"""
+    with st.form(f"pillar_{pillar_id}_form", border=False):
+        widget_keys = display_metrics_for_pillar(
+            architecture_pillar_id=pillar_id,
+            growth_stage_id=st.session_state['growth_stage_id'],
+            saas_type_id=st.session_state.get('saas_type_id'),
+            industry_id=st.session_state.get('industry_id'),
+            batched=True
+        )
+        save_col, _, continue_col = st.columns([2, 1, 2])
+        with save_col:
+            st.form_submit_button("Save answers", on_click=commit_answers, args=(widget_keys,))
+        with continue_col:
+            continue_clicked = st.form_submit_button("Save & Continue ▶︎", on_click=commit_answers,
+                                                     args=(widget_keys,))
+    if continue_clicked:
+        continue_to_next_page(pillar_id)
+
+
+@st.fragment
+def pillar_navigation(pillar_id: int, show_continue: bool = True):
+    """Back/Continue block; its reruns do not re-execute the metric cards"""
+    try:
+        next_page = PAGE_ORDER.get(pillar_id + 1)
+        previous_page = PAGE_ORDER.get(pillar_id - 1)
 
         col1, spacer, col3 = st.columns([2, 1, 2])
         with col1:
@@ -135,6 +190,9 @@ def pillar_page_template(pillar_id: int):
         with spacer:
             pass
 
+        if not show_continue:
+            return
+
         with col3:
             with stylable_container(
                     key="continue_group_container",
@@ -198,14 +256,9 @@ def pillar_page_template(pillar_id: int):
                 if st.button("Continue ▶︎",
                              type="secondary",
                              key=f"pillar_{pillar_id}_continue"):
-                    # Update history before switching
-                    st.session_state.page_history.append(next_page)
-                    st.session_state.current_page = next_page
-                    st.session_state[f"pillar_{pillar_id}_complete"] = True
-                    st.switch_page(next_page)
+                    continue_to_next_page(pillar_id)
                 st.markdown("</div>", unsafe_allow_html=True)
 
-
     except Exception as e:
-        logger.error(f"Pillar page error: {str(e)}")
-        st.error("Error loading pillar metrics")
+        logger.error(f"Pillar navigation error: {str(e)}")
+        st.error("Error loading page navigation")
@@ -1,167 +1,251 @@
+import io
 import logging
+import math
 from datetime import datetime
 
-import pandas as pd
 import streamlit as st
 
-from src.db_queries.recommendations import get_recommendations_for_metric
+from src.diagnostics.report_export import EXPORT_FORMATS, export_file_name, find_export, stamp_export, submit_export
+from src.diagnostics.priorities import top_k
+from src.diagnostics.report_model import get_report_model
+from src.utils.telemetry import track_report
 
 logger = logging.getLogger(__name__)
 
+# Seconds between checks of exports that are still being prepared
+EXPORT_POLL_SECONDS = 1
+# Further out-of-range metrics rendered per "show more" click
+MORE_PAGE_SIZE = 5
+
 
 # Report Generation Helpers
-def format_value_with_unit(value, unit):
-    """Format a value based on its unit type, similar to get_slider_format"""
+def metrics_table(rows):
+    """Markdown table of a pillar's metrics: name, current value and target range"""
+    def cell(text):
+        return str(text).replace("|", "\\|")
+
+    lines = ["| Metric | Current | Target Range |", "| :--- | :--- | :--- |"]
+    lines.extend(
+        f"| {cell(row.metric_name)} | {cell(row.value_text)} | {cell(f'{row.target_low} - {row.target_high} {row.unit}')} |"
+        for row in rows
+    )
+    return "\n".join(lines)
+
+
+def render_ata_score(model):
+    """ATA Score headline and pillar x metric-type bottleneck heatmap"""
+    import altair as alt
+
+    if math.isnan(model.overall_score):
+        return
+
+    st.header("🧭 ATA Score")
+    cols = st.columns(len(model.pillar_scores) + 1)
+    cols[0].metric("Overall", f"{model.overall_score:.0f}/100")
+    for col, (pillar_name, pillar_score) in zip(cols[1:], model.pillar_scores):
+        col.metric(pillar_name, f"{pillar_score:.0f}")
+
+    cells = [
+        {'Pillar': cell.pillar_name, 'Metric Type': cell.metric_type_name, 'Score': cell.score}
+        for cell in model.score_cells
+    ]
+    base = alt.Chart(alt.Data(values=cells)).encode(
+        x=alt.X('Metric Type:N', title=None),
+        y=alt.Y('Pillar:N', title=None, sort=[pillar_name for pillar_name, _ in model.pillar_scores]),
+    )
+    heatmap = base.mark_rect().encode(
+        color=alt.Color('Score:Q', scale=alt.Scale(domain=[0, 100], scheme='redyellowgreen'), legend=None),
+        tooltip=['Pillar:N', 'Metric Type:N', 'Score:Q'],
+    )
+    labels = base.mark_text(fontWeight='bold').encode(text='Score:Q')
+    st.subheader("🔥 Bottleneck Heatmap")
+    st.altair_chart(heatmap + labels, use_container_width=True)
+    st.markdown("---")
+
+
+def render_metric_card(priority, rank):
+    """Current value, target and recommendations of one out-of-range metric"""
+    row = priority.row
+    with st.container(border=True):
+        cols = st.columns([1, 3])
+
+        # Current vs Target
+        with cols[0]:
+            st.subheader(f"🚨 {rank}. {row.metric_name}")
+            st.metric("Current", row.value_text)
+            st.metric("Target Range", f"{row.target_low}-{row.target_high}{row.unit}")
+            st.caption(f"Severity {priority.severity:.2f}")
+
+        # Recommendations
+        with cols[1]:
+            if row.recommendations:
+                st.markdown("#### 🛠 Recommended Actions")
+                st.markdown("\n".join(f"- {rec}" for rec in row.recommendations))
+            else:
+                st.info("No specific recommendations available. Review general best practices.")
+
+            # Resource links
+            if row.blog_link or row.video_link:
+                st.markdown("#### 📚 Resources")
+                res_cols = st.columns(2)
+                if row.blog_link:
+                    res_cols[0].page_link(
+                        row.blog_link,
+                        label="Detailed Guide",
+                        icon="📖"
+                    )
+                if row.video_link:
+                    res_cols[1].page_link(
+                        row.video_link,
+                        label="Video Explanation",
+                        icon="🎥"
+                    )
+
+
+@st.fragment
+def render_more_priorities(fingerprint, remaining, first_rank):
+    """Further misses in severity order, a page at a time; paging only reruns this fragment"""
+    shown = st.session_state.get('priorities_shown')
+    count = shown[1] if shown and shown[0] == fingerprint else 0
+
+    if count:
+        ranked = top_k([(priority.severity, priority) for priority in remaining], count)
+        for rank, (_, priority) in enumerate(ranked, start=first_rank):
+            render_metric_card(priority, rank)
+
+    left = len(remaining) - count
+    if left > 0:
+        st.button(
+            f"Show {min(MORE_PAGE_SIZE, left)} more of {left} remaining",
+            key="priorities_more",
+            on_click=st.session_state.__setitem__,
+            args=('priorities_shown', (fingerprint, count + MORE_PAGE_SIZE)),
+        )
+
+
+def render_priorities(model):
+    """Most severe misses first; the rest stay unrendered until asked for"""
+    priorities = model.priorities
+    if not priorities.metrics:
+        st.success("Every metric is within its target range.")
+        return
+    st.header("🎯 Top Priorities")
+    for rank, priority in enumerate(priorities.metrics, start=1):
+        render_metric_card(priority, rank)
+    if priorities.remaining:
+        render_more_priorities(model.fingerprint, priorities.remaining, len(priorities.metrics) + 1)
+    st.markdown("---")
+
+
+def render_export_status(model, fmt, polling):
+    """Progress, download or retry of one requested format; never waits for the export"""
+    label, mime = EXPORT_FORMATS[fmt]
+    future = find_export(model, fmt)
+    if not future.done():
+        st.button(f"Preparing {label}…", key=f"export_prepare_{fmt}", disabled=True, use_container_width=True)
+        if not polling:
+            # Only a retry gets here: this fragment was registered without a timer, so let a full run add one
+            st.rerun()
+        return
+
     try:
-        value = float(value)
-        if "Percentage" in unit:
-            return f"{value:.1f}%"
-        elif "Currency" in unit:
-            return f"${value:.2f}"
-        elif "Months" in unit:
-            return f"{int(value)} months"
-        elif "Days" in unit:
-            return f"{int(value)} days"
-        elif "Hours" in unit:
-            return f"{int(value)} hours"
-        elif "Milliseconds" in unit:
-            return f"{int(value)} ms"
-        else:
-            return f"{value:.1f}"
-    except (ValueError, TypeError):
-        return str(value)
+        data = io.BytesIO(stamp_export(future.result()))
+    except Exception as e:
+        logger.error(f"{label} export failed for report {model.fingerprint[:8]}: {e}")
+        st.warning(f"{label} export unavailable")
+        st.button("Retry", key=f"export_retry_{fmt}", on_click=submit_export, args=(model, fmt))
+        return
+    st.download_button(
+        f"Download {label}",
+        data=data,
+        file_name=export_file_name(model, fmt),
+        mime=mime,
+        key=f"export_{fmt}",
+        on_click="ignore",
+        use_container_width=True
+    )
+
+
+@st.fragment
+def render_export(model):
+    """Each format is exported off the script thread when first asked for.
+
+    A Prepare click reruns this fragment; every requested format then gets its own
+    fragment, polled while its export is pending, so a finished export redraws only
+    its column. The browser keeps polling until the next full run, at the cost of one
+    button per tick.
+    """
+    st.header("📥 Export Report")
+    cols = st.columns(len(EXPORT_FORMATS))
+    for col, fmt in zip(cols, EXPORT_FORMATS):
+        with col:
+            future = find_export(model, fmt)
+            if future is None:
+                st.button(f"Prepare {EXPORT_FORMATS[fmt][0]}", key=f"export_prepare_{fmt}", on_click=submit_export,
+                          args=(model, fmt), use_container_width=True)
+                continue
+            polling = not future.done()
+            st.fragment(render_export_status, run_every=EXPORT_POLL_SECONDS if polling else None)(model, fmt, polling)
 
 
 def generate_report(session_state):
     """Render report using Streamlit components"""
     try:
-        # ----- Report Header -----
-        st.title("🧬 SaaS Traction Diagnostic Report")
-        st.markdown(f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}*")
-        st.markdown("---")
-
-        # ----- Company Overview -----
-        st.header("🏢 Company Profile")
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("Annual Revenue", f"${session_state['annual_revenue']}M")
-            st.metric("Growth Stage", session_state['growth_stage_name'])
-        with col2:
-            st.metric("Business Model",
-                      f"{session_state['selected_saas_type']} ({session_state['selected_orientation']})")
-            st.metric("Industry", session_state['selected_industry'])
-        st.markdown("---")
-
-        # ----- Metrics Analysis -----
-        st.header("📈 Metrics Diagnosis")
-
-        # Group metrics by pillar
-        pillars = {}
-        for metric_name, metric_data in session_state['metrics_cache'].items():
-            pillar_name = metric_data['pillar_name']
-            pillars.setdefault(pillar_name, []).append(metric_name)
-
-        # Display metrics by pillar
-        for pillar_name, metric_names in pillars.items():
-            with st.expander(f"### {pillar_name} Metrics", expanded=True):
-                # Build and display metrics table
-                metrics_data = []
-                for metric_name in metric_names:
-                    metric_data = session_state['metrics_cache'][metric_name]
-                    persistent_key = f"metric_{metric_data['pillar_id']}_{metric_data['metric_id']}"
-
-                    try:
-                        # Attempt to get and convert the value to float
-                        current_value = format_value_with_unit(
-                            session_state.get(persistent_key, 0),
-                            metric_data['unit'])
-                    except (ValueError, TypeError):
-                        # If conversion fails, use a default value
-                        current_value = 0.0
-
-                    metrics_data.append({
-                        "Metric": metric_name,
-                        "Current": current_value,
-                        "Target": f"{metric_data['target_low_range']} - {metric_data['target_high_range']} {metric_data['unit']}"
-                    })
-
-                st.dataframe(
-                    pd.DataFrame(metrics_data),
-                    column_config={
-                        "Metric": st.column_config.TextColumn(width="large"),
-                        "Current": st.column_config.TextColumn(width="medium"),
-                        "Target": "Target Range"
-                    },
-                    hide_index=True,
-                    use_container_width=True
-                )
-
-                st.markdown("---")
-
-                # Generate recommendations for each metric
-                for metric_name in metric_names:
-                    metric_data = session_state['metrics_cache'][metric_name]
-                    persistent_key = f"metric_{metric_data['pillar_id']}_{metric_data['metric_id']}"
-                    current_value = session_state.get(persistent_key, 0)
-
-                    try:
-                        current_value = float(current_value)
-                        target_low = float(metric_data['target_low_range'])
-                        target_high = float(metric_data['target_high_range'])
-                    except (ValueError, TypeError) as e:
-                        logger.error(f"Value conversion error for {metric_name}: {e}")
-                        continue
-
-                    # Only show recommendations for metrics outside target range
-                    if current_value < target_low or current_value > target_high:
-                        with st.container(border=True):
-                            cols = st.columns([1, 3])
-
-                            # Current vs Target
-                            with cols[0]:
-                                st.subheader(f"🚨 {metric_name}")
-                                st.metric("Current",
-                                          format_value_with_unit(current_value, metric_data['unit']))
-                                st.metric("Target Range",
-                                          f"{metric_data['target_low_range']}-{metric_data['target_high_range']}{metric_data['unit']}")
-
-                            # Recommendations
-                            with cols[1]:
-                                recommendations = get_recommendations_for_metric(metric_data['metric_id'])
-                                if recommendations:
-                                    st.markdown("#### 🛠 Recommended Actions")
-                                    for rec in recommendations:
-                                        st.markdown(f"- {rec}")
-                                else:
-                                    st.info("No specific recommendations available. Review general best practices.")
-
-                                # Resource links
-                                if metric_data.get('blog_link') or metric_data.get('video_link'):
-                                    st.markdown("#### 📚 Resources")
-                                    res_cols = st.columns(2)
-                                    if metric_data.get('blog_link'):
-                                        res_cols[0].page_link(
-                                            metric_data['blog_link'],
-                                            label="Detailed Guide",
-                                            icon="📖"
-                                        )
-                                    if metric_data.get('video_link'):
-                                        res_cols[1].page_link(
-                                            metric_data['video_link'],
-                                            label="Video Explanation",
-                                            icon="🎥"
-                                        )
-
-                            st.markdown("---")
-
-        # ----- Next Steps -----
-        st.header("🚦 Next Steps")
-        st.markdown("""
-        1. **Prioritize 3 Key Actions** from recommendations
-        2. **Establish Baseline Metrics** within 7 days
-        3. **Create 30/60/90 Day Plan** with milestones
-        """)
-
+        with track_report():
+            render_report(get_report_model(session_state))
     except Exception as e:
         logger.error(f"Report generation failed: {e}")
         raise
+
+
+def render_report(model):
+    """Walk a prebuilt ReportModel; all computation happens in the memoized model"""
+    profile = model.profile
+
+    # ----- Report Header -----
+    st.title("🧬 SaaS Traction Diagnostic Report")
+    st.markdown(f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}*")
+    st.markdown("---")
+
+    # ----- Company Overview -----
+    st.header("🏢 Company Profile")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Annual Revenue", f"${profile.annual_revenue}M")
+        st.metric("Growth Stage", profile.growth_stage_name)
+    with col2:
+        st.metric("Business Model", f"{profile.saas_type_name} ({profile.orientation_name})")
+        st.metric("Industry", profile.industry_name)
+    st.markdown("---")
+
+    # ----- ATA Score -----
+    render_ata_score(model)
+
+    # ----- Priorities -----
+    render_priorities(model)
+
+    # ----- Metrics Analysis -----
+    st.header("📈 Metrics Diagnosis")
+
+    # Display metrics by pillar
+    for section in model.pillars:
+        with st.expander(f"### {section.pillar_name} Metrics", expanded=True):
+            # Build and display metrics table (markdown, so the page never loads pandas)
+            st.markdown(metrics_table(section.rows))
+
+    # ----- Next Steps -----
+    st.header("🚦 Next Steps")
+    if model.priorities.actions:
+        st.markdown("**Start with these actions:**")
+        st.markdown("\n".join(
+            f"{rank}. {action.action} *({action.metric_name})*"
+            for rank, action in enumerate(model.priorities.actions, start=1)
+        ))
+        st.markdown("**Then:**")
+    st.markdown("""
+    1. **Establish Baseline Metrics** within 7 days
+    2. **Create 30/60/90 Day Plan** with milestones
+    """)
+
+    # ----- Export -----
+    render_export(model)
@@ -1,30 +1,8 @@
-from src.db_queries.connection import get_db_connection
-import streamlit as st
+from src.db_queries.catalog import get_catalog
+from src.utils.telemetry import track_loader
 
 
-@st.cache_data(ttl=3600)
+@track_loader
 def get_architecture_pillars():
-    """Return architecture pillars as a dictionary with IDs as keys"""
-    conn = get_db_connection()
-    try:
-        with conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                           SELECT id, pillar_name, description, display_icon
-                           FROM architecture_pillars
-                           WHERE enabled = TRUE
-                           ORDER BY display_order
-                           """)
-
-            # Create dictionary with ID as key and remaining columns as value
-            pillars_dict = {
-                row['id']: {
-                    'pillar_name': row['pillar_name'],
-                    'description': row['description'],
-                    'display_icon': row['display_icon']
-                }
-                for row in cursor.fetchall()
-            }
-            return pillars_dict
-    finally:
-        pass
+    """Return enabled architecture pillars keyed by ID, in display order"""
+    return get_catalog().pillars
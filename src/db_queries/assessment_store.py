@@ -0,0 +1,259 @@
+"""Durable store for completed assessments.
+
+Finished reports are written to their own SQLite database in WAL mode, apart
+from the read-only reference database. Callers only enqueue; a background writer
+thread commits queued records in batched transactions, so no rerun waits on disk.
+
+    python -m src.db_queries.assessment_store --records 20000   # throughput check
+"""
+import argparse
+import atexit
+import json
+import logging
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+ASSESSMENTS_DB_PATH = os.environ.get('ATA_ASSESSMENTS_DB', os.path.join('data', 'assessments.db'))
+
+# Write-behind tuning (overridable through the environment)
+QUEUE_SIZE = int(os.environ.get('ATA_ASSESSMENT_QUEUE_SIZE', 10000))
+BATCH_SIZE = int(os.environ.get('ATA_ASSESSMENT_BATCH_SIZE', 256))
+FLUSH_INTERVAL_SECONDS = float(os.environ.get('ATA_ASSESSMENT_FLUSH_INTERVAL', 0.5))
+SHUTDOWN_TIMEOUT_SECONDS = 10
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS assessments
+(
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    fingerprint     TEXT NOT NULL,
+    created_at      TEXT NOT NULL,
+    annual_revenue  REAL,
+    growth_stage_id INTEGER,
+    saas_type_id    INTEGER,
+    orientation     TEXT,
+    industry_id     INTEGER,
+    answers         TEXT NOT NULL,
+    overall_score   REAL,
+    pillar_scores   TEXT NOT NULL,
+    out_of_range    TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_assessments_created_at ON assessments (created_at);
+CREATE INDEX IF NOT EXISTS idx_assessments_fingerprint ON assessments (fingerprint);
+"""
+
+INSERT_SQL = """
+INSERT INTO assessments (fingerprint, created_at, annual_revenue, growth_stage_id, saas_type_id, orientation,
+                         industry_id, answers, overall_score, pillar_scores, out_of_range)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_STOP = object()
+
+
+def open_store_connection(db_path=ASSESSMENTS_DB_PATH):
+    """Writable WAL connection; NORMAL sync is durable at every WAL checkpoint"""
+    os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def assessment_row(model):
+    """Flatten a ReportModel into an ``assessments`` row"""
+    profile = model.profile
+    answers = [
+        [row.pillar_id, row.metric_id, row.value]
+        for section in model.pillars
+        for row in section.rows
+    ]
+    out_of_range = [row.metric_id for section in model.pillars for row in section.out_of_range]
+    overall = model.overall_score if model.overall_score == model.overall_score else None
+    return (
+        model.fingerprint,
+        datetime.now(timezone.utc).isoformat(),
+        profile.annual_revenue,
+        profile.growth_stage_id,
+        profile.saas_type_id,
+        profile.orientation_name,
+        profile.industry_id,
+        json.dumps(answers),
+        overall,
+        json.dumps(dict(model.pillar_scores)),
+        json.dumps(out_of_range),
+    )
+
+
+class AssessmentStore:
+    """Bounded queue in front of a single background writer thread.
+
+    ``submit`` never blocks: when the queue is full the record is dropped and
+    counted. The writer drains up to ``batch_size`` records per transaction.
+    The store is opened up front: if that fails no writer is started and every
+    record is refused and counted as failed.
+    """
+
+    def __init__(self, db_path=ASSESSMENTS_DB_PATH, queue_size=QUEUE_SIZE, batch_size=BATCH_SIZE,
+                 flush_interval=FLUSH_INTERVAL_SECONDS):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._stats = {'enqueued': 0, 'dropped': 0, 'written': 0, 'failed': 0, 'batches': 0, 'write_seconds': 0.0}
+        try:
+            self._conn = open_store_connection(db_path)
+        except (sqlite3.Error, OSError) as e:
+            logger.error(f"Cannot open assessment store {db_path}, assessments will not be saved: {str(e)}")
+            self._conn = None
+        self._thread = threading.Thread(target=self._run, name='assessment-writer', daemon=True)
+        if self._conn is not None:
+            self._thread.start()
+
+    def _count(self, key, amount=1):
+        with self._lock:
+            self._stats[key] += amount
+
+    def submit(self, row):
+        """Enqueue an ``assessments`` row; returns False if it had to be dropped or cannot be written"""
+        if self._conn is None:
+            self._count('failed')
+            return False
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self._count('dropped')
+            logger.warning("Assessment queue full, dropping record")
+            return False
+        self._count('enqueued')
+        return True
+
+    def _run(self):
+        conn = self._conn
+        try:
+            stopping = False
+            while not stopping:
+                try:
+                    item = self._queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    continue
+
+                batch = []
+                while True:
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    batch.append(item)
+                    if len(batch) >= self.batch_size:
+                        break
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+
+                if batch:
+                    self._write(conn, batch)
+        finally:
+            conn.close()
+
+    def _write(self, conn, batch):
+        started = time.perf_counter()
+        try:
+            with conn:
+                conn.executemany(INSERT_SQL, batch)
+        except sqlite3.Error as e:
+            self._count('failed', len(batch))
+            logger.error(f"Failed to write {len(batch)} assessments: {str(e)}")
+            return
+        with self._lock:
+            self._stats['written'] += len(batch)
+            self._stats['batches'] += 1
+            self._stats['write_seconds'] += time.perf_counter() - started
+
+    def close(self, timeout=SHUTDOWN_TIMEOUT_SECONDS):
+        """Flush everything queued so far and stop the writer"""
+        if not self._thread.is_alive():
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.error("Assessment queue did not drain before shutdown")
+            return
+        self._thread.join(timeout)
+        logger.info(f"Assessment store closed: {self.stats()}")
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        stats['queued'] = self._queue.qsize()
+        stats['rows_per_second'] = stats['written'] / stats['write_seconds'] if stats['write_seconds'] else 0.0
+        return stats
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_assessment_store():
+    """Process-wide assessment store, flushed when the interpreter exits"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = AssessmentStore()
+                atexit.register(_store.close)
+    return _store
+
+
+def record_assessment(session_state):
+    """Queue the session's finished report once per distinct report"""
+    from src.diagnostics.report_model import get_report_model
+
+    model = get_report_model(session_state)
+    if session_state.get('saved_assessment') == model.fingerprint:
+        return False
+    if get_assessment_store().submit(assessment_row(model)):
+        session_state['saved_assessment'] = model.fingerprint
+        return True
+    return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure assessment store write throughput")
+    parser.add_argument('--records', type=int, default=20000)
+    parser.add_argument('--db-path', default=os.path.join('data', 'assessments-bench.db'))
+    args = parser.parse_args(argv)
+
+    store = AssessmentStore(args.db_path, queue_size=args.records + 1)
+    row = ('0' * 32, datetime.now(timezone.utc).isoformat(), 2.4, 3, 1, 'Horizontal', None,
+           json.dumps([[1, 1, 3.0]] * 15), 62.0, json.dumps({'Revenue': 67.0}), json.dumps([1, 2]))
+
+    started = time.perf_counter()
+    for _ in range(args.records):
+        store.submit(row)
+    enqueue_seconds = time.perf_counter() - started
+    store.close()
+    elapsed = time.perf_counter() - started
+
+    stats = store.stats()
+    print(f"enqueued {stats['enqueued']} in {enqueue_seconds * 1000:.1f} ms "
+          f"({enqueue_seconds / max(args.records, 1) * 1e6:.2f} us/record)")
+    print(f"written {stats['written']} in {stats['batches']} batches, {elapsed:.2f}s total, "
+          f"{stats['rows_per_second']:.0f} rows/s inside transactions")
+    os.remove(args.db_path)
+    for suffix in ('-wal', '-shm'):
+        if os.path.exists(args.db_path + suffix):
+            os.remove(args.db_path + suffix)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
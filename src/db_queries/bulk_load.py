@@ -0,0 +1,182 @@
+"""Bulk loader for the reference content tables.
+
+The large content tables (metrics, metric associations, recommendations) are
+maintained as CSV or Parquet files named after their table. Each file is read
+into Arrow with column types taken from the table's schema, range-checked in a
+vectorized pre-pass, and inserted with ``executemany``. All files of a build
+step load in a single transaction, with the tables' indexes dropped before the
+inserts and recreated once after them.
+
+    python -m src.db_queries.bulk_load --scale 100   # load time with 100x the associations
+"""
+import argparse
+import logging
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+logger = logging.getLogger(__name__)
+
+DATA_EXTENSIONS = ('.csv', '.parquet')
+# Reported offending rows per failed check
+MAX_REPORTED_ROWS = 10
+
+# (lower column, upper column) pairs that must hold for every row of a table
+RANGE_CHECKS = {
+    'architecture_growth_stage_metric_associations': [
+        ('min_value', 'lo_range_value'),
+        ('lo_range_value', 'hi_range_value'),
+        ('hi_range_value', 'max_value'),
+    ],
+}
+
+
+class ReferenceDataError(ValueError):
+    pass
+
+
+def is_data_file(path):
+    return path.endswith(DATA_EXTENSIONS)
+
+
+def table_name(path):
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def schema_types(conn, table):
+    """{column: Arrow type} from the declared column types (SQLite affinity rules)"""
+    import pyarrow as pa
+
+    columns = conn.execute(f"PRAGMA table_info({table})").fetchall()
+    if not columns:
+        raise ReferenceDataError(f"No table {table!r} for reference data file")
+    types = {}
+    for column in columns:
+        declared = column[2].upper()
+        if 'INT' in declared:
+            types[column[1]] = pa.int64()
+        elif any(text in declared for text in ('CHAR', 'CLOB', 'TEXT')):
+            types[column[1]] = pa.string()
+        else:
+            types[column[1]] = pa.float64()
+    return types
+
+
+def read_data_file(conn, path):
+    """Arrow table of a CSV or Parquet file, cast to its SQLite table's column types"""
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    types = schema_types(conn, table_name(path))
+    if path.endswith('.parquet'):
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path)
+    else:
+        table = pa_csv.read_csv(
+            path,
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(column_types=types, strings_can_be_null=True),
+        )
+
+    unknown = [name for name in table.column_names if name not in types]
+    if unknown:
+        raise ReferenceDataError(f"{os.path.basename(path)}: unknown columns {unknown}")
+    return pa.table({name: table[name].cast(types[name]) for name in table.column_names})
+
+
+def validate_ranges(name, table):
+    """Raise ReferenceDataError listing the rows that break any of the table's range checks"""
+    import pyarrow.compute as pc
+
+    errors = []
+    for lower, upper in RANGE_CHECKS.get(name, ()):
+        if lower not in table.column_names or upper not in table.column_names:
+            continue
+        broken = pc.invert(pc.fill_null(pc.less_equal(table[lower], table[upper]), False))
+        count = pc.sum(broken).as_py() or 0
+        if count:
+            rows = table.filter(broken).column(0).to_pylist()[:MAX_REPORTED_ROWS]
+            errors.append(f"{lower} > {upper} in {count} rows ({table.column_names[0]} {rows})")
+    if errors:
+        raise ReferenceDataError(f"{name}: " + "; ".join(errors))
+
+
+def load_tables(conn, paths):
+    """Replace the rows of every table with its data file, in one transaction"""
+    started = time.perf_counter()
+    tables = {table_name(path): read_data_file(conn, path) for path in paths}
+    for name, table in tables.items():
+        validate_ranges(name, table)
+
+    placeholders = ",".join("?" * len(tables))
+    indexes = conn.execute(
+        f"SELECT name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL AND tbl_name IN ({placeholders})",
+        list(tables)).fetchall()
+
+    conn.execute("BEGIN")
+    try:
+        conn.execute("PRAGMA defer_foreign_keys = ON")
+        for name, _ in indexes:
+            conn.execute(f"DROP INDEX {name}")
+        for name, table in tables.items():
+            columns = ", ".join(table.column_names)
+            values = ", ".join("?" * table.num_columns)
+            conn.execute(f"DELETE FROM {name}")
+            conn.executemany(f"INSERT INTO {name} ({columns}) VALUES ({values})",
+                             zip(*(column.to_pylist() for column in table.columns)))
+        for _, sql in indexes:
+            conn.execute(sql)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+    rows = sum(table.num_rows for table in tables.values())
+    logger.info(f"Loaded {rows} reference rows into {len(tables)} tables "
+                f"in {(time.perf_counter() - started) * 1000:.1f} ms")
+    return rows
+
+
+def scaled_file(path, scale, directory):
+    """Copy of a data file with its rows repeated ``scale`` times under fresh ids"""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+
+    table = pa_csv.read_csv(path)
+    step = pc.max(table['id']).as_py()
+    copies = [table.set_column(0, 'id', pc.add(table['id'], step * n)) for n in range(scale)]
+    target = os.path.join(directory, os.path.basename(path))
+    pa_csv.write_csv(pa.concat_tables(copies), target)
+    return target
+
+
+def main(argv=None):
+    from src.db_queries.db_init import BUILD_FILES, apply_build_files
+
+    parser = argparse.ArgumentParser(description="Time a full in-memory build with a scaled association table")
+    parser.add_argument('--scale', type=int, default=1, help='repeat the association rows this many times')
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        build_files = [
+            scaled_file(path, args.scale, directory)
+            if table_name(path) == 'architecture_growth_stage_metric_associations' and args.scale > 1 else path
+            for path in BUILD_FILES
+        ]
+        conn = sqlite3.connect(':memory:')
+        started = time.perf_counter()
+        apply_build_files(conn, build_files)
+        elapsed = time.perf_counter() - started
+
+    associations = conn.execute("SELECT count(*) FROM architecture_growth_stage_metric_associations").fetchone()[0]
+    resolved = conn.execute("SELECT count(*) FROM resolved_metric_ranges").fetchone()[0]
+    print(f"{associations} associations, {resolved} resolved ranges: build {elapsed * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
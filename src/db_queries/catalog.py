@@ -0,0 +1,260 @@
+import logging
+import re
+from operator import itemgetter
+from types import MappingProxyType
+from typing import NamedTuple, Callable
+
+import streamlit as st
+
+from src.db_queries.connection import get_db_connection, versioned
+from src.utils.telemetry import cache_miss, track_loader
+
+logger = logging.getLogger(__name__)
+
+
+# Immutable, tuple-backed records. NamedTuple instances carry no per-instance
+# __dict__, so the whole catalog stays compact and cannot be mutated by callers.
+class SaasType(NamedTuple):
+    id: int
+    type_name: str
+
+
+class Orientation(NamedTuple):
+    id: int
+    orientation_name: str
+
+
+class Industry(NamedTuple):
+    id: int
+    industry_name: str
+
+
+class IndustryMapping(NamedTuple):
+    saas_type_id: int
+    orientation_id: int
+    industry_id: int
+
+
+class GrowthStage(NamedTuple):
+    id: int
+    growth_stage_name: str
+    description: str
+    low_range: float
+    high_range: float
+
+
+class Pillar(NamedTuple):
+    id: int
+    pillar_name: str
+    description: str
+    display_icon: str
+
+
+class Metric(NamedTuple):
+    id: int
+    metric_name: str
+    metric_type_id: int
+    description: str
+    blog_link: str
+    video_link: str
+    units: str
+
+
+class UnitFormat(NamedTuple):
+    step: float
+    slider_format: str
+    formatter: Callable
+
+
+class VideoEmbed(NamedTuple):
+    embed_url: str
+    thumbnail_url: str
+
+
+# Unit keyword -> (slider step, slider format, report formatter). Order matters:
+# the first keyword found in a unit string wins, mirroring the original checks.
+_UNIT_RULES = (
+    ("Percentage", 0.3, "%.1f%%", lambda v: f"{v:.1f}%"),
+    ("Currency", 1000.00, "$%.2f", lambda v: f"${v:.2f}"),
+    ("Months", 1.0, "%d", lambda v: f"{int(v)} months"),
+    ("Days", 5.0, "%d days", lambda v: f"{int(v)} days"),
+    ("Hours", 1.0, "%d hours", lambda v: f"{int(v)} hours"),
+    ("Milliseconds", 100.00, "%d ms", lambda v: f"{int(v)} ms"),
+)
+_DEFAULT_UNIT_FORMAT = UnitFormat(0.5, "%.2f", lambda v: f"{v:.1f}")
+
+
+def build_unit_format(units):
+    """Resolve the slider step, slider format and report formatter for a unit string"""
+    for keyword, step, slider_format, formatter in _UNIT_RULES:
+        if keyword in (units or ""):
+            return UnitFormat(step, slider_format, formatter)
+    return _DEFAULT_UNIT_FORMAT
+
+
+_YOUTUBE_ID = re.compile(r'(?:youtu\.be/|youtube\.com/(?:watch\?(?:.*&)?v=|embed/|shorts/))([\w-]{11})')
+YOUTUBE_EMBED_URL = "https://www.youtube.com/embed/{}"
+# 320x180 still: a few KB in place of the player
+YOUTUBE_THUMBNAIL_URL = "https://i.ytimg.com/vi/{}/mqdefault.jpg"
+
+
+def build_video_embed(video_link):
+    """Resolve the embeddable URL and thumbnail of a video link; other hosts embed as given"""
+    match = _YOUTUBE_ID.search(video_link)
+    if match is None:
+        return VideoEmbed(video_link, None)
+    return VideoEmbed(YOUTUBE_EMBED_URL.format(match.group(1)), YOUTUBE_THUMBNAIL_URL.format(match.group(1)))
+
+
+class Catalog:
+    """Read-only snapshot of all reference data, shared by every session in the process"""
+
+    __slots__ = (
+        'saas_types',
+        'orientations',
+        'industries',
+        'industry_mappings',
+        'growth_stages',
+        'pillars',
+        'metric_types',
+        'metrics',
+        'recommendations',
+        'unit_formats',
+        'video_embeds',
+    )
+
+    def __init__(self, saas_types, orientations, industries, industry_mappings, growth_stages,
+                 pillars, metric_types, metrics, recommendations):
+        object.__setattr__(self, 'saas_types', MappingProxyType(saas_types))
+        object.__setattr__(self, 'orientations', MappingProxyType(orientations))
+        object.__setattr__(self, 'industries', MappingProxyType(industries))
+        object.__setattr__(self, 'industry_mappings', industry_mappings)
+        object.__setattr__(self, 'growth_stages', MappingProxyType(growth_stages))
+        object.__setattr__(self, 'pillars', MappingProxyType(pillars))
+        object.__setattr__(self, 'metric_types', MappingProxyType(metric_types))
+        object.__setattr__(self, 'metrics', MappingProxyType(metrics))
+        object.__setattr__(self, 'recommendations', MappingProxyType(recommendations))
+        object.__setattr__(self, 'unit_formats', MappingProxyType({
+            metric.units: build_unit_format(metric.units) for metric in metrics.values()
+        }))
+        object.__setattr__(self, 'video_embeds', MappingProxyType({
+            metric.id: build_video_embed(metric.video_link) for metric in metrics.values() if metric.video_link
+        }))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Catalog is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Catalog is immutable")
+
+    def unit_format(self, units):
+        """Precomputed format entry for a unit, computed on the fly for unknown units"""
+        unit_format = self.unit_formats.get(units)
+        if unit_format is None:
+            unit_format = build_unit_format(units)
+        return unit_format
+
+    def industries_for(self, saas_type_id=None, orientation_id=None):
+        """Industries mapped to a SaaS type / orientation pair, in mapping order"""
+        matching = {}
+        for mapping in self.industry_mappings:
+            if ((saas_type_id is None or mapping.saas_type_id == saas_type_id)
+                    and (orientation_id is None or mapping.orientation_id == orientation_id)
+                    and mapping.industry_id in self.industries):
+                matching[mapping.industry_id] = self.industries[mapping.industry_id]
+        return matching
+
+    def stages_for_revenue(self, revenue):
+        """Growth stages whose revenue band contains the given ARR (in $M)"""
+        return [
+            stage for stage in self.growth_stages.values()
+            if stage.low_range <= revenue <= stage.high_range
+        ]
+
+
+# Reference tables read into the catalog, in load order
+CATALOG_QUERIES = {
+    'saas_types': "SELECT id, type_name FROM saas_types",
+    'orientations': "SELECT id, orientation_name FROM orientations",
+    'industries': "SELECT id, industry_name FROM industries",
+    'industry_mappings': "SELECT saas_type_id, orientation_id, industry_id FROM industry_mappings",
+    'growth_stages': """
+                     SELECT id, growth_stage_name, description, low_range, high_range
+                     FROM growth_stages
+                     """,
+    'pillars': """
+               SELECT id, pillar_name, description, display_icon
+               FROM architecture_pillars
+               WHERE enabled = TRUE
+               ORDER BY display_order
+               """,
+    'metric_types': "SELECT id, type_name FROM metric_types",
+    'metrics': """
+               SELECT id, metric_name, metric_type_id, description, blog_link, video_link, units
+               FROM metrics
+               """,
+    # Grouped by metric: a metric's recommendations are one contiguous run
+    'recommendations': "SELECT metric_id, recommendation FROM recommendations ORDER BY metric_id, rowid",
+}
+
+
+def _growth_stage(row):
+    return GrowthStage(row[0], row[1], row[2], float(row[3]), float(row[4]))
+
+
+# Query name -> record built from one row; every keyed table is keyed by its first column
+CATALOG_RECORDS = {
+    'saas_types': SaasType._make,
+    'orientations': Orientation._make,
+    'industries': Industry._make,
+    'industry_mappings': IndustryMapping._make,
+    'growth_stages': _growth_stage,
+    'pillars': Pillar._make,
+    'metric_types': itemgetter(1),
+    'metrics': Metric._make,
+}
+
+
+def build_catalog(tables):
+    """Assemble an immutable Catalog from {query name: row tuples} (see ``CATALOG_QUERIES``)"""
+    records = {
+        name: {row[0]: make(row) for row in tables[name]}
+        for name, make in CATALOG_RECORDS.items() if name != 'industry_mappings'
+    }
+    industry_mappings = tuple(IndustryMapping._make(row) for row in tables['industry_mappings'])
+
+    grouped = {}
+    for metric_id, recommendation in tables['recommendations']:
+        grouped.setdefault(metric_id, []).append(recommendation)
+    recommendations = {metric_id: tuple(recs) for metric_id, recs in grouped.items()}
+
+    logger.info(f"Loaded reference catalog: {len(records['metrics'])} metrics, "
+                f"{sum(len(r) for r in recommendations.values())} recommendations")
+
+    return Catalog(industry_mappings=industry_mappings, recommendations=recommendations, **records)
+
+
+def load_catalog(conn):
+    """Read every reference table once and assemble an immutable Catalog"""
+    cursor = conn.cursor()
+    return build_catalog({name: [tuple(row) for row in cursor.execute(sql)] for name, sql in CATALOG_QUERIES.items()})
+
+
+@track_loader
+@versioned
+@st.cache_resource(max_entries=2)
+@cache_miss
+def get_catalog(data_version):
+    """Process-wide catalog, returned by reference (no pickling or copying per call).
+
+    Backed by the memory-mapped catalog snapshot when one matches the database
+    build (records are read from the mapped columns on access), read from SQLite
+    otherwise.
+    """
+    from src.db_queries.snapshot import get_catalog_snapshot
+
+    snapshot = get_catalog_snapshot()
+    if snapshot is not None:
+        return snapshot.catalog()
+    with get_db_connection() as conn:
+        return load_catalog(conn)
@@ -1,20 +1,220 @@
+import functools
 import logging
+import os
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
+from urllib.request import pathname2url
 
 import streamlit as st
-from streamlit import cache_resource
 
+from src.db_queries.profiler import trace_connection
 
-@cache_resource
+logger = logging.getLogger(__name__)
+
+DB_PATH = os.path.join('data', 'traction_diagnostics.db')
+
+# Connection tuning (overridable through the environment)
+POOL_SIZE = int(os.environ.get('ATA_DB_POOL_SIZE', 8))
+POOL_TIMEOUT_SECONDS = float(os.environ.get('ATA_DB_POOL_TIMEOUT', 10))
+MMAP_SIZE_BYTES = int(os.environ.get('ATA_DB_MMAP_SIZE', 64 * 1024 * 1024))
+CACHE_SIZE_KIB = int(os.environ.get('ATA_DB_CACHE_SIZE_KIB', 8 * 1024))
+STATEMENT_CACHE_SIZE = int(os.environ.get('ATA_DB_STATEMENT_CACHE', 256))
+LOAD_IN_MEMORY = os.environ.get('ATA_DB_IN_MEMORY', '0').lower() in ('1', 'true', 'yes')
+
+
+def open_read_only_connection(db_path=DB_PATH, in_memory=LOAD_IN_MEMORY):
+    """Open a tuned, read-only connection to the reference database.
+
+    The file is opened through a URI with ``mode=ro&immutable=1`` so SQLite skips
+    locking and change detection entirely. With ``in_memory`` the whole database is
+    copied into a private ``:memory:`` database through the backup API.
+    """
+    if not os.path.exists(db_path):
+        raise sqlite3.OperationalError(f"Reference database not found: {db_path}")
+
+    uri = f"file:{pathname2url(os.path.abspath(db_path))}?mode=ro&immutable=1"
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE)
+
+    if in_memory:
+        memory_conn = sqlite3.connect(':memory:', check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE)
+        conn.backup(memory_conn)
+        conn.close()
+        conn = memory_conn
+    else:
+        conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE_BYTES}")
+
+    conn.row_factory = sqlite3.Row
+    conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KIB}")
+    conn.execute("PRAGMA query_only = ON")
+    conn.execute("PRAGMA foreign_keys = ON")
+    return conn
+
+
+class ConnectionPool:
+    """Bounded LIFO pool of read-only connections.
+
+    A connection is leased to exactly one thread at a time, so cursors are never
+    shared between Streamlit session threads. Connections are created lazily up to
+    ``size``; when all are leased, callers wait up to ``timeout`` seconds.
+    """
+
+    def __init__(self, db_path=DB_PATH, size=POOL_SIZE, timeout=POOL_TIMEOUT_SECONDS, in_memory=LOAD_IN_MEMORY):
+        self.db_path = db_path
+        self.size = size
+        self.timeout = timeout
+        self.in_memory = in_memory
+        self._idle = queue.LifoQueue(maxsize=size)
+        self._lock = threading.Lock()
+        self._created = 0
+        self._closed = False
+
+    def acquire(self):
+        """Take a connection out of the pool (callers must ``release`` it)"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                create = True
+            else:
+                create = False
+
+        if create:
+            try:
+                return open_read_only_connection(self.db_path, self.in_memory)
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise sqlite3.OperationalError(
+                f"Timed out after {self.timeout}s waiting for a database connection "
+                f"(pool size {self.size})")
+
+    def release(self, conn):
+        """Return a leased connection to the pool, or close it if the pool was closed"""
+        if conn.in_transaction:
+            conn.rollback()
+        # Checked and put under the lock ``close`` drains with, so a connection
+        # released during a close is either closed here or drained there
+        with self._lock:
+            if not self._closed:
+                self._idle.put_nowait(conn)
+                return
+        conn.close()
+
+    @contextmanager
+    def connection(self):
+        """Lease a connection for the duration of the ``with`` block"""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self):
+        """Close idle connections; leased ones are closed when returned"""
+        with self._lock:
+            self._closed = True
+            while True:
+                try:
+                    self._idle.get_nowait().close()
+                except queue.Empty:
+                    break
+
+    def stats(self):
+        return {
+            'size': self.size,
+            'created': self._created,
+            'idle': self._idle.qsize(),
+            'in_memory': self.in_memory,
+        }
+
+
+_pool = None
+_pool_lock = threading.Lock()
+# Content hash of the build this process reads; None until first asked for
+_data_version = None
+
+
+def get_connection_pool():
+    """Process-wide connection pool for the reference database"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool()
+    return _pool
+
+
+def get_data_version():
+    """Content hash of the reference database build this process is serving ('' if unstamped)"""
+    global _data_version
+    if _data_version is None:
+        from src.db_queries.db_init import read_build_stamp
+
+        with _pool_lock:
+            if _data_version is None:
+                _data_version = read_build_stamp(DB_PATH) or ''
+    return _data_version
+
+
+def swap_data_version(content_hash):
+    """Serve a database build that was just moved into place at ``DB_PATH``.
+
+    New leases get connections to the new file and versioned caches miss on the
+    new key. Connections already leased keep reading the replaced file (its inode
+    stays alive until they close) and are closed when they are released.
+    """
+    global _pool, _data_version
+    with _pool_lock:
+        previous, _pool = _pool, None
+        old_version, _data_version = _data_version, content_hash
+    if previous is not None:
+        previous.close()
+    logger.info(f"Reference data version {(old_version or 'none')[:12]} -> {content_hash[:12]}")
+
+
+def versioned(func):
+    """Pass the current data version as the first argument of a cached loader.
+
+    The version becomes part of the cache key, so entries never need a TTL and
+    are superseded exactly when ``swap_data_version`` runs::
+
+        @track_loader
+        @versioned
+        @st.cache_resource(max_entries=2)
+        @cache_miss
+        def get_catalog(data_version): ...
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(get_data_version(), *args, **kwargs)
+
+    if hasattr(func, 'clear'):
+        wrapper.clear = func.clear
+    return wrapper
+
+
+@contextmanager
 def get_db_connection():
-    """Cache database connection with proper lifecycle management"""
+    """Lease a read-only connection from the process-wide pool, traced by the query profiler"""
+    pool = get_connection_pool()
     try:
-        # Assume database exists. If not, exception will stop the streamlit execution
-        conn = sqlite3.connect('data/traction_diagnostics.db', check_same_thread=False)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON")
-        return conn
+        conn = pool.acquire()
     except sqlite3.Error as e:
-        logging.error(f"Database connection error: {str(e)}")
+        logger.error(f"Database connection error: {str(e)}")
         st.error(f"Database connection error: {str(e)}")
         st.stop()
+    try:
+        yield trace_connection(conn)
+    finally:
+        pool.release(conn)
@@ -0,0 +1,142 @@
+"""Multi-threaded stress test for the pooled read-only connection layer.
+
+Runs the reference queries from many threads at once, verifies that every
+thread sees exactly the rows a single-threaded run sees (no cursor is ever
+shared or interleaved across threads) and reports throughput per thread count.
+
+    python -m src.db_queries.connection_stress --threads 1,2,4,8,16 --seconds 2
+"""
+import argparse
+import logging
+import sys
+import threading
+import time
+
+from src.db_queries.connection import ConnectionPool, DB_PATH
+
+logger = logging.getLogger(__name__)
+
+METRIC_QUERY = """
+               SELECT agsma.metric_id, agsma.min_value, agsma.max_value, agsma.lo_range_value, agsma.hi_range_value
+               FROM architecture_growth_stage_metric_associations agsma
+                        JOIN metrics m ON agsma.metric_id = m.id
+               WHERE agsma.enabled = 1
+                 AND agsma.growth_stage_id = ?
+                 AND agsma.architecture_pillar_id = ?
+               ORDER BY agsma.id
+               """
+RECOMMENDATION_QUERY = "SELECT metric_id, recommendation FROM recommendations ORDER BY metric_id, recommendation"
+
+
+def _workload(conn):
+    """(stage, pillar) combinations covered by the association table"""
+    return [tuple(row) for row in conn.execute(
+        "SELECT DISTINCT growth_stage_id, architecture_pillar_id "
+        "FROM architecture_growth_stage_metric_associations ORDER BY 1, 2")]
+
+
+def _expected_results(pool, combos):
+    with pool.connection() as conn:
+        metric_rows = {combo: [tuple(r) for r in conn.execute(METRIC_QUERY, combo)] for combo in combos}
+        recommendation_rows = [tuple(r) for r in conn.execute(RECOMMENDATION_QUERY)]
+    return metric_rows, recommendation_rows
+
+
+def _run_level(pool, thread_count, seconds, combos, expected_metrics, expected_recommendations):
+    leased = set()
+    leased_lock = threading.Lock()
+    errors = []
+    counts = [0] * thread_count
+    start_barrier = threading.Barrier(thread_count)
+    deadline = [0.0]
+
+    def worker(index):
+        start_barrier.wait()
+        position = index
+        while time.perf_counter() < deadline[0]:
+            with pool.connection() as conn:
+                with leased_lock:
+                    if id(conn) in leased:
+                        errors.append(f"thread {index}: connection {id(conn)} leased twice")
+                    leased.add(id(conn))
+                try:
+                    combo = combos[position % len(combos)]
+                    rows = [tuple(r) for r in conn.execute(METRIC_QUERY, combo)]
+                    if rows != expected_metrics[combo]:
+                        errors.append(f"thread {index}: metric rows mismatch for {combo}")
+
+                    # Stream a larger result in small chunks, yielding between fetches, so any
+                    # cross-thread cursor sharing would show up as interleaved or missing rows
+                    cursor = conn.execute(RECOMMENDATION_QUERY)
+                    streamed = []
+                    while True:
+                        chunk = cursor.fetchmany(16)
+                        if not chunk:
+                            break
+                        streamed.extend(tuple(r) for r in chunk)
+                        time.sleep(0)
+                    if streamed != expected_recommendations:
+                        errors.append(f"thread {index}: recommendation stream mismatch")
+                except Exception as e:
+                    errors.append(f"thread {index}: {type(e).__name__}: {e}")
+                finally:
+                    with leased_lock:
+                        leased.discard(id(conn))
+            counts[index] += 1
+            position += 1
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(thread_count)]
+    deadline[0] = time.perf_counter() + seconds
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    return sum(counts), errors
+
+
+def run_stress(thread_counts, seconds, pool_size, in_memory, db_path=DB_PATH):
+    """Run every thread level and return [(threads, iterations, ops_per_second, errors)]"""
+    pool = ConnectionPool(db_path=db_path, size=pool_size, in_memory=in_memory)
+    try:
+        with pool.connection() as conn:
+            combos = _workload(conn)
+        expected_metrics, expected_recommendations = _expected_results(pool, combos)
+
+        results = []
+        for thread_count in thread_counts:
+            started = time.perf_counter()
+            iterations, errors = _run_level(pool, thread_count, seconds, combos,
+                                            expected_metrics, expected_recommendations)
+            elapsed = time.perf_counter() - started
+            results.append((thread_count, iterations, iterations / elapsed, errors))
+        return results, pool.stats()
+    finally:
+        pool.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--threads', default='1,2,4,8,16', help='comma separated thread counts')
+    parser.add_argument('--seconds', type=float, default=2.0, help='duration of each level')
+    parser.add_argument('--pool-size', type=int, default=8)
+    parser.add_argument('--in-memory', action='store_true', help='copy the DB into memory per connection')
+    parser.add_argument('--db-path', default=DB_PATH)
+    args = parser.parse_args(argv)
+
+    thread_counts = [int(t) for t in args.threads.split(',') if t]
+    results, stats = run_stress(thread_counts, args.seconds, args.pool_size, args.in_memory, args.db_path)
+
+    print(f"{'threads':>8} {'iterations':>11} {'iter/s':>10} {'errors':>7}")
+    failed = False
+    for thread_count, iterations, rate, errors in results:
+        print(f"{thread_count:>8} {iterations:>11} {rate:>10.1f} {len(errors):>7}")
+        for error in errors[:5]:
+            print(f"         ! {error}")
+        failed = failed or bool(errors)
+    print(f"pool: {stats}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,48 @@
+import argparse
+import hashlib
+import itertools
 import logging
 import os
 import sqlite3
+import tempfile
+from datetime import datetime, timezone
+from urllib.request import pathname2url
 
 import streamlit as st
+from filelock import FileLock
 from streamlit import runtime
 
-from src.utils.infra_helpers import setup_logging
+from src.db_queries.bulk_load import is_data_file, load_tables
+from src.db_queries.connection import DB_PATH
+from src.db_queries.snapshot import SNAPSHOT_ENABLED, snapshot_path, write_snapshot
+from src.utils.infra_helpers import ensure_logging
 
-config_loaded = setup_logging()
 logger = logging.getLogger(__name__)
 
+# Bump when the build procedure itself changes so existing artifacts are rebuilt
+BUILD_VERSION = 1
+BUILD_LOCK_TIMEOUT_SECONDS = 120
+
+# Execution order matters! SQL scripts run as written; each run of consecutive
+# data files is bulk loaded into the tables they are named after in one transaction.
+BUILD_FILES = [
+    'src/sql_scripts/01_saas_types.sql',
+    'src/sql_scripts/02_orientations.sql',
+    'src/sql_scripts/03_industries.sql',
+    'src/sql_scripts/04_growth_stages.sql',
+    'src/sql_scripts/05_architecture_pillars.sql',
+    'src/sql_scripts/06_metric_types.sql',
+    'src/sql_scripts/07_metrics.sql',
+    'src/sql_scripts/08_industry_mappings.sql',
+    'src/sql_scripts/09_architecture_growth_stage_metric_associations.sql',
+    'src/sql_scripts/10_recommendations.sql',
+    'src/reference_data/metrics.csv',
+    'src/reference_data/architecture_growth_stage_metric_associations.csv',
+    'src/reference_data/recommendations.csv',
+    'src/sql_scripts/11_resolved_metric_ranges.sql',
+    'src/sql_scripts/12_search_index.sql'
+]
+
 
 def execute_sql_file(conn, path):
     """Execute SQL file in proper order with transaction handling"""
@@ -23,61 +56,132 @@ def execute_sql_file(conn, path):
         raise
 
 
-def setup_database(conn=None):
-    """Main database setup orchestration"""
+def compute_content_hash(build_files=BUILD_FILES):
+    """SHA-256 over the build version and the name and bytes of every build file, in order"""
+    digest = hashlib.sha256(f"build-version:{BUILD_VERSION}\0".encode())
+    for path in build_files:
+        digest.update(os.path.basename(path).encode() + b"\0")
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def read_build_stamp(db_path=DB_PATH):
+    """Return the content hash stamped into an existing artifact, or None"""
+    if not os.path.exists(db_path):
+        return None
     try:
-        db_dir = 'data'
-        db_path = os.path.join(db_dir, 'traction_diagnostics.db')
+        uri = f"file:{pathname2url(os.path.abspath(db_path))}?mode=ro"
+        check_conn = sqlite3.connect(uri, uri=True)
+        try:
+            row = check_conn.execute("SELECT value FROM build_info WHERE key = 'content_hash'").fetchone()
+            return row[0] if row else None
+        finally:
+            check_conn.close()
+    except sqlite3.Error:
+        return None
+
+
+def apply_build_files(conn, build_files=BUILD_FILES):
+    """Run every build script and load every data file against an open connection"""
+    conn.execute("PRAGMA foreign_keys = ON")
+    for is_data, paths in itertools.groupby(build_files, key=is_data_file):
+        if is_data:
+            load_tables(conn, list(paths))
+        else:
+            for sql_file in paths:
+                execute_sql_file(conn, sql_file)
+
+
+def build_snapshot(db_path, content_hash):
+    """Export the catalog snapshot of a stamped artifact (callers hold the build lock)"""
+    if not SNAPSHOT_ENABLED:
+        return False
+    conn = sqlite3.connect(f"file:{pathname2url(os.path.abspath(db_path))}?mode=ro", uri=True)
+    try:
+        return write_snapshot(conn, content_hash, db_path)
+    finally:
+        conn.close()
+
+
+def ensure_snapshot(db_path, content_hash):
+    """Write a missing snapshot for an artifact that is already up to date"""
+    if not SNAPSHOT_ENABLED or os.path.isdir(snapshot_path(content_hash, db_path)):
+        return False
+    with FileLock(f"{db_path}.lock", timeout=BUILD_LOCK_TIMEOUT_SECONDS):
+        return build_snapshot(db_path, content_hash)
+
+
+def build_database(db_path=DB_PATH, content_hash=None, build_files=BUILD_FILES, force=False):
+    """Compile the build files into a stamped artifact and atomically move it into place.
+
+    The build runs into a temporary file in the target directory while holding a
+    file lock, so concurrent workers never build or read a half-written database.
+    """
+    content_hash = content_hash or compute_content_hash(build_files)
+    db_dir = os.path.dirname(db_path) or '.'
+    os.makedirs(db_dir, exist_ok=True)
+
+    with FileLock(f"{db_path}.lock", timeout=BUILD_LOCK_TIMEOUT_SECONDS):
+        # Another worker may have finished the same build while we waited for the lock
+        if not force and read_build_stamp(db_path) == content_hash:
+            logger.info("Database was built by another worker")
+            return False
+
+        logger.info(f"Building reference database {content_hash[:12]}")
+        fd, tmp_path = tempfile.mkstemp(prefix='.build-', suffix='.db', dir=db_dir)
+        os.close(fd)
+        try:
+            conn = sqlite3.connect(tmp_path)
+            try:
+                apply_build_files(conn, build_files)
+                conn.execute("CREATE TABLE build_info (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+                conn.executemany("INSERT INTO build_info (key, value) VALUES (?, ?)", [
+                    ('content_hash', content_hash),
+                    ('build_version', str(BUILD_VERSION)),
+                    ('built_at', datetime.now(timezone.utc).isoformat()),
+                ])
+                conn.execute(f"PRAGMA user_version = {BUILD_VERSION}")
+                conn.commit()
+                conn.execute("ANALYZE")
+                conn.execute("VACUUM")
+            finally:
+                conn.close()
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, db_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        build_snapshot(db_path, content_hash)
+
+    logger.info("Database build completed successfully")
+    return True
 
-        # Ensure the data directory exists
-        if not os.path.exists(db_dir):
-            os.makedirs(db_dir)
-            logger.info(f"Created directory: {db_dir}")
 
-        logger.info("Checking database setup")
+def setup_database(conn=None):
+    """Main database setup orchestration.
 
-        # Check if database file exists and has the required table
-        if os.path.exists(db_path):
-            check_conn = sqlite3.connect(db_path)
-            cursor = check_conn.cursor()
-            cursor.execute("""
-                           SELECT name
-                           FROM sqlite_master
-                           WHERE type = 'table'
-                             AND name = 'growth_stages'
-                           """)
-            if cursor.fetchone():
-                logger.info("Database already initialized")
-                check_conn.close()
-                return
-            check_conn.close()
+    Startup only compares the artifact's stamp with the hash of the build files;
+    they are parsed only when one changed. Passing ``conn`` applies the build files
+    to that connection directly (e.g. an in-memory database).
+    """
+    ensure_logging()
+    try:
+        if conn is not None:
+            apply_build_files(conn)
+            conn.commit()
+            return
 
-        # Proceed with initialization if not exists or incomplete
-        logger.info("Starting fresh database setup")
-        if not conn:
-            conn = sqlite3.connect(db_path, check_same_thread=False)
-
-        conn.execute("PRAGMA foreign_keys = ON")
-
-        # Execution order matters!
-        sql_files = [
-            'src/sql_scripts/01_saas_types.sql',
-            'src/sql_scripts/02_orientations.sql',
-            'src/sql_scripts/03_industries.sql',
-            'src/sql_scripts/04_growth_stages.sql',
-            'src/sql_scripts/05_architecture_pillars.sql',
-            'src/sql_scripts/06_metric_types.sql',
-            'src/sql_scripts/07_metrics.sql',
-            'src/sql_scripts/08_industry_mappings.sql',
-            'src/sql_scripts/09_architecture_growth_stage_metric_associations.sql',
-            'src/sql_scripts/10_recommendations.sql'
-        ]
-
-        for sql_file in sql_files:
-            execute_sql_file(conn, sql_file)
-
-        conn.commit()
-        logger.info("Database setup completed successfully")
+        logger.info("Checking database setup")
+        content_hash = compute_content_hash()
+        if read_build_stamp(DB_PATH) == content_hash:
+            logger.info("Database already initialized")
+            ensure_snapshot(DB_PATH, content_hash)
+            return
+
+        build_database(DB_PATH, content_hash)
 
     except Exception as e:
         logger.error(f"Database setup failed: {str(e)}")
@@ -85,10 +189,13 @@ def setup_database(conn=None):
             st.error(f"Database error: {str(e)}")
         raise
 
-    finally:
-        if conn:
-            conn.close()
-
 
 if __name__ == "__main__":
-    setup_database()
+    ensure_logging()
+    parser = argparse.ArgumentParser(description="Build the reference database artifact")
+    parser.add_argument('--force', action='store_true', help='rebuild even if the stamp matches')
+    args = parser.parse_args()
+    if args.force:
+        build_database(DB_PATH, force=True)
+    else:
+        setup_database()
@@ -1,51 +1,21 @@
 # industries.py
-from src.db_queries.connection import get_db_connection
-import streamlit as st
+from src.db_queries.catalog import get_catalog
+from src.utils.telemetry import track_loader
 
 
-@st.cache_data
+@track_loader
 def get_industry_mappings():
-    """Load all industry mappings into memory"""
-    conn = get_db_connection()
-    try:
-        with conn:
-            cursor = conn.cursor()
-            cursor.execute('SELECT saas_type_id, orientation_id, industry_id FROM industry_mappings')
-            return [
-                dict(row) for row in cursor.fetchall()
-            ]
-    finally:
-        pass
+    """Return all industry mappings as an immutable tuple"""
+    return get_catalog().industry_mappings
 
 
-@st.cache_data
+@track_loader
 def get_all_industries():
-    """Load all industries into memory"""
-    conn = get_db_connection()
-    try:
-        with conn:
-            cursor = conn.cursor()
-            cursor.execute('SELECT id, industry_name FROM industries')
-            return {
-                row['id']: dict(row) for row in cursor.fetchall()
-            }
-    finally:
-        pass
+    """Return all industries keyed by ID"""
+    return get_catalog().industries
 
 
+@track_loader
 def get_industries(saas_type_id=None, orientation_id=None):
     """In-memory filtering with optional parameters"""
-    mappings = get_industry_mappings()
-    industries = get_all_industries()
-
-    matching_ids = [
-        m['industry_id'] for m in mappings
-        if (saas_type_id is None or m['saas_type_id'] == saas_type_id)
-           and (orientation_id is None or m['orientation_id'] == orientation_id)
-    ]
-
-    return {
-        iid: {'industry_name': industries[iid]['industry_name']}
-        for iid in matching_ids
-        if iid in industries
-    }
+    return get_catalog().industries_for(saas_type_id, orientation_id)
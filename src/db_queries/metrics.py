@@ -1,44 +1,168 @@
 import logging
-
-from src.db_queries.connection import get_db_connection
 import sqlite3
+from types import MappingProxyType
 
 import streamlit as st
 
+from src.db_queries.catalog import get_catalog
+from src.db_queries.connection import get_db_connection, versioned
+from src.db_queries.profiler import register_plan_check
+from src.db_queries.snapshot import get_catalog_snapshot
+from src.utils.telemetry import cache_miss, track_loader
+
 logger = logging.getLogger(__name__)
 
+# Profile key used in resolved_metric_ranges for "All SaaS Types" / "All Industries"
+ANY_PROFILE_ID = 0
+
+PROFILE_METRICS_SQL = """
+    SELECT r.architecture_pillar_id,
+           m.id,
+           m.metric_name,
+           m.description,
+           m.blog_link,
+           m.video_link,
+           m.units,
+           r.min_value,
+           r.max_value,
+           r.lo_range_value,
+           r.hi_range_value,
+           m.metric_type_id,
+           mt.type_name
+    FROM resolved_metric_ranges r
+             JOIN metrics m ON r.metric_id = m.id
+             JOIN metric_types mt ON m.metric_type_id = mt.id
+    WHERE r.growth_stage_id = ?
+      AND r.saas_type_id = ?
+      AND r.industry_id = ?
+    ORDER BY r.architecture_pillar_id, r.association_id
+    """
+
+register_plan_check(PROFILE_METRICS_SQL, (1, ANY_PROFILE_ID, ANY_PROFILE_ID))
 
-@st.cache_data(ttl=3600)
+
+@track_loader
 def get_all_metrics():
-    conn = get_db_connection()
-    try:
-        with conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT "
-                           "id,"
-                           "metric_name,"
-                           "metric_type_id,"
-                           "description,"
-                           "blog_link,"
-                           "video_link,"
-                           "units FROM metrics").fetchall()
-            metrics_dict = {
-                row['id']: {
-                    'metric_name': row['metric_name'],
-                    'metric_type_id': row['metric_type_id'],
-                    'description': row['description'],
-                    'blog_link': row['blog_link'],
-                    'video_link': row['video_link'],
-                    'units': row['units']
-                }
-                for row in cursor.fetchall()
-            }
-            return metrics_dict
-    finally:
-        pass
-
-
-@st.cache_data(ttl=3600)
+    """Return all metrics keyed by ID"""
+    return get_catalog().metrics
+
+
+def _profile_id(value):
+    """Map an optional ID onto the resolved table's key (0 = unspecified)"""
+    return value if isinstance(value, int) and value > 0 else ANY_PROFILE_ID
+
+
+@track_loader
+def get_profile_metrics(growth_stage_id, saas_type_id=None, industry_id=None):
+    """Retrieve the resolved metrics of every pillar for a company profile in one indexed read.
+
+        Args:
+            growth_stage_id (int): ID from growth_stages table; anything else matches no profile
+            saas_type_id (int, optional): ID from saas_types table
+            industry_id (int, optional): ID from industries table
+
+        Returns:
+            Mapping[int, Mapping[int, Mapping]]: {pillar_id: {metric_id: metric details and ranges}},
+            read-only and shared by every session with the same profile
+        """
+    if not isinstance(growth_stage_id, int):
+        return MappingProxyType({})
+    return _load_profile_metrics(growth_stage_id, _profile_id(saas_type_id), _profile_id(industry_id))
+
+
+@versioned
+@st.cache_resource(max_entries=256)
+@cache_miss
+def _load_profile_metrics(data_version, growth_stage_id, saas_type_id, industry_id):
+    """``get_profile_metrics`` built once per profile and database build.
+
+    Joined from the memory-mapped catalog snapshot when there is one, read from SQLite otherwise.
+    """
+    params = (growth_stage_id, saas_type_id, industry_id)
+    snapshot = get_catalog_snapshot()
+    if snapshot is not None:
+        pillars = _profile_metrics_from_snapshot(snapshot, params)
+    else:
+        try:
+            with get_db_connection() as conn:
+                pillars = _profile_metrics_from_sqlite(conn, params)
+        except sqlite3.Error as e:
+            logger.error(f"Metric range lookup failed for {params}: {e}")
+            return MappingProxyType({})
+
+    return MappingProxyType({
+        pillar_id: MappingProxyType(metrics) for pillar_id, metrics in pillars.items()
+    })
+
+
+def _profile_metrics_from_sqlite(conn, params):
+    """{pillar_id: {metric_id: metric details}} of one profile from ``PROFILE_METRICS_SQL``.
+
+    The ranges are DECIMAL columns, which SQLite hands back as int or float per row;
+    they are read as floats, like the snapshot's float64 columns.
+    """
+    pillars = {}
+    for row in conn.execute(PROFILE_METRICS_SQL, params):
+        pillars.setdefault(row['architecture_pillar_id'], {})[row['id']] = MappingProxyType({
+            'metric_name': row['metric_name'],
+            'metric_type_id': row['metric_type_id'],
+            'metric_type_name': row['type_name'],
+            'description': row['description'],
+            'blog_link': row['blog_link'],
+            'video_link': row['video_link'],
+            'units': row['units'],
+            'min_value': float(row['min_value']),
+            'max_value': float(row['max_value']),
+            'lo_range_value': float(row['lo_range_value']),
+            'hi_range_value': float(row['hi_range_value']),
+        })
+    return pillars
+
+
+def _profile_metrics_from_snapshot(snapshot, params):
+    """Same rows as ``PROFILE_METRICS_SQL``, joined against the mapped catalog columns"""
+    pillars = {}
+    for pillar_id, metric, type_name, min_value, max_value, lo_range_value, hi_range_value in \
+            snapshot.profile_metrics(*params):
+        pillars.setdefault(pillar_id, {})[metric.id] = MappingProxyType({
+            'metric_name': metric.metric_name,
+            'metric_type_id': metric.metric_type_id,
+            'metric_type_name': type_name,
+            'description': metric.description,
+            'blog_link': metric.blog_link,
+            'video_link': metric.video_link,
+            'units': metric.units,
+            'min_value': min_value,
+            'max_value': max_value,
+            'lo_range_value': lo_range_value,
+            'hi_range_value': hi_range_value,
+        })
+    return pillars
+
+
+def check_profile_paths(conn, snapshot, profiles):
+    """Profiles (as passed to ``get_profile_metrics``) on which the snapshot and SQLite paths disagree.
+
+    Results are compared by ``repr``, so value types and metric order must match too.
+    """
+    def plain(pillars):
+        return repr({pillar_id: {metric_id: dict(metric) for metric_id, metric in metrics.items()}
+                     for pillar_id, metrics in pillars.items()})
+
+    mismatches = []
+    for growth_stage_id, saas_type_id, industry_id in profiles:
+        if not isinstance(growth_stage_id, int):
+            # Never reaches either path
+            if get_profile_metrics(growth_stage_id, saas_type_id, industry_id):
+                mismatches.append((growth_stage_id, saas_type_id, industry_id))
+            continue
+        params = (growth_stage_id, _profile_id(saas_type_id), _profile_id(industry_id))
+        if plain(_profile_metrics_from_snapshot(snapshot, params)) != plain(_profile_metrics_from_sqlite(conn, params)):
+            mismatches.append((growth_stage_id, saas_type_id, industry_id))
+    return mismatches
+
+
+@track_loader
 def get_metrics(growth_stage_id, architecture_pillar_id, saas_type_id=None, industry_id=None):
     """Retrieve metrics with their value ranges based on growth stage, architecture pillar, and optional filters.
 
@@ -49,71 +173,11 @@ def get_metrics(growth_stage_id, architecture_pillar_id, saas_type_id=None, indu
             industry_id (int, optional): ID from industries table
 
         Returns:
-            List[dict]: Metric associations with details and value ranges
+            Mapping[int, Mapping]: Metric details and value ranges keyed by metric ID
         """
     logger.debug(f"Query params: growth_stage_id={growth_stage_id}, "
                  f"architecture_pillar_id={architecture_pillar_id}, "
                  f"saas_type_id={saas_type_id}, "
                  f"industry_id={industry_id}")
 
-    conn = get_db_connection()
-    try:
-        # Base query with required parameters
-        query = """
-                SELECT m.id,
-                       m.metric_name,
-                       m.description,
-                       m.blog_link,
-                       m.video_link,
-                       m.units,
-                       agsma.min_value,
-                       agsma.max_value,
-                       agsma.lo_range_value,
-                       agsma.hi_range_value,
-                       m.metric_type_id,
-                       mt.type_name
-                FROM architecture_growth_stage_metric_associations agsma
-                         JOIN metrics m ON agsma.metric_id = m.id
-                         JOIN metric_types mt ON m.metric_type_id = mt.id
-                WHERE agsma.enabled = 1
-                  AND agsma.growth_stage_id = ?
-                  AND agsma.architecture_pillar_id = ?
-                """
-        params = [growth_stage_id, architecture_pillar_id]
-
-        # Handle SaaS type filtering with NULL awareness
-        if saas_type_id is not None:
-            query += " AND (agsma.saas_type_id = ? OR agsma.saas_type_id IS NULL)"
-            params.append(saas_type_id)
-
-        # Handle industry filtering with NULL awareness
-        if industry_id is not None:
-            query += " AND (agsma.industry_id = ? OR agsma.industry_id IS NULL)"
-            params.append(industry_id)
-
-        # Execute query
-        with conn:
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            metrics_dict = {
-                row['id']: {
-                    'metric_name': row['metric_name'],
-                    'metric_type_id': row['metric_type_id'],
-                    'metric_type_name': row['type_name'],
-                    'description': row['description'],
-                    'blog_link': row['blog_link'],
-                    'video_link': row['video_link'],
-                    'units': row['units'],
-                    'min_value': row['min_value'],
-                    'max_value': row['max_value'],
-                    'lo_range_value': row['lo_range_value'],
-                    'hi_range_value': row['hi_range_value'],
-                }
-                for row in cursor.fetchall()
-            }
-            return metrics_dict
-
-    except sqlite3.Error as e:
-        return []
-    finally:
-        pass
+    return get_profile_metrics(growth_stage_id, saas_type_id, industry_id).get(architecture_pillar_id, {})
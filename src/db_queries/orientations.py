@@ -1,21 +1,8 @@
-from src.db_queries.connection import get_db_connection
-import streamlit as st
+from src.db_queries.catalog import get_catalog
+from src.utils.telemetry import track_loader
 
 
-@st.cache_data(ttl=3600)
+@track_loader
 def get_orientations():
-    conn = get_db_connection()
-    try:
-        with conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT id, orientation_name FROM orientations")
-            # Create dictionary with ID as key and remaining columns as value
-            orientations_dict = {
-                row['id']: {
-                    'orientation_name': row['orientation_name'],
-                }
-                for row in cursor.fetchall()
-            }
-            return orientations_dict
-    finally:
-        pass
+    """Return orientations keyed by ID (read-only view over the shared catalog)"""
+    return get_catalog().orientations
@@ -0,0 +1,308 @@
+"""Statement-level profiler for the reference database.
+
+``TracingConnection`` wraps the pooled connections handed out by
+``get_db_connection``: every statement is timed, its normalized shape aggregated,
+its ``EXPLAIN QUERY PLAN`` captured the first time the shape is seen, and anything
+slower than ``ATA_SLOW_QUERY_MS`` is written to the slow-query log.
+
+    ATA_CATALOG_SNAPSHOT=0 python -m src.db_queries.profiler   # load every profile from SQLite, print the report
+"""
+import logging
+import os
+import re
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger('src.db_queries.slow_queries')
+
+PROFILING_ENABLED = os.environ.get('ATA_QUERY_PROFILING', '1').lower() in ('1', 'true', 'yes')
+SLOW_QUERY_MS = float(os.environ.get('ATA_SLOW_QUERY_MS', 50))
+
+# Tables that must only be read through an index at runtime
+WATCHED_TABLES = ('architecture_growth_stage_metric_associations', 'resolved_metric_ranges')
+
+_WHITESPACE = re.compile(r'\s+')
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+_IN_LIST = re.compile(r'\bIN\s*\((?:\s*\?\s*,)*\s*\?\s*\)', re.I)
+_TABLE_REFERENCE = re.compile(r'\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(?!ON\b|WHERE\b|JOIN\b|LEFT\b|INNER\b|CROSS\b'
+                              r'|ORDER\b|GROUP\b|LIMIT\b)(\w+))?', re.I)
+_PLAN_SCAN = re.compile(r'^SCAN (\w+)(.*)$')
+
+
+def normalize_sql(sql):
+    """Statement shape: literals become ``?``, IN lists collapse, whitespace is squeezed"""
+    shape = _STRING_LITERAL.sub('?', sql)
+    shape = _NUMBER_LITERAL.sub('?', shape)
+    shape = _IN_LIST.sub('IN (?)', shape)
+    return _WHITESPACE.sub(' ', shape).strip()
+
+
+def table_aliases(sql):
+    """{alias or table name: table} for every FROM/JOIN reference"""
+    aliases = {}
+    for table, alias in _TABLE_REFERENCE.findall(sql):
+        aliases[table] = table
+        if alias:
+            aliases[alias] = table
+    return aliases
+
+
+def full_scans(sql, plan, tables=WATCHED_TABLES):
+    """Plan lines that scan a watched table, as (table, detail)"""
+    aliases = table_aliases(sql)
+    scans = []
+    for detail in plan:
+        match = _PLAN_SCAN.match(detail)
+        if match and aliases.get(match.group(1), match.group(1)) in tables:
+            scans.append((aliases.get(match.group(1), match.group(1)), detail))
+    return scans
+
+
+def explain(conn, sql, params=()):
+    """``EXPLAIN QUERY PLAN`` detail lines (empty for statements that cannot be explained)"""
+    try:
+        return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+    except Exception as e:
+        logger.debug(f"Could not explain {normalize_sql(sql)[:80]}: {e}")
+        return []
+
+
+class StatementStats:
+    __slots__ = ('calls', 'total_seconds', 'max_seconds', 'rows', 'plan')
+
+    def __init__(self, plan):
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.rows = 0
+        self.plan = plan
+
+
+class QueryProfiler:
+    """Thread-safe aggregate of statement timings, keyed by normalized shape"""
+
+    def __init__(self, slow_query_ms=SLOW_QUERY_MS):
+        self.slow_query_seconds = slow_query_ms / 1000
+        self._lock = threading.Lock()
+        self._statements = {}
+
+    def knows(self, shape):
+        return shape in self._statements
+
+    def add_shape(self, shape, sql, plan):
+        with self._lock:
+            if shape in self._statements:
+                return
+            self._statements[shape] = StatementStats(plan)
+        for table, detail in full_scans(sql, plan):
+            logger.warning(f"Full scan of {table} ({detail}) in: {shape[:200]}")
+
+    def record(self, shape, params, rows, seconds):
+        with self._lock:
+            stats = self._statements[shape]
+            stats.calls += 1
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.rows += rows
+        if seconds >= self.slow_query_seconds:
+            slow_query_logger.warning(f"{seconds * 1000:.1f} ms, {rows} rows, params={params!r}: {shape}")
+
+    def report(self):
+        """Per-shape aggregates, most expensive first"""
+        with self._lock:
+            rows = [
+                {
+                    'statement': shape,
+                    'calls': stats.calls,
+                    'total_ms': stats.total_seconds * 1000,
+                    'mean_ms': stats.total_seconds * 1000 / stats.calls if stats.calls else 0.0,
+                    'max_ms': stats.max_seconds * 1000,
+                    'rows': stats.rows,
+                    'plan': tuple(stats.plan),
+                }
+                for shape, stats in self._statements.items()
+            ]
+        return sorted(rows, key=lambda row: row['total_ms'], reverse=True)
+
+    def format_report(self, width=100):
+        lines = [f"{'total ms':>10}{'calls':>8}{'mean ms':>10}{'max ms':>10}{'rows':>8}  statement"]
+        for row in self.report():
+            lines.append(f"{row['total_ms']:>10.2f}{row['calls']:>8}{row['mean_ms']:>10.3f}{row['max_ms']:>10.3f}"
+                         f"{row['rows']:>8}  {row['statement'][:width]}")
+            lines.extend(f"{'':>48}{detail}" for detail in row['plan'])
+        return "\n".join(lines)
+
+    def reset(self):
+        with self._lock:
+            self._statements.clear()
+
+
+class TracedCursor:
+    """Cursor proxy that times a statement and counts its rows as they are fetched.
+
+    Rows stream from the underlying cursor; the statement is recorded once its
+    result is exhausted, the cursor closed or reused, or the proxy collected.
+    """
+
+    def __init__(self, cursor, profiler):
+        self._cursor = cursor
+        self._profiler = profiler
+        self._shape = None
+        self._params = ()
+        self._rows = 0
+        self._seconds = 0.0
+
+    def execute(self, sql, params=()):
+        self._finish()
+        shape = normalize_sql(sql)
+        if not self._profiler.knows(shape):
+            self._profiler.add_shape(shape, sql, explain(self._cursor.connection, sql, params))
+
+        started = time.perf_counter()
+        self._cursor.execute(sql, params)
+        self._seconds = time.perf_counter() - started
+        self._shape, self._params, self._rows = shape, params, 0
+        return self
+
+    def _fetch(self, fetch, *args):
+        started = time.perf_counter()
+        result = fetch(*args)
+        self._seconds += time.perf_counter() - started
+        return result
+
+    def fetchone(self):
+        row = self._fetch(self._cursor.fetchone)
+        if row is None:
+            self._finish()
+        else:
+            self._rows += 1
+        return row
+
+    def fetchmany(self, size=None):
+        size = self._cursor.arraysize if size is None else size
+        rows = self._fetch(self._cursor.fetchmany, size)
+        self._rows += len(rows)
+        if len(rows) < size:
+            self._finish()
+        return rows
+
+    def fetchall(self):
+        rows = self._fetch(self._cursor.fetchall)
+        self._rows += len(rows)
+        self._finish()
+        return rows
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        row = self.fetchone()
+        if row is None:
+            raise StopIteration
+        return row
+
+    def _finish(self):
+        if self._shape is not None:
+            shape, self._shape = self._shape, None
+            self._profiler.record(shape, self._params, self._rows, self._seconds)
+
+    def close(self):
+        self._finish()
+        self._cursor.close()
+
+    def __del__(self):
+        if getattr(self, '_shape', None) is not None:
+            self._finish()
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class TracingConnection:
+    """Connection proxy whose ``execute`` and ``cursor()`` hand out traced cursors"""
+
+    def __init__(self, conn, profiler):
+        self._conn = conn
+        self._profiler = profiler
+
+    def cursor(self):
+        return TracedCursor(self._conn.cursor(), self._profiler)
+
+    def execute(self, sql, params=()):
+        return self.cursor().execute(sql, params)
+
+    def __enter__(self):
+        self._conn.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        return self._conn.__exit__(*exc_info)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+_profiler = QueryProfiler()
+_plan_checks = []
+
+
+def get_query_profiler():
+    """Process-wide profiler shared by every traced connection"""
+    return _profiler
+
+
+def trace_connection(conn):
+    return TracingConnection(conn, _profiler) if PROFILING_ENABLED else conn
+
+
+def register_plan_check(sql, params):
+    """Add a hot statement to the startup full-scan check"""
+    _plan_checks.append((sql, params))
+
+
+def check_query_plans(conn, checks=None):
+    """Explain every registered hot statement; returns the watched-table full scans found"""
+    found = []
+    for sql, params in (_plan_checks if checks is None else checks):
+        for table, detail in full_scans(sql, explain(conn, sql, params)):
+            logger.warning(f"Startup plan check: full scan of {table} ({detail}) in: {normalize_sql(sql)[:200]}")
+            found.append((normalize_sql(sql), table, detail))
+    if not found:
+        logger.info(f"Startup plan check passed for {len(_plan_checks if checks is None else checks)} statements")
+    return found
+
+
+def run_startup_plan_check():
+    """Check the hot statements of every loader module against the live database"""
+    # Loader modules register their hot statements when imported
+    import src.db_queries.metrics  # noqa: F401
+    from src.db_queries.connection import get_connection_pool
+
+    with get_connection_pool().connection() as conn:
+        return check_query_plans(conn)
+
+
+def main():
+    from src.db_queries.catalog import get_catalog
+    from src.db_queries.metrics import get_profile_metrics
+    # Under ``python -m`` this file is __main__; the connections trace into the imported module
+    from src.db_queries.profiler import get_query_profiler, run_startup_plan_check
+
+    logging.basicConfig(level=logging.INFO)
+    catalog = get_catalog()
+    for stage_id in catalog.growth_stages:
+        for saas_type_id in [None, *catalog.saas_types]:
+            for industry_id in [None, *catalog.industries]:
+                get_profile_metrics(stage_id, saas_type_id, industry_id)
+
+    print(get_query_profiler().format_report())
+    scans = run_startup_plan_check()
+    print(f"\n{len(scans)} full scans of {', '.join(WATCHED_TABLES)} in hot statements")
+    return 1 if scans else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
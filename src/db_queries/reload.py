@@ -0,0 +1,134 @@
+"""Hot reload of the reference database while the app keeps serving.
+
+A daemon thread polls the build files (SQL scripts and reference data) and the
+database file. When one of them changes, the database is rebuilt into a shadow file and moved into place with
+``build_database`` (under the build lock, so one worker builds and the others
+wait for it). When the file at ``DB_PATH`` carries a new build stamp, the
+process switches to it with ``swap_data_version``: the connection pool is
+reopened and every versioned cache misses on the new key. A failed build is
+logged and the current data stays in service.
+
+    python -m src.db_queries.reload            # rebuild now if the build files changed
+    python -m src.db_queries.reload --watch    # keep watching, log every swap
+"""
+import argparse
+import logging
+import os
+import sys
+import threading
+
+from src.db_queries.connection import DB_PATH, get_data_version, swap_data_version
+from src.db_queries.db_init import BUILD_FILES, build_database, compute_content_hash, read_build_stamp
+from src.utils.infra_helpers import ensure_logging
+
+logger = logging.getLogger(__name__)
+
+# Seconds between polls of the build files and the database file; 0 disables the watcher
+RELOAD_INTERVAL_SECONDS = float(os.environ.get('ATA_DATA_RELOAD_SECONDS', 5))
+
+
+def _file_signature(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+class DataWatcher(threading.Thread):
+    """Rebuild on build file changes and swap to new database builds, one poll at a time"""
+
+    def __init__(self, db_path=DB_PATH, build_files=BUILD_FILES, interval=RELOAD_INTERVAL_SECONDS):
+        super().__init__(name="ata-data-watcher", daemon=True)
+        self.db_path = db_path
+        self.build_files = build_files
+        self.interval = interval
+        self._stopped = threading.Event()
+        # Unknown until the first check, which compares the build files against the artifact
+        self._files = None
+        self._database = None
+
+    def _files_signature(self):
+        return tuple(_file_signature(path) for path in self.build_files)
+
+    def rebuild_if_changed(self):
+        """Build a new artifact when the build files no longer match it; True if one was built"""
+        files = self._files_signature()
+        if files == self._files:
+            return False
+        self._files = files
+        content_hash = compute_content_hash(self.build_files)
+        if read_build_stamp(self.db_path) == content_hash:
+            return False
+        logger.info(f"Reference build files changed, building {content_hash[:12]}")
+        return build_database(self.db_path, content_hash, self.build_files)
+
+    def swap_if_replaced(self):
+        """Serve the build now at ``db_path`` if it differs from the current one; True if swapped"""
+        database = _file_signature(self.db_path)
+        if database == self._database:
+            return False
+        self._database = database
+        content_hash = read_build_stamp(self.db_path)
+        if not content_hash or content_hash == get_data_version():
+            return False
+        swap_data_version(content_hash)
+        return True
+
+    def check(self):
+        try:
+            self.rebuild_if_changed()
+        except Exception as e:
+            logger.error(f"Reference database rebuild failed, still serving {get_data_version()[:12]}: {str(e)}")
+        try:
+            return self.swap_if_replaced()
+        except Exception as e:
+            logger.error(f"Reference database swap failed: {str(e)}")
+            return False
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            self.check()
+
+    def stop(self):
+        self._stopped.set()
+
+
+_watcher = None
+_watcher_lock = threading.Lock()
+
+
+def start_data_watcher():
+    """Start the process-wide watcher once; returns it, or None when disabled"""
+    global _watcher
+    if RELOAD_INTERVAL_SECONDS <= 0:
+        return None
+    if _watcher is None:
+        with _watcher_lock:
+            if _watcher is None:
+                _watcher = DataWatcher()
+                _watcher.start()
+                logger.info(f"Watching reference build files every {RELOAD_INTERVAL_SECONDS:g}s")
+    return _watcher
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rebuild and swap the reference database when its build files change")
+    parser.add_argument('--watch', action='store_true', help='keep polling until interrupted')
+    parser.add_argument('--interval', type=float, default=RELOAD_INTERVAL_SECONDS or 5)
+    args = parser.parse_args(argv)
+    ensure_logging()
+
+    watcher = DataWatcher(interval=args.interval)
+    watcher.check()
+    print(f"serving {get_data_version()[:12] or 'nothing'} from {DB_PATH}")
+    if args.watch:
+        try:
+            watcher.run()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,21 +1,8 @@
-from src.db_queries.connection import get_db_connection
-import streamlit as st
+from src.db_queries.catalog import get_catalog
+from src.utils.telemetry import track_loader
 
 
-@st.cache_data(ttl=3600)
+@track_loader
 def get_saas_types():
-    conn = get_db_connection()
-    try:
-        with conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT id, type_name FROM saas_types")
-            # Create dictionary with ID as key and remaining columns as value
-            saas_types_dict = {
-                row['id']: {
-                    'type_name': row['type_name'],
-                }
-                for row in cursor.fetchall()
-            }
-            return saas_types_dict
-    finally:
-        pass
+    """Return SaaS types keyed by ID (read-only view over the shared catalog)"""
+    return get_catalog().saas_types
@@ -0,0 +1,125 @@
+"""Ranked full-text search over metrics and recommendations.
+
+Queries run against the ``search_index`` FTS5 table built into the reference
+database (``12_search_index.sql``): every word must match, the last one as a
+prefix, and results come back in BM25 order with name matches weighted highest.
+
+    python -m src.db_queries.search churn retention        # print results and timings
+    python -m src.db_queries.search --scale 200 churn      # same against a 200x larger library
+"""
+import argparse
+import logging
+import re
+import sqlite3
+import sys
+import time
+from typing import NamedTuple
+
+from src.db_queries.connection import get_db_connection
+from src.utils.telemetry import track_loader
+
+logger = logging.getLogger(__name__)
+
+SEARCH_LIMIT = 20
+SNIPPET_TOKENS = 16
+_TERM = re.compile(r'\w+', re.UNICODE)
+
+SEARCH_SQL = f"""
+    SELECT kind,
+           metric_id,
+           pillar_id,
+           metric_name,
+           snippet(search_index, 4, '**', '**', '…', {SNIPPET_TOKENS}) AS snippet,
+           rank
+    FROM search_index
+    WHERE search_index MATCH ?
+    ORDER BY rank
+    LIMIT ?
+    """
+
+
+class SearchResult(NamedTuple):
+    kind: str
+    metric_id: int
+    pillar_id: int
+    metric_name: str
+    snippet: str
+    score: float
+
+
+def build_match_query(text):
+    """FTS5 query for free text: every term quoted, the last one a prefix; None if no terms"""
+    terms = _TERM.findall(text or "")
+    if not terms:
+        return None
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += '*'
+    return " ".join(quoted)
+
+
+def run_search(conn, text, limit=SEARCH_LIMIT):
+    match = build_match_query(text)
+    if match is None:
+        return []
+    return [
+        SearchResult(row[0], row[1], row[2], row[3], row[4], -row[5])
+        for row in conn.execute(SEARCH_SQL, (match, limit))
+    ]
+
+
+@track_loader
+def search(text, limit=SEARCH_LIMIT):
+    """Best matching metrics and recommendations for free text, best first"""
+    try:
+        with get_db_connection() as conn:
+            return run_search(conn, text, limit)
+    except sqlite3.Error as e:
+        logger.error(f"Search failed for {text!r}: {e}")
+        return []
+
+
+def scaled_copy(conn, scale):
+    """In-memory copy of the database with every indexed row repeated ``scale`` times"""
+    copy = sqlite3.connect(':memory:')
+    conn.backup(copy)
+    rows = copy.execute("SELECT kind, metric_id, pillar_id, metric_name, body FROM search_index").fetchall()
+    with copy:
+        copy.executemany(
+            "INSERT INTO search_index (kind, metric_id, pillar_id, metric_name, body) VALUES (?, ?, ?, ?, ?)",
+            [(kind, metric_id, pillar_id, metric_name, f"{body} {n}")
+             for n in range(2, scale + 1) for kind, metric_id, pillar_id, metric_name, body in rows])
+        copy.execute("INSERT INTO search_index (search_index) VALUES ('optimize')")
+    return copy
+
+
+def main(argv=None):
+    from src.db_queries.connection import DB_PATH, open_read_only_connection
+
+    parser = argparse.ArgumentParser(description="Run search queries and time them")
+    parser.add_argument('query', nargs='+')
+    parser.add_argument('--scale', type=int, default=1, help='repeat the library this many times in memory')
+    parser.add_argument('--repeat', type=int, default=1000, help='timed runs of the query')
+    parser.add_argument('--limit', type=int, default=SEARCH_LIMIT)
+    args = parser.parse_args(argv)
+
+    conn = open_read_only_connection(DB_PATH, in_memory=False)
+    if args.scale > 1:
+        conn = scaled_copy(conn, args.scale)
+    rows = conn.execute("SELECT count(*) FROM search_index").fetchone()[0]
+
+    text = " ".join(args.query)
+    results = run_search(conn, text, args.limit)
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        run_search(conn, text, args.limit)
+    elapsed = (time.perf_counter() - started) / args.repeat
+
+    for result in results:
+        print(f"{result.score:8.2f}  {result.kind:15} {result.metric_name}: {result.snippet}")
+    print(f"\n{len(results)} results for {build_match_query(text)!r} over {rows} rows, "
+          f"{elapsed * 1000:.3f} ms per query")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,355 @@
+"""Memory-mapped Arrow snapshot of the reference catalog.
+
+Each database build exports the catalog tables and the resolved metric ranges
+once, as uncompressed Arrow IPC files under ``data/catalog/<content hash>-v<format>/``.
+Workers memory-map those files read-only and answer lookups from the mapped
+columns: a record is built only when it is read, so the catalog's pages are
+shared through the OS page cache by every process on the host, and a new worker
+warms its catalog without opening a SQLite connection.
+
+    python -m src.db_queries.snapshot   # write the snapshot of the current artifact and check it against SQLite
+"""
+import logging
+import os
+import re
+import shutil
+import sys
+import tempfile
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+import streamlit as st
+
+from src.db_queries.catalog import CATALOG_QUERIES, CATALOG_RECORDS, Catalog
+from src.db_queries.connection import DB_PATH, versioned
+from src.utils.telemetry import cache_miss, track_loader
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_ENABLED = os.environ.get('ATA_CATALOG_SNAPSHOT', '1').lower() in ('1', 'true', 'yes')
+# Snapshots live next to the database artifact they were exported from
+SNAPSHOT_DIR_NAME = 'catalog'
+# Bumped when the layout the readers rely on changes (e.g. sort orders); older snapshots are rewritten
+SNAPSHOT_FORMAT = 3
+
+# Every profile's ranges are contiguous: (stage, saas type, industry) is the sort key
+RESOLVED_RANGES_SQL = """
+    SELECT growth_stage_id,
+           saas_type_id,
+           industry_id,
+           architecture_pillar_id,
+           metric_id,
+           min_value,
+           max_value,
+           lo_range_value,
+           hi_range_value
+    FROM resolved_metric_ranges
+    ORDER BY growth_stage_id, saas_type_id, industry_id, architecture_pillar_id, association_id
+    """
+SNAPSHOT_QUERIES = {**CATALOG_QUERIES, 'resolved_metric_ranges': RESOLVED_RANGES_SQL}
+PROFILE_KEY = ('growth_stage_id', 'saas_type_id', 'industry_id')
+
+
+def snapshot_path(content_hash, db_path=DB_PATH):
+    return os.path.join(os.path.dirname(db_path) or '.', SNAPSHOT_DIR_NAME, f"{content_hash}-v{SNAPSHOT_FORMAT}")
+
+
+_SOURCE_TABLE = re.compile(r'\bFROM\s+(\w+)', re.I)
+
+
+def arrow_type(declared):
+    """Arrow type of a SQLite declared column type, by SQLite's affinity rules"""
+    import pyarrow as pa
+
+    declared = declared.upper()
+    if 'INT' in declared:
+        return pa.int64()
+    if any(name in declared for name in ('CHAR', 'CLOB', 'TEXT')):
+        return pa.string()
+    # REAL and NUMERIC affinities (DECIMAL ranges hold whole and fractional values alike)
+    return pa.float64()
+
+
+def export_table(conn, sql):
+    """One single-table query as an Arrow table, typed by the table's declared column types.
+
+    SQLite returns a DECIMAL value as int or float row by row; a declared type keeps
+    every value of a column the same type, whatever the rows of this build hold.
+    """
+    import pyarrow as pa
+
+    declared = {row[1]: row[2] for row in conn.execute(f"PRAGMA table_info({_SOURCE_TABLE.search(sql).group(1)})")}
+    cursor = conn.execute(sql)
+    names = [column[0] for column in cursor.description]
+    columns = list(zip(*cursor.fetchall())) or [()] * len(names)
+    schema = pa.schema([(name, arrow_type(declared[name])) for name in names])
+    return pa.table({name: list(values) for name, values in zip(names, columns)}, schema=schema)
+
+
+def write_snapshot(conn, content_hash, db_path=DB_PATH):
+    """Export every snapshot table of a build and move the directory into place.
+
+    Directories are named by content hash and never modified once written, so a
+    worker still mapping an older build keeps valid pages until it exits.
+    """
+    import pyarrow as pa
+
+    target = snapshot_path(content_hash, db_path)
+    if os.path.isdir(target):
+        return False
+
+    snapshot_dir = os.path.dirname(target)
+    os.makedirs(snapshot_dir, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix='.build-', dir=snapshot_dir)
+    try:
+        for name, sql in SNAPSHOT_QUERIES.items():
+            table = export_table(conn, sql)
+            with pa.OSFile(os.path.join(tmp_dir, f"{name}.arrow"), 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+        os.chmod(tmp_dir, 0o755)
+        os.rename(tmp_dir, target)
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    for entry in os.listdir(snapshot_dir):
+        if entry != os.path.basename(target):
+            shutil.rmtree(os.path.join(snapshot_dir, entry), ignore_errors=True)
+    logger.info(f"Wrote catalog snapshot {content_hash[:12]}")
+    return True
+
+
+def mapped_column(table, name):
+    """A column as one Arrow array; a single-chunk column (as written here) stays on the mapped pages"""
+    column = table[name]
+    return column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+
+
+def key_view(array):
+    """Zero-copy, read-only NumPy view of an int64 key column.
+
+    Read straight from the data buffer: ``Array.to_numpy`` would import pandas on first use.
+    """
+    import pyarrow as pa
+
+    if array.null_count or array.type != pa.int64():
+        raise ValueError(f"Key column of type {array.type} cannot be viewed as int64")
+    return np.frombuffer(array.buffers()[1], dtype=np.int64, count=len(array), offset=array.offset * 8)
+
+
+class ArrowRows(Sequence):
+    """Read-only sequence over a mapped table; a row is built when it is read"""
+
+    def __init__(self, table, make):
+        self._columns = [mapped_column(table, name) for name in table.column_names]
+        self._make = make
+        self._length = table.num_rows
+
+    def _row(self, position):
+        return self._make(tuple(column[position].as_py() for column in self._columns))
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self._row(i) for i in range(*position.indices(self._length))]
+        if position < 0:
+            position += self._length
+        if not 0 <= position < self._length:
+            raise IndexError(position)
+        return self._row(position)
+
+    def take(self, positions):
+        """Records at several positions, read column by column"""
+        import pyarrow as pa
+
+        indices = pa.array(positions, type=pa.int64())
+        return [self._make(row) for row in zip(*(column.take(indices).to_pylist() for column in self._columns))]
+
+    def __len__(self):
+        return self._length
+
+
+class ArrowRecords(Mapping):
+    """Read-only mapping over a mapped table keyed by its first column, in export order"""
+
+    def __init__(self, table, make):
+        self._rows = ArrowRows(table, make)
+        self._keys = key_view(mapped_column(table, table.column_names[0]))
+        # Positions sorting the keys: a few bytes per row, searched on every lookup
+        self._order = np.argsort(self._keys, kind='stable')
+        self._sorted_keys = self._keys[self._order]
+
+    def _position(self, key):
+        if not isinstance(key, (int, np.integer)):
+            raise KeyError(key)
+        i = np.searchsorted(self._sorted_keys, key)
+        if i == len(self._sorted_keys) or self._sorted_keys[i] != key:
+            raise KeyError(key)
+        return int(self._order[i])
+
+    def __getitem__(self, key):
+        return self._rows[self._position(key)]
+
+    def get_many(self, keys):
+        """Records of several keys in one pass (None for a missing key)"""
+        keys = np.asarray(keys, dtype=np.int64)
+        if not len(self._sorted_keys):
+            return [None] * len(keys)
+        i = np.minimum(np.searchsorted(self._sorted_keys, keys), len(self._sorted_keys) - 1)
+        found = self._sorted_keys[i] == keys
+        records = iter(self._rows.take(self._order[i[found]].tolist()))
+        return [next(records) if hit else None for hit in found.tolist()]
+
+    def __contains__(self, key):
+        try:
+            self._position(key)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        return iter(self._keys.tolist())
+
+    def __len__(self):
+        return len(self._keys)
+
+
+class ArrowGroups(Mapping):
+    """Read-only {first column: tuple of second column} over a table sorted by its first column"""
+
+    def __init__(self, table):
+        self._keys = key_view(mapped_column(table, table.column_names[0]))
+        self._values = mapped_column(table, table.column_names[1])
+        if np.any(self._keys[1:] < self._keys[:-1]):
+            raise ValueError(f"{table.column_names[0]} is not sorted")
+        self._group_keys, self._starts = np.unique(self._keys, return_index=True)
+        self._ends = np.append(self._starts[1:], len(self._keys))
+
+    def __getitem__(self, key):
+        if not isinstance(key, (int, np.integer)):
+            raise KeyError(key)
+        i = np.searchsorted(self._group_keys, key)
+        if i == len(self._group_keys) or self._group_keys[i] != key:
+            raise KeyError(key)
+        start = int(self._starts[i])
+        return tuple(self._values.slice(start, int(self._ends[i]) - start).to_pylist())
+
+    def __iter__(self):
+        return iter(self._group_keys.tolist())
+
+    def __len__(self):
+        return len(self._group_keys)
+
+
+class CatalogSnapshot:
+    """Read-only tables of one snapshot, backed by memory-mapped Arrow files"""
+
+    def __init__(self, path):
+        import pyarrow as pa
+
+        self.path = path
+        self.tables = {
+            name: pa.ipc.open_file(pa.memory_map(os.path.join(path, f"{name}.arrow"), 'r')).read_all()
+            for name in SNAPSHOT_QUERIES
+        }
+        self.records = {
+            name: ArrowRecords(self.tables[name], make)
+            for name, make in CATALOG_RECORDS.items() if name != 'industry_mappings'
+        }
+        ranges = self.tables['resolved_metric_ranges']
+        self._profile_keys = [key_view(mapped_column(ranges, column)) for column in PROFILE_KEY]
+        self._range_columns = ranges.column_names[len(PROFILE_KEY):]
+
+    def catalog(self):
+        """Catalog whose tables are views over the mapped columns"""
+        tables = self.tables
+        return Catalog(
+            industry_mappings=ArrowRows(tables['industry_mappings'], CATALOG_RECORDS['industry_mappings']),
+            recommendations=ArrowGroups(tables['recommendations']),
+            **self.records,
+        )
+
+    def profile_ranges(self, growth_stage_id, saas_type_id, industry_id):
+        """(pillar id, metric id, min, max, lo, hi) rows of one profile, in association order.
+
+        The ranges are sorted by profile, so each key column narrows the run by binary search.
+        """
+        first, last = 0, len(self._profile_keys[0])
+        for keys, value in zip(self._profile_keys, (growth_stage_id, saas_type_id, industry_id)):
+            run = keys[first:last]
+            first, last = first + np.searchsorted(run, value, 'left'), first + np.searchsorted(run, value, 'right')
+        if first == last:
+            return []
+        ranges = self.tables['resolved_metric_ranges'].slice(int(first), int(last - first))
+        return list(zip(*(ranges[column].to_pylist() for column in self._range_columns)))
+
+    def profile_metrics(self, growth_stage_id, saas_type_id, industry_id):
+        """(pillar id, Metric, metric type name, min, max, lo, hi) rows of one profile, in association order.
+
+        Rows whose metric or metric type is missing are dropped, as the inner joins of the SQL path do.
+        """
+        ranges = self.profile_ranges(growth_stage_id, saas_type_id, industry_id)
+        metrics = self.records['metrics'].get_many([row[1] for row in ranges])
+        type_names = self.records['metric_types'].get_many(
+            [metric.metric_type_id if metric is not None else 0 for metric in metrics])
+        return [
+            (pillar_id, metric, type_name, *values)
+            for (pillar_id, _, *values), metric, type_name in zip(ranges, metrics, type_names)
+            if metric is not None and type_name is not None
+        ]
+
+
+@track_loader
+@versioned
+@st.cache_resource(max_entries=2)
+@cache_miss
+def get_catalog_snapshot(data_version):
+    """Snapshot of the database build being served, or None to read from SQLite"""
+    if not SNAPSHOT_ENABLED:
+        return None
+    content_hash = data_version
+    if not content_hash or not os.path.isdir(snapshot_path(content_hash)):
+        logger.warning("No catalog snapshot for the current database build, reading from SQLite")
+        return None
+    try:
+        return CatalogSnapshot(snapshot_path(content_hash))
+    except Exception as e:
+        logger.error(f"Catalog snapshot {content_hash[:12]} unreadable, reading from SQLite: {str(e)}")
+        return None
+
+
+def main():
+    from src.db_queries.connection import open_read_only_connection
+    from src.db_queries.db_init import read_build_stamp
+    from src.db_queries.metrics import check_profile_paths
+
+    logging.basicConfig(level=logging.INFO)
+    content_hash = read_build_stamp(DB_PATH)
+    if content_hash is None:
+        print(f"{DB_PATH} is missing or unstamped; build it with python -m src.db_queries.db_init")
+        return 1
+    conn = open_read_only_connection(DB_PATH, in_memory=False)
+    try:
+        written = write_snapshot(conn, content_hash)
+        path = snapshot_path(content_hash)
+        snapshot = CatalogSnapshot(path)
+        # Every served profile, plus the unset (None) and "any" (0) ids the wizard can pass
+        stages = list(snapshot.records['growth_stages'])
+        saas_types = [None, 0, *snapshot.records['saas_types']]
+        industries = [None, 0, *snapshot.records['industries']]
+        profiles = [(stage_id, saas_type_id, industry_id)
+                    for stage_id in [None, 0, *stages] for saas_type_id in saas_types for industry_id in industries]
+        mismatches = check_profile_paths(conn, snapshot, profiles)
+    finally:
+        conn.close()
+
+    size = sum(os.path.getsize(os.path.join(path, entry)) for entry in os.listdir(path))
+    print(f"{'wrote' if written else 'up to date'}: {path} ({size / 1024:.1f} KiB)")
+    print(f"{len(profiles) - len(mismatches)}/{len(profiles)} profiles identical from the snapshot and SQLite")
+    for profile in mismatches[:10]:
+        print(f"  differs: {profile}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
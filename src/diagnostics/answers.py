@@ -0,0 +1,138 @@
+"""Compact per-session answer storage.
+
+A session keeps only a float vector of answers indexed by metric id (NaN means
+unanswered) next to its profile ids. Names, units, links and ranges are shared by
+every session and are always resolved from the catalog / profile metrics.
+
+    python -m src.diagnostics.answers   # bytes per session for the largest profile
+"""
+import math
+import sys
+from array import array
+
+import numpy as np
+
+from src.db_queries.catalog import get_catalog
+
+ANSWERS_KEY = 'answers'
+
+
+class SessionAnswers:
+    """Answers indexed by metric id, backed by a single ``array('d')``"""
+    __slots__ = ('values',)
+
+    def __init__(self, size=0):
+        self.values = array('d', [math.nan]) * size
+
+    def _grow(self, size):
+        if size > len(self.values):
+            self.values.extend([math.nan] * (size - len(self.values)))
+
+    def get(self, metric_id, default=None):
+        if 0 <= metric_id < len(self.values) and not math.isnan(self.values[metric_id]):
+            return self.values[metric_id]
+        return default
+
+    def set(self, metric_id, value):
+        self._grow(metric_id + 1)
+        self.values[metric_id] = float(value)
+
+    def copy(self):
+        answers = SessionAnswers()
+        answers.values = array('d', self.values)
+        return answers
+
+    def __contains__(self, metric_id):
+        return self.get(metric_id) is not None
+
+    def items(self):
+        """(metric_id, value) for every answered metric"""
+        return [(metric_id, value) for metric_id, value in enumerate(self.values) if not math.isnan(value)]
+
+    def take(self, metric_ids):
+        """Answers for ``metric_ids`` as a float array, NaN where unanswered"""
+        metric_ids = np.asarray(metric_ids, dtype=np.int64)
+        self._grow(int(metric_ids.max()) + 1 if metric_ids.size else 0)
+        return np.frombuffer(self.values, dtype=float)[metric_ids]
+
+    @property
+    def nbytes(self):
+        return sys.getsizeof(self) + sys.getsizeof(self.values)
+
+
+def get_session_answers(session_state, create=True):
+    """The session's answer vector, sized to the catalog; an empty one if ``create`` is off"""
+    answers = session_state.get(ANSWERS_KEY)
+    if answers is None:
+        answers = SessionAnswers(max(get_catalog().metrics, default=0) + 1)
+        if create:
+            session_state[ANSWERS_KEY] = answers
+    return answers
+
+
+def deep_sizeof(value, seen=None):
+    """Approximate retained bytes of a session value (containers are followed)"""
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    if isinstance(value, SessionAnswers):
+        return value.nbytes
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in value)
+    return size
+
+
+def session_footprint(session_state):
+    """(total bytes, {key: bytes}) retained by a session's state"""
+    per_key = {key: deep_sizeof(key) + deep_sizeof(session_state[key]) for key in list(session_state.keys())}
+    return sum(per_key.values()), per_key
+
+
+def main():
+    from src.db_queries.metrics import get_profile_metrics
+
+    catalog = get_catalog()
+    profile, metrics = max(
+        (((stage_id, saas_type_id, None), get_profile_metrics(stage_id, saas_type_id))
+         for stage_id in catalog.growth_stages for saas_type_id in [None, *catalog.saas_types]),
+        key=lambda item: sum(len(pillar) for pillar in item[1].values()))
+
+    # Layout before this module: a metric_info dict per metric plus one key per answer
+    legacy = {'metrics_cache': {}}
+    for pillar_id, pillar in metrics.items():
+        for metric_id, metric in pillar.items():
+            key = f"metric_{pillar_id}_{metric_id}"
+            legacy[key] = float(metric['lo_range_value'])
+            legacy['metrics_cache'][metric['metric_name']] = {
+                "persistent_key": key,
+                "pillar_id": pillar_id,
+                "pillar_name": catalog.pillars[pillar_id].pillar_name,
+                "metric_id": metric_id,
+                "unit": metric['units'],
+                "target_low_range": float(metric['lo_range_value']),
+                "target_high_range": float(metric['hi_range_value']),
+                "slider_format": catalog.unit_format(metric['units']).slider_format,
+                "blog_link": metric['blog_link'],
+                "video_link": metric['video_link'],
+            }
+
+    compact = {}
+    answers = get_session_answers(compact)
+    for pillar in metrics.values():
+        for metric_id, metric in pillar.items():
+            answers.set(metric_id, float(metric['lo_range_value']))
+
+    count = sum(len(pillar) for pillar in metrics.values())
+    print(f"profile {profile}: {count} answered metrics")
+    print(f"legacy  {session_footprint(legacy)[0]:>7} bytes per session")
+    print(f"compact {session_footprint(compact)[0]:>7} bytes per session")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""Headless, vectorized diagnostic engine for scoring many companies at once.
+
+Input is a CSV or Parquet file with one row per company:
+
+    company_id        optional, defaults to the row number
+    annual_revenue    ARR in $M (or ``mrr`` in $K, converted like the profile page)
+    saas_type_id      optional, empty/0 = All SaaS Types
+    industry_id       optional, empty/0 = All Industries
+    metric_<p>_<m>    answer for metric <m> (the session key format), or metric_<m>
+
+Each row resolves its growth stage like ``determine_company_stage`` and its metric
+ranges from ``resolved_metric_ranges`` (the table behind ``get_metrics``), then
+every comparison runs as one NumPy operation over the (companies x metrics) matrix.
+
+    python -m src.diagnostics.batch companies.csv --out-dir results/
+"""
+import argparse
+import logging
+import os
+import re
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.db_queries.connection import DB_PATH, open_read_only_connection
+
+logger = logging.getLogger(__name__)
+
+ANSWER_COLUMN = re.compile(r'^metric_(?:(\d+)_)?(\d+)$')
+
+
+class BatchReference:
+    """Dense NumPy view of the reference data needed to score profiles.
+
+    Range arrays are indexed ``[stage, saas_type, industry, metric]`` where index 0
+    of the SaaS type / industry axes means "unspecified", matching the resolved table.
+    """
+
+    def __init__(self, conn):
+        cursor = conn.cursor()
+
+        stages = cursor.execute(
+            "SELECT id, growth_stage_name, low_range, high_range FROM growth_stages ORDER BY id").fetchall()
+        self.stage_ids = np.array([row[0] for row in stages], dtype=np.int64)
+        self.stage_names = {row[0]: row[1] for row in stages}
+        self.stage_low = np.array([float(row[2]) for row in stages])
+        self.stage_high = np.array([float(row[3]) for row in stages])
+
+        self.saas_type_ids = [0] + [row[0] for row in cursor.execute("SELECT id FROM saas_types ORDER BY id")]
+        self.industry_ids = [0] + [row[0] for row in cursor.execute("SELECT id FROM industries ORDER BY id")]
+
+        metrics = cursor.execute("SELECT id, metric_name FROM metrics ORDER BY id").fetchall()
+        self.metric_ids = np.array([row[0] for row in metrics], dtype=np.int64)
+        self.metric_names = [row[1] for row in metrics]
+        self.metric_index = {metric_id: i for i, metric_id in enumerate(self.metric_ids.tolist())}
+
+        self._stage_index = {stage_id: i for i, stage_id in enumerate(self.stage_ids.tolist())}
+        self._saas_index = {saas_id: i for i, saas_id in enumerate(self.saas_type_ids)}
+        self._industry_index = {industry_id: i for i, industry_id in enumerate(self.industry_ids)}
+
+        shape = (len(self.stage_ids), len(self.saas_type_ids), len(self.industry_ids), len(self.metric_ids))
+        self.min_value = np.full(shape, np.nan)
+        self.max_value = np.full(shape, np.nan)
+        self.lo_value = np.full(shape, np.nan)
+        self.hi_value = np.full(shape, np.nan)
+        self.metric_pillar = np.zeros(len(self.metric_ids), dtype=np.int64)
+
+        for row in cursor.execute("""
+                                  SELECT growth_stage_id, saas_type_id, industry_id, architecture_pillar_id, metric_id,
+                                         min_value, max_value, lo_range_value, hi_range_value
+                                  FROM resolved_metric_ranges
+                                  """):
+            index = (self._stage_index[row[0]], self._saas_index[row[1]], self._industry_index[row[2]],
+                     self.metric_index[row[4]])
+            self.min_value[index] = row[5]
+            self.max_value[index] = row[6]
+            self.lo_value[index] = row[7]
+            self.hi_value[index] = row[8]
+            self.metric_pillar[index[3]] = row[3]
+
+        self.recommendations = {}
+        # Same order as the catalog, so batch and interactive reports list recommendations alike
+        for metric_id, recommendation in cursor.execute(
+                "SELECT metric_id, recommendation FROM recommendations ORDER BY metric_id, rowid"):
+            self.recommendations.setdefault(metric_id, []).append(recommendation)
+
+    def stage_positions(self, revenue):
+        """Index of the first growth stage whose band contains each revenue, -1 if none"""
+        revenue = np.asarray(revenue, dtype=float)[:, None]
+        matches = (self.stage_low[None, :] <= revenue) & (revenue <= self.stage_high[None, :])
+        return np.where(matches.any(axis=1), matches.argmax(axis=1), -1)
+
+    def profile_positions(self, ids, axis_ids):
+        """Map optional SaaS type / industry ids onto their axis positions (unknown -> 0)"""
+        ids = pd.to_numeric(pd.Series(ids), errors='coerce').fillna(0).to_numpy(dtype=np.int64)
+        table = np.zeros(max(axis_ids) + 1, dtype=np.int64)
+        table[axis_ids] = np.arange(len(axis_ids))
+        known = (ids >= 0) & (ids < len(table))
+        return np.where(known, table[np.where(known, ids, 0)], 0)
+
+
+def load_batch_reference(db_path=DB_PATH):
+    conn = open_read_only_connection(db_path, in_memory=False)
+    try:
+        return BatchReference(conn)
+    finally:
+        conn.close()
+
+
+def read_profiles(path):
+    """Read company profiles and answers from CSV or Parquet"""
+    if path.lower().endswith(('.parquet', '.pq')):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+def answer_matrix(frame, reference):
+    """(companies x metrics) float matrix of answers, NaN where unanswered"""
+    answers = np.full((len(frame), len(reference.metric_ids)), np.nan)
+    for column in frame.columns:
+        match = ANSWER_COLUMN.match(str(column))
+        if not match:
+            continue
+        metric_position = reference.metric_index.get(int(match.group(2)))
+        if metric_position is None:
+            logger.warning(f"Ignoring answers for unknown metric column {column}")
+            continue
+        answers[:, metric_position] = pd.to_numeric(frame[column], errors='coerce').to_numpy(dtype=float)
+    return answers
+
+
+def score_profiles(frame, reference):
+    """Score every company in ``frame``.
+
+    Returns a ``(summary, flags)`` pair: one summary row per company, and one flag
+    row per out-of-range metric carrying the recommendations the report would show.
+    """
+    frame = frame.reset_index(drop=True)
+    company_ids = frame['company_id'] if 'company_id' in frame else pd.Series(np.arange(len(frame)))
+
+    if 'annual_revenue' in frame:
+        revenue = pd.to_numeric(frame['annual_revenue'], errors='coerce').to_numpy(dtype=float)
+    elif 'mrr' in frame:
+        revenue = pd.to_numeric(frame['mrr'], errors='coerce').to_numpy(dtype=float) * 12 / 1000
+    else:
+        raise ValueError("Input needs an 'annual_revenue' ($M) or 'mrr' ($K) column")
+
+    stage_pos = reference.stage_positions(revenue)
+    unspecified = np.zeros(len(frame), dtype=np.int64)
+    saas_pos = reference.profile_positions(frame.get('saas_type_id', unspecified), reference.saas_type_ids)
+    industry_pos = reference.profile_positions(frame.get('industry_id', unspecified), reference.industry_ids)
+
+    # Gather each company's range vectors in one fancy-indexing step; companies without
+    # a stage get an all-NaN row so nothing is applicable to them.
+    safe_stage = np.where(stage_pos >= 0, stage_pos, 0)
+    lo = reference.lo_value[safe_stage, saas_pos, industry_pos]
+    hi = reference.hi_value[safe_stage, saas_pos, industry_pos]
+    lo[stage_pos < 0] = np.nan
+    hi[stage_pos < 0] = np.nan
+
+    answers = answer_matrix(frame, reference)
+    applicable = ~np.isnan(lo)
+    answered = applicable & ~np.isnan(answers)
+    with np.errstate(invalid='ignore'):
+        below = answered & (answers < lo)
+        above = answered & (answers > hi)
+    out_of_range = below | above
+
+    stage_ids = np.where(stage_pos >= 0, reference.stage_ids[safe_stage], -1)
+    summary = pd.DataFrame({
+        'company_id': company_ids.to_numpy(),
+        'annual_revenue': revenue,
+        'growth_stage_id': pd.Series(stage_ids).where(stage_ids >= 0).astype('Int64'),
+        'growth_stage_name': [reference.stage_names.get(int(s), 'Undetermined') for s in stage_ids],
+        'metrics_applicable': applicable.sum(axis=1),
+        'metrics_answered': answered.sum(axis=1),
+        'metrics_out_of_range': out_of_range.sum(axis=1),
+    })
+
+    rows, cols = np.nonzero(out_of_range)
+    flag_metric_ids = reference.metric_ids[cols]
+    flags = pd.DataFrame({
+        'company_id': company_ids.to_numpy()[rows],
+        'pillar_id': reference.metric_pillar[cols],
+        'metric_id': flag_metric_ids,
+        'metric_name': np.asarray(reference.metric_names, dtype=object)[cols],
+        'value': answers[rows, cols],
+        'target_low': lo[rows, cols],
+        'target_high': hi[rows, cols],
+        'direction': np.where(below[rows, cols], 'below', 'above'),
+    })
+    unique_ids, inverse = np.unique(flag_metric_ids, return_inverse=True)
+    joined = np.asarray(['\n'.join(reference.recommendations.get(int(m), [])) for m in unique_ids], dtype=object)
+    flags['recommendations'] = joined[inverse] if len(flags) else pd.Series(dtype=object)
+
+    return summary, flags
+
+
+def write_frame(frame, path):
+    if path.lower().endswith(('.parquet', '.pq')):
+        frame.to_parquet(path, index=False)
+    else:
+        frame.to_csv(path, index=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score a portfolio of companies without the Streamlit wizard")
+    parser.add_argument('input', help='CSV or Parquet file of company profiles and answers')
+    parser.add_argument('--out-dir', default='results')
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='csv')
+    parser.add_argument('--db-path', default=DB_PATH)
+    args = parser.parse_args(argv)
+
+    reference = load_batch_reference(args.db_path)
+    frame = read_profiles(args.input)
+
+    started = time.perf_counter()
+    summary, flags = score_profiles(frame, reference)
+    elapsed = time.perf_counter() - started
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    write_frame(summary, os.path.join(args.out_dir, f"summary.{args.format}"))
+    write_frame(flags, os.path.join(args.out_dir, f"flags.{args.format}"))
+    print(f"Scored {len(summary)} companies ({len(flags)} out-of-range metrics) in {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
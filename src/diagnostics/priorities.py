@@ -0,0 +1,114 @@
+"""Severity ranking of out-of-range metrics and their recommended actions.
+
+Severity is the normalized deviation from the target range (``1 - score`` from
+``normalize_answers``: 0 inside the range, 1 at the slider's min/max), weighted
+by pillar and metric type. It is computed for every metric in one NumPy pass;
+only the ``k`` most severe metrics and actions are then selected with a heap,
+so the cost of what the report renders first does not grow with the misses.
+
+    python -m src.diagnostics.priorities --metrics 5000   # selection cost at scale
+"""
+import argparse
+import heapq
+import os
+import sys
+import time
+
+import numpy as np
+
+
+def parse_weights(spec):
+    """``"1:1.2,3:0.8"`` -> {1: 1.2, 3: 0.8}"""
+    weights = {}
+    for part in filter(None, spec.split(',')):
+        key, _, weight = part.partition(':')
+        weights[int(key)] = float(weight)
+    return weights
+
+
+# Severity multipliers by pillar id / metric type id (unlisted ids weigh 1.0).
+# Revenue and product misses come first; measured inputs outrank derived figures.
+PILLAR_WEIGHTS = parse_weights(os.environ.get('ATA_PILLAR_WEIGHTS', '1:1.2,2:1.1,3:1.0,4:1.0'))
+METRIC_TYPE_WEIGHTS = parse_weights(os.environ.get('ATA_METRIC_TYPE_WEIGHTS', '1:1.0,2:0.9,3:0.8'))
+
+TOP_METRICS = int(os.environ.get('ATA_REPORT_TOP_METRICS', 5))
+TOP_ACTIONS = int(os.environ.get('ATA_REPORT_TOP_ACTIONS', 5))
+# Each further recommendation of the same metric counts for this fraction of the previous one
+ACTION_DECAY = 0.6
+
+
+def weight_vector(ids, weights):
+    """Per-element weight of an id array, through a dense lookup table"""
+    ids = np.asarray(ids, dtype=np.int64)
+    table = np.ones(max([*weights, int(ids.max()) if ids.size else 0]) + 1)
+    table[list(weights)] = list(weights.values())
+    return table[ids]
+
+
+def severity_scores(metric_scores, pillar_ids, metric_type_ids, pillar_weights=None, type_weights=None):
+    """Weighted deviation severity per metric; 0 for in-range and unanswered metrics"""
+    pillar_weights = PILLAR_WEIGHTS if pillar_weights is None else pillar_weights
+    type_weights = METRIC_TYPE_WEIGHTS if type_weights is None else type_weights
+    deviation = np.nan_to_num(1.0 - np.asarray(metric_scores, dtype=float), nan=0.0)
+    return deviation * weight_vector(pillar_ids, pillar_weights) * weight_vector(metric_type_ids, type_weights)
+
+
+def misses(severities, keys):
+    """(severity, key) of every metric with a positive severity, in input order"""
+    severities = np.asarray(severities)
+    positions = np.flatnonzero(severities > 0)
+    return [(severity, keys[position]) for severity, position in zip(severities[positions].tolist(), positions.tolist())]
+
+
+def top_k(candidates, k):
+    """The ``k`` most severe of (severity, key) pairs, most severe first; ties keep input order"""
+    ranked = heapq.nlargest(k, ((severity, -position, key) for position, (severity, key) in enumerate(candidates)))
+    return [(severity, key) for severity, _, key in ranked]
+
+
+def top_actions(candidates, recommendations, k, decay=ACTION_DECAY):
+    """The ``k`` strongest (weight, key, action) over every recommendation of ``candidates``.
+
+    ``candidates`` is (severity, key) pairs and ``recommendations`` maps a key to its
+    actions; an action weighs its metric's severity times ``decay`` per position.
+    """
+    ranked = heapq.nlargest(k, (
+        (severity * decay ** index, -position, -index, key, action)
+        for position, (severity, key) in enumerate(candidates)
+        for index, action in enumerate(recommendations.get(key, ()))
+    ))
+    return [(weight, key, action) for weight, _, _, key, action in ranked]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time severity ranking against a synthetic metric library")
+    parser.add_argument('--metrics', type=int, default=5000)
+    parser.add_argument('--recommendations', type=int, default=5, help='actions per metric')
+    parser.add_argument('--repeat', type=int, default=100)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(7)
+    metric_scores = rng.uniform(0, 1.5, args.metrics).clip(max=1.0)
+    pillar_ids = rng.integers(1, 5, args.metrics)
+    type_ids = rng.integers(1, 4, args.metrics)
+    keys = list(range(args.metrics))
+    recommendations = {key: [f"action {key}.{i}" for i in range(args.recommendations)] for key in keys}
+
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        severities = severity_scores(metric_scores, pillar_ids, type_ids)
+        candidates = misses(severities, keys)
+        ranked = top_k(candidates, TOP_METRICS)
+        actions = top_actions(candidates, recommendations, TOP_ACTIONS)
+    elapsed = (time.perf_counter() - started) / args.repeat
+
+    out_of_range = len(candidates)
+    print(f"{args.metrics} metrics, {out_of_range} out of range, {out_of_range * args.recommendations} candidate actions")
+    print(f"top {len(ranked)} metrics: {[(key, round(severity, 3)) for severity, key in ranked]}")
+    print(f"top {len(actions)} actions: {[action for _, _, action in actions]}")
+    print(f"{elapsed * 1000:.2f} ms per ranking")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+import html
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from src.diagnostics.priorities import top_k
+
+logger = logging.getLogger(__name__)
+
+# Export rendering runs off the script thread in a small shared pool
+EXPORT_WORKERS = int(os.environ.get('ATA_EXPORT_WORKERS', 2))
+# Process-wide bound on finished/in-flight exports kept for re-download
+EXPORT_CACHE_SIZE = int(os.environ.get('ATA_EXPORT_CACHE_SIZE', 256))
+
+# Stands in for the generation time in cached exports; ``stamp_export`` fills it when served
+GENERATED_AT_MARK = '@@generated_at@@'
+
+EXPORT_FORMATS = {
+    'html': ('HTML', 'text/html'),
+    'md': ('Markdown', 'text/markdown'),
+    'json': ('JSON', 'application/json'),
+}
+
+_executor = None
+_executor_lock = threading.Lock()
+_exports = OrderedDict()
+_exports_lock = threading.Lock()
+
+
+def _as_data(value):
+    """Recursively turn report NamedTuples into JSON-ready dicts/lists"""
+    if hasattr(value, '_asdict'):
+        return {field: _as_data(item) for field, item in value._asdict().items()}
+    if isinstance(value, (tuple, list)):
+        return [_as_data(item) for item in value]
+    if isinstance(value, float) and value != value:
+        return None
+    return value
+
+
+def _target_text(row):
+    return f"{row.target_low} - {row.target_high} {row.unit}"
+
+
+def _ranked_misses(model):
+    """Every out-of-range metric, most severe first: the report's top priorities, then the rest"""
+    remaining = model.priorities.remaining
+    return [*model.priorities.metrics,
+            *(priority for _, priority in top_k([(p.severity, p) for p in remaining], len(remaining)))]
+
+
+def export_json(model):
+    data = _as_data(model)
+    data['generated_at'] = GENERATED_AT_MARK
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def export_markdown(model):
+    profile = model.profile
+    lines = [
+        "# SaaS Traction Diagnostic Report",
+        "",
+        f"*Generated: {GENERATED_AT_MARK}*",
+        "",
+        "## Company Profile",
+        "",
+        f"- **Annual Revenue:** ${profile.annual_revenue}M",
+        f"- **Growth Stage:** {profile.growth_stage_name}",
+        f"- **Business Model:** {profile.saas_type_name} ({profile.orientation_name})",
+        f"- **Industry:** {profile.industry_name}",
+        "",
+    ]
+
+    if model.pillar_scores:
+        lines += ["## ATA Score", "", f"**Overall: {model.overall_score:.0f}/100**", ""]
+        lines += [f"- {pillar_name}: {pillar_score:.0f}" for pillar_name, pillar_score in model.pillar_scores]
+        lines.append("")
+
+    misses = _ranked_misses(model)
+    if misses:
+        lines += ["## Top Priorities", ""]
+        for rank, priority in enumerate(misses, start=1):
+            row = priority.row
+            lines += [f"### {rank}. {row.metric_name}", "",
+                      f"Current: {row.value_text} (target {_target_text(row)}), severity {priority.severity:.2f}", ""]
+            lines += [f"- {rec}" for rec in row.recommendations]
+            if row.blog_link:
+                lines.append(f"- [Detailed Guide]({row.blog_link})")
+            if row.video_link:
+                lines.append(f"- [Video Explanation]({row.video_link})")
+            lines.append("")
+    else:
+        lines += ["Every metric is within its target range.", ""]
+
+    lines += ["## Metrics Diagnosis", ""]
+    for section in model.pillars:
+        lines += [f"### {section.pillar_name} Metrics", "", "| Metric | Current | Target Range |", "|---|---|---|"]
+        lines += [f"| {row.metric_name} | {row.value_text} | {_target_text(row)} |" for row in section.rows]
+        lines.append("")
+
+    lines += ["## Next Steps", ""]
+    if model.priorities.actions:
+        lines += ["**Start with these actions:**", ""]
+        lines += [f"{rank}. {action.action} *({action.metric_name})*"
+                  for rank, action in enumerate(model.priorities.actions, start=1)]
+        # A paragraph between the lists keeps Markdown from numbering on as one list
+        lines += ["", "**Then:**", ""]
+    lines += [
+        "1. **Establish Baseline Metrics** within 7 days",
+        "2. **Create 30/60/90 Day Plan** with milestones",
+        "",
+    ]
+    return "\n".join(lines).encode('utf-8')
+
+
+_HTML_STYLE = """
+body{font-family:-apple-system,BlinkMacSystemFont,"Segoe UI",Roboto,sans-serif;max-width:960px;margin:2rem auto;
+padding:0 1rem;color:#1f2933}
+h1,h2,h3{color:#102a43}table{border-collapse:collapse;width:100%;margin:1rem 0}
+th,td{border:1px solid #d9e2ec;padding:.4rem .6rem;text-align:left}th{background:#f0f4f8}
+.out{border-left:4px solid #e12d39;padding:.2rem 1rem;margin:1rem 0;background:#fff5f5}
+.score{font-size:1.5rem;font-weight:bold}
+"""
+
+
+def export_html(model):
+    e = html.escape
+    profile = model.profile
+    parts = [
+        "<!DOCTYPE html><html lang=\"en\"><head><meta charset=\"utf-8\">",
+        "<title>SaaS Traction Diagnostic Report</title>",
+        f"<style>{_HTML_STYLE}</style></head><body>",
+        "<h1>SaaS Traction Diagnostic Report</h1>",
+        f"<p><em>Generated: {GENERATED_AT_MARK}</em></p>",
+        "<h2>Company Profile</h2><ul>",
+        f"<li><strong>Annual Revenue:</strong> ${e(str(profile.annual_revenue))}M</li>",
+        f"<li><strong>Growth Stage:</strong> {e(str(profile.growth_stage_name))}</li>",
+        f"<li><strong>Business Model:</strong> {e(str(profile.saas_type_name))} "
+        f"({e(str(profile.orientation_name))})</li>",
+        f"<li><strong>Industry:</strong> {e(str(profile.industry_name))}</li></ul>",
+    ]
+
+    if model.pillar_scores:
+        parts.append(f"<h2>ATA Score</h2><p class=\"score\">{model.overall_score:.0f}/100</p><ul>")
+        parts += [f"<li>{e(name)}: {score:.0f}</li>" for name, score in model.pillar_scores]
+        parts.append("</ul>")
+
+    misses = _ranked_misses(model)
+    if misses:
+        parts.append("<h2>Top Priorities</h2>")
+        for rank, priority in enumerate(misses, start=1):
+            row = priority.row
+            parts.append(f"<div class=\"out\"><h3>{rank}. {e(row.metric_name)}</h3>")
+            parts.append(f"<p>Current: {e(row.value_text)} (target {e(_target_text(row))}), "
+                         f"severity {priority.severity:.2f}</p><ul>")
+            parts += [f"<li>{e(rec)}</li>" for rec in row.recommendations]
+            if row.blog_link:
+                parts.append(f"<li><a href=\"{e(row.blog_link)}\">Detailed Guide</a></li>")
+            if row.video_link:
+                parts.append(f"<li><a href=\"{e(row.video_link)}\">Video Explanation</a></li>")
+            parts.append("</ul></div>")
+    else:
+        parts.append("<p>Every metric is within its target range.</p>")
+
+    parts.append("<h2>Metrics Diagnosis</h2>")
+    for section in model.pillars:
+        parts.append(f"<h3>{e(section.pillar_name)} Metrics</h3>")
+        parts.append("<table><tr><th>Metric</th><th>Current</th><th>Target Range</th></tr>")
+        parts += [
+            f"<tr><td>{e(row.metric_name)}</td><td>{e(row.value_text)}</td><td>{e(_target_text(row))}</td></tr>"
+            for row in section.rows
+        ]
+        parts.append("</table>")
+
+    parts.append("<h2>Next Steps</h2>")
+    if model.priorities.actions:
+        parts.append("<p><strong>Start with these actions:</strong></p><ol>")
+        parts += [f"<li>{e(action.action)} <em>({e(action.metric_name)})</em></li>"
+                  for action in model.priorities.actions]
+        parts.append("</ol><p><strong>Then:</strong></p>")
+    parts.append(
+        "<ol><li><strong>Establish Baseline Metrics</strong> within 7 days</li>"
+        "<li><strong>Create 30/60/90 Day Plan</strong> with milestones</li></ol>"
+        "</body></html>"
+    )
+    return "".join(parts).encode('utf-8')
+
+
+EXPORTERS = {
+    'html': export_html,
+    'md': export_markdown,
+    'json': export_json,
+}
+
+
+def get_export_executor():
+    """Shared, bounded pool so concurrent exports never run on script threads"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=EXPORT_WORKERS, thread_name_prefix='report-export')
+        return _executor
+
+
+def find_export(model, fmt):
+    """Future of an export already requested for ``model`` in ``fmt``, or None"""
+    key = (model.fingerprint, fmt)
+    with _exports_lock:
+        future = _exports.get(key)
+        if future is not None:
+            _exports.move_to_end(key)
+        return future
+
+
+def stamp_export(data):
+    """Export bytes with the current time as their generation time"""
+    return data.replace(GENERATED_AT_MARK.encode('utf-8'), datetime.now().strftime('%Y-%m-%d %H:%M').encode('utf-8'))
+
+
+def submit_export(model, fmt):
+    """Future for the export bytes of ``model`` in ``fmt``, shared by report fingerprint"""
+    key = (model.fingerprint, fmt)
+    with _exports_lock:
+        future = _exports.get(key)
+        if future is not None and not (future.done() and future.exception() is not None):
+            _exports.move_to_end(key)
+            return future
+
+        future = get_export_executor().submit(EXPORTERS[fmt], model)
+        _exports[key] = future
+        while len(_exports) > EXPORT_CACHE_SIZE:
+            _exports.popitem(last=False)
+    logger.info(f"Queued {fmt} export for report {model.fingerprint[:8]}")
+    return future
+
+
+def export_file_name(model, fmt):
+    return f"ata-report-{model.fingerprint[:8]}.{fmt}"
@@ -0,0 +1,226 @@
+import hashlib
+import logging
+import math
+import os
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+from src.db_queries.catalog import get_catalog
+from src.db_queries.connection import get_data_version
+from src.db_queries.metrics import get_profile_metrics
+from src.db_queries.recommendations import get_recommendations_for_metrics
+from src.diagnostics.answers import get_session_answers
+from src.diagnostics.priorities import TOP_ACTIONS, TOP_METRICS, misses, severity_scores, top_actions, top_k
+from src.diagnostics.scoring import get_profile_vectors, score_answers
+
+logger = logging.getLogger(__name__)
+
+# Process-wide bound on memoized report models (shared by every session)
+REPORT_CACHE_SIZE = int(os.environ.get('ATA_REPORT_CACHE_SIZE', 512))
+
+# Answers are rounded before fingerprinting so float noise cannot split cache entries
+ANSWER_PRECISION = 6
+
+
+class ReportProfile(NamedTuple):
+    annual_revenue: float
+    growth_stage_id: int
+    growth_stage_name: str
+    saas_type_id: int
+    saas_type_name: str
+    orientation_name: str
+    industry_id: int
+    industry_name: str
+
+
+class MetricRow(NamedTuple):
+    pillar_id: int
+    metric_id: int
+    metric_name: str
+    metric_type_id: int
+    unit: str
+    value: float
+    value_text: str
+    target_low: float
+    target_high: float
+    in_range: bool
+    recommendations: tuple
+    blog_link: str
+    video_link: str
+
+
+class PillarSection(NamedTuple):
+    pillar_id: int
+    pillar_name: str
+    rows: tuple
+    out_of_range: tuple
+
+
+class ScoreCell(NamedTuple):
+    pillar_name: str
+    metric_type_name: str
+    score: int
+
+
+class PriorityMetric(NamedTuple):
+    severity: float
+    row: MetricRow
+
+
+class PriorityAction(NamedTuple):
+    severity: float
+    metric_name: str
+    action: str
+
+
+class Priorities(NamedTuple):
+    metrics: tuple  # the TOP_METRICS most severe misses, most severe first
+    remaining: tuple  # every other miss, unordered until the report asks for more
+    actions: tuple
+
+
+class ReportModel(NamedTuple):
+    fingerprint: str
+    profile: ReportProfile
+    overall_score: float
+    pillar_scores: tuple
+    score_cells: tuple
+    pillars: tuple
+    priorities: Priorities
+
+
+def report_key(session_state):
+    """Canonical, hashable view of everything a report depends on.
+
+    Only the data version, the profile and the answers of the metrics the user was
+    shown are included, so sessions with identical inputs share one key (and one
+    model) until the reference data is reloaded.
+    """
+    data_version = get_data_version()
+    growth_stage_id = session_state.get('growth_stage_id')
+    saas_type_id = session_state.get('saas_type_id')
+    industry_id = session_state.get('industry_id')
+
+    session_answers = get_session_answers(session_state, create=False)
+    answers = [
+        (pillar_id, metric_id, round(session_answers.get(metric_id), ANSWER_PRECISION))
+        for pillar_id, metrics in get_profile_metrics(growth_stage_id, saas_type_id, industry_id).items()
+        for metric_id in metrics
+        if metric_id in session_answers
+    ]
+
+    profile = (
+        session_state.get('annual_revenue'),
+        growth_stage_id,
+        session_state.get('growth_stage_name'),
+        saas_type_id,
+        session_state.get('selected_saas_type'),
+        session_state.get('selected_orientation'),
+        industry_id,
+        session_state.get('selected_industry'),
+    )
+    return data_version, profile, tuple(answers)
+
+
+def rank_priorities(sections, metric_scores, vectors):
+    """Top metrics and actions by weighted severity, selected without sorting every miss"""
+    rows = {row.metric_id: row for section in sections for row in section.out_of_range}
+    severities = severity_scores(metric_scores, vectors.pillar_ids, vectors.metric_type_ids)
+    candidates = [(severity, metric_id) for severity, metric_id in misses(severities, vectors.metric_ids.tolist())
+                  if metric_id in rows]
+    ranked = top_k(candidates, TOP_METRICS)
+    top = {metric_id for _, metric_id in ranked}
+    actions = top_actions(candidates, {metric_id: row.recommendations for metric_id, row in rows.items()}, TOP_ACTIONS)
+    return Priorities(
+        metrics=tuple(PriorityMetric(severity, rows[metric_id]) for severity, metric_id in ranked),
+        remaining=tuple(PriorityMetric(severity, rows[metric_id]) for severity, metric_id in candidates
+                        if metric_id not in top),
+        actions=tuple(PriorityAction(weight, rows[metric_id].metric_name, action) for weight, metric_id, action in actions),
+    )
+
+
+def fingerprint(key):
+    return hashlib.sha256(repr(key).encode('utf-8')).hexdigest()[:32]
+
+
+@lru_cache(maxsize=REPORT_CACHE_SIZE)
+def build_report_model(key):
+    """Build the complete, render-ready report for a canonical report key"""
+    _, profile_values, answers = key
+    profile = ReportProfile(*profile_values)
+    catalog = get_catalog()
+    profile_metrics = get_profile_metrics(profile.growth_stage_id, profile.saas_type_id, profile.industry_id)
+
+    values = {(pillar_id, metric_id): value for pillar_id, metric_id, value in answers}
+    recommendations = get_recommendations_for_metrics([metric_id for _, metric_id, _ in answers])
+
+    sections = []
+    for pillar_id, pillar in catalog.pillars.items():
+        rows = []
+        for metric_id, metric in profile_metrics.get(pillar_id, {}).items():
+            if (pillar_id, metric_id) not in values:
+                continue
+            value = values[(pillar_id, metric_id)]
+            target_low = float(metric['lo_range_value'])
+            target_high = float(metric['hi_range_value'])
+            rows.append(MetricRow(
+                pillar_id=pillar_id,
+                metric_id=metric_id,
+                metric_name=metric['metric_name'],
+                metric_type_id=metric['metric_type_id'],
+                unit=metric['units'],
+                value=value,
+                value_text=catalog.unit_format(metric['units']).formatter(value),
+                target_low=target_low,
+                target_high=target_high,
+                in_range=target_low <= value <= target_high,
+                recommendations=recommendations.get(metric_id, ()),
+                blog_link=metric['blog_link'],
+                video_link=metric['video_link'],
+            ))
+        if rows:
+            sections.append(PillarSection(
+                pillar_id=pillar_id,
+                pillar_name=pillar.pillar_name,
+                rows=tuple(rows),
+                out_of_range=tuple(row for row in rows if not row.in_range),
+            ))
+
+    vectors = get_profile_vectors(profile.growth_stage_id, profile.saas_type_id, profile.industry_id)
+    by_metric = {metric_id: value for _, metric_id, value in answers}
+    score = score_answers(np.array([by_metric.get(m, np.nan) for m in vectors.metric_ids.tolist()]), vectors)
+    score_cells = tuple(
+        ScoreCell(
+            pillar_name=catalog.pillars[int(pillar_id)].pillar_name,
+            metric_type_name=catalog.metric_types[int(type_id)].title(),
+            score=round(float(score.grid[i, j]) * 100),
+        )
+        for i, pillar_id in enumerate(score.vectors.pillar_axis)
+        for j, type_id in enumerate(score.vectors.metric_type_axis)
+        if not math.isnan(score.grid[i, j])
+    )
+
+    return ReportModel(
+        fingerprint=fingerprint(key),
+        profile=profile,
+        overall_score=score.overall,
+        pillar_scores=tuple(
+            (catalog.pillars[pillar_id].pillar_name, pillar_score)
+            for pillar_id, pillar_score in score.pillar_scores.items()
+        ),
+        score_cells=score_cells,
+        pillars=tuple(sections),
+        priorities=rank_priorities(sections, score.metric_scores, vectors),
+    )
+
+
+def get_report_model(session_state):
+    """Memoized report model for the session's current profile and answers"""
+    return build_report_model(report_key(session_state))
+
+
+def report_cache_info():
+    """Hit/miss/size counters of the process-wide report cache"""
+    return build_report_model.cache_info()
@@ -0,0 +1,142 @@
+import logging
+from typing import NamedTuple
+
+import numpy as np
+import streamlit as st
+
+from src.db_queries.catalog import get_catalog
+from src.db_queries.connection import versioned
+from src.db_queries.metrics import get_profile_metrics
+from src.diagnostics.answers import get_session_answers
+from src.utils.telemetry import cache_miss, track_loader
+
+logger = logging.getLogger(__name__)
+
+
+class ProfileVectors(NamedTuple):
+    """Per-profile range vectors, aligned by position across every field"""
+    metric_ids: np.ndarray
+    pillar_ids: np.ndarray
+    metric_type_ids: np.ndarray
+    min_value: np.ndarray
+    max_value: np.ndarray
+    lo_value: np.ndarray
+    hi_value: np.ndarray
+    pillar_axis: np.ndarray
+    metric_type_axis: np.ndarray
+    pillar_pos: np.ndarray
+    metric_type_pos: np.ndarray
+
+
+class AtaScore(NamedTuple):
+    overall: float
+    pillar_scores: dict
+    metric_scores: np.ndarray
+    grid: np.ndarray
+    vectors: ProfileVectors
+
+
+def _frozen(values, dtype=float):
+    """Read-only array: profile vectors are shared by every session with the profile"""
+    array = np.array(values, dtype=dtype)
+    array.flags.writeable = False
+    return array
+
+
+@track_loader
+@versioned
+@st.cache_resource(max_entries=256)
+@cache_miss
+def get_profile_vectors(data_version, growth_stage_id, saas_type_id=None, industry_id=None):
+    """Flatten a profile's resolved metrics into NumPy vectors (built once per profile)"""
+    catalog = get_catalog()
+    rows = [
+        (pillar_id, metric_id, metric)
+        for pillar_id, metrics in get_profile_metrics(growth_stage_id, saas_type_id, industry_id).items()
+        for metric_id, metric in metrics.items()
+    ]
+
+    pillar_ids = _frozen([pillar_id for pillar_id, _, _ in rows], np.int64)
+    metric_type_ids = _frozen([metric['metric_type_id'] for _, _, metric in rows], np.int64)
+    pillar_axis = _frozen(list(catalog.pillars), np.int64)
+    metric_type_axis = _frozen(sorted(catalog.metric_types), np.int64)
+    pillar_position = {pillar_id: i for i, pillar_id in enumerate(pillar_axis.tolist())}
+
+    return ProfileVectors(
+        metric_ids=_frozen([metric_id for _, metric_id, _ in rows], np.int64),
+        pillar_ids=pillar_ids,
+        metric_type_ids=metric_type_ids,
+        min_value=_frozen([float(metric['min_value']) for _, _, metric in rows]),
+        max_value=_frozen([float(metric['max_value']) for _, _, metric in rows]),
+        lo_value=_frozen([float(metric['lo_range_value']) for _, _, metric in rows]),
+        hi_value=_frozen([float(metric['hi_range_value']) for _, _, metric in rows]),
+        pillar_axis=pillar_axis,
+        metric_type_axis=metric_type_axis,
+        pillar_pos=_frozen([pillar_position[pillar_id] for pillar_id in pillar_ids.tolist()], np.int64),
+        metric_type_pos=_frozen(np.searchsorted(metric_type_axis, metric_type_ids), np.int64),
+    )
+
+
+def normalize_answers(answers, vectors):
+    """Map answers onto [0, 1]: 1 inside the target range, falling linearly to 0 at min/max.
+
+    Unanswered metrics (NaN) stay NaN so they drop out of every aggregate.
+    """
+    answers = np.asarray(answers, dtype=float)
+    lo, hi = vectors.lo_value, vectors.hi_value
+    below_span = np.maximum(lo - vectors.min_value, np.finfo(float).eps)
+    above_span = np.maximum(vectors.max_value - hi, np.finfo(float).eps)
+
+    with np.errstate(invalid='ignore'):
+        scores = np.where(
+            answers < lo, 1.0 - (lo - answers) / below_span,
+            np.where(answers > hi, 1.0 - (answers - hi) / above_span, 1.0))
+    scores = np.clip(scores, 0.0, 1.0)
+    scores[np.isnan(answers)] = np.nan
+    return scores
+
+
+def aggregate_scores(metric_scores, vectors):
+    """Average metric scores into a pillar x metric-type grid and per-pillar scores"""
+    shape = (len(vectors.pillar_axis), len(vectors.metric_type_axis))
+    answered = ~np.isnan(metric_scores)
+
+    sums = np.zeros(shape)
+    counts = np.zeros(shape)
+    np.add.at(sums, (vectors.pillar_pos[answered], vectors.metric_type_pos[answered]), metric_scores[answered])
+    np.add.at(counts, (vectors.pillar_pos[answered], vectors.metric_type_pos[answered]), 1)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        grid = sums / counts
+        pillar_scores = sums.sum(axis=1) / counts.sum(axis=1)
+    return grid, pillar_scores
+
+
+def score_answers(answers, vectors):
+    """Score an answer array aligned with ``vectors.metric_ids``"""
+    metric_scores = normalize_answers(answers, vectors)
+    grid, pillar_scores = aggregate_scores(metric_scores, vectors)
+
+    scored = pillar_scores[~np.isnan(pillar_scores)]
+    overall = float(scored.mean() * 100) if scored.size else float('nan')
+    return AtaScore(
+        overall=overall,
+        pillar_scores={
+            int(pillar_id): float(score * 100)
+            for pillar_id, score in zip(vectors.pillar_axis, pillar_scores)
+            if not np.isnan(score)
+        },
+        metric_scores=metric_scores,
+        grid=grid,
+        vectors=vectors,
+    )
+
+
+def compute_ata_score(session_state):
+    """Score the answers held in session state for the session's company profile"""
+    vectors = get_profile_vectors(
+        session_state.get('growth_stage_id'),
+        session_state.get('saas_type_id'),
+        session_state.get('industry_id'))
+    answers = get_session_answers(session_state, create=False).take(vectors.metric_ids)
+    return score_answers(answers, vectors)
@@ -0,0 +1,273 @@
+"""Assessment progress carried in the URL as a signed token.
+
+The whole wizard state (profile ids, revenue, completion flags, page trail and
+the answer vector) is packed into a small versioned binary payload, signed with
+HMAC-SHA256 and kept in the ``s`` query parameter. Any replica holding the same
+``ATA_SESSION_TOKEN_KEY`` can rebuild a session from it without a server-side
+lookup, so the load balancer needs no session affinity.
+
+Layout (unsigned LEB128 varints unless noted)::
+
+    version:u8  flags:u8  saas_type  orientation  industry  growth_stage   (0 = none)
+    months_existed  annual_revenue($K)  current_page:u8
+    history_len  page:u8 * history_len
+    answer_count  (metric id delta, zigzag value in hundredths) * answer_count
+    hmac:16 bytes
+
+    python -m src.diagnostics.session_token   # token size for the largest profile
+"""
+import base64
+import hashlib
+import hmac
+import logging
+import os
+import secrets
+import sys
+
+from src.db_queries.catalog import get_catalog
+from src.diagnostics.answers import get_session_answers
+
+logger = logging.getLogger(__name__)
+
+TOKEN_VERSION = 1
+TOKEN_PARAM = 's'
+SIGNATURE_BYTES = 16
+ANSWER_SCALE = 100
+REVENUE_SCALE = 1000
+HISTORY_LIMIT = 16
+
+TOKENS_ENABLED = os.environ.get('ATA_SESSION_TOKENS', '1').lower() in ('1', 'true', 'yes')
+# Shared by every replica; a per-process key would break tokens across replicas and restarts
+SECRET_KEY = os.environ.get('ATA_SESSION_TOKEN_KEY', '').encode()
+if TOKENS_ENABLED and not SECRET_KEY:
+    # The documented opt-out: said once per process, on import
+    logger.info("ATA_SESSION_TOKEN_KEY is not set; session tokens are disabled")
+    TOKENS_ENABLED = False
+
+# Page index in the token; order is part of the format, append only
+PAGES = (
+    "company_profile.py",
+    "revenue_metrics.py",
+    "product_metrics.py",
+    "system_metrics.py",
+    "people_metrics.py",
+    "report_page.py",
+)
+# Flag bit per completion key
+COMPLETION_FLAGS = ('company_profile_complete', 'pillar_1_complete', 'pillar_2_complete', 'pillar_3_complete',
+                    'pillar_4_complete')
+
+
+class InvalidSessionToken(ValueError):
+    pass
+
+
+def _put_varint(buffer, value):
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            buffer.append(byte | 0x80)
+        else:
+            buffer.append(byte)
+            return
+
+
+def _get_varint(payload, position):
+    value = shift = 0
+    while True:
+        if position >= len(payload) or shift > 63:
+            raise InvalidSessionToken("Truncated session token")
+        byte = payload[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, position
+        shift += 7
+
+
+def _zigzag(value):
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value):
+    return value // 2 if not value & 1 else -(value + 1) // 2
+
+
+def _page_index(page):
+    return PAGES.index(page) if page in PAGES else None
+
+
+def encode_session(session_state):
+    """Unsigned token payload for the session's progress"""
+    buffer = bytearray([TOKEN_VERSION])
+    buffer.append(sum(1 << bit for bit, key in enumerate(COMPLETION_FLAGS) if session_state.get(key)))
+    for key in ('saas_type_id', 'orientation_id', 'industry_id', 'growth_stage_id'):
+        _put_varint(buffer, session_state.get(key) or 0)
+    _put_varint(buffer, int(session_state.get('months_existed') or 0))
+    _put_varint(buffer, max(round((session_state.get('annual_revenue') or 0) * REVENUE_SCALE), 0))
+
+    current_page = _page_index(session_state.get('current_page'))
+    buffer.append(len(PAGES) if current_page is None else current_page)
+    history = [index for index in map(_page_index, session_state.get('page_history') or []) if index is not None]
+    history = history[-HISTORY_LIMIT:]
+    _put_varint(buffer, len(history))
+    buffer.extend(history)
+
+    answers = get_session_answers(session_state, create=False).items()
+    _put_varint(buffer, len(answers))
+    previous_id = 0
+    for metric_id, value in answers:
+        _put_varint(buffer, metric_id - previous_id)
+        _put_varint(buffer, _zigzag(round(value * ANSWER_SCALE)))
+        previous_id = metric_id
+    return bytes(buffer)
+
+
+def decode_session(payload):
+    """{session key: value} rebuilt from a token payload; names come from the catalog"""
+    if not payload or payload[0] != TOKEN_VERSION:
+        raise InvalidSessionToken(f"Unsupported session token version {payload[:1].hex() or 'none'}")
+    if len(payload) < 2:
+        raise InvalidSessionToken("Truncated session token")
+    catalog = get_catalog()
+    flags = payload[1]
+    position = 2
+
+    ids = []
+    for _ in range(4):
+        value, position = _get_varint(payload, position)
+        ids.append(value or None)
+    saas_type_id, orientation_id, industry_id, growth_stage_id = ids
+    months_existed, position = _get_varint(payload, position)
+    revenue, position = _get_varint(payload, position)
+
+    if position >= len(payload):
+        raise InvalidSessionToken("Truncated session token")
+    current_page = payload[position]
+    position += 1
+    history_length, position = _get_varint(payload, position)
+    history = payload[position:position + history_length]
+    if len(history) != history_length or any(index >= len(PAGES) for index in history):
+        raise InvalidSessionToken("Invalid page history in session token")
+    position += history_length
+
+    answer_count, position = _get_varint(payload, position)
+    answers = []
+    metric_id = 0
+    for _ in range(answer_count):
+        delta, position = _get_varint(payload, position)
+        value, position = _get_varint(payload, position)
+        metric_id += delta
+        answers.append((metric_id, _unzigzag(value) / ANSWER_SCALE))
+    if position != len(payload):
+        raise InvalidSessionToken("Trailing bytes in session token")
+
+    saas_type = catalog.saas_types.get(saas_type_id)
+    orientation = catalog.orientations.get(orientation_id)
+    industry = catalog.industries.get(industry_id)
+    stage = catalog.growth_stages.get(growth_stage_id)
+    state = {
+        'saas_type_id': saas_type.id if saas_type else None,
+        'selected_saas_type': saas_type.type_name if saas_type else 'All SaaS Types',
+        'orientation_id': orientation.id if orientation else None,
+        'selected_orientation': orientation.orientation_name if orientation else None,
+        'industry_id': industry.id if industry else None,
+        'selected_industry': industry.industry_name if industry else 'All Industries',
+        'growth_stage_id': stage.id if stage else None,
+        'growth_stage_name': stage.growth_stage_name if stage else "Undetermined",
+        'months_existed': months_existed or None,
+        'annual_revenue': revenue / REVENUE_SCALE,
+        'current_page': PAGES[current_page] if current_page < len(PAGES) else None,
+        'page_history': [PAGES[index] for index in history],
+        'answers': answers,
+    }
+    state.update({key: True for bit, key in enumerate(COMPLETION_FLAGS) if flags & (1 << bit)})
+    return state
+
+
+def sign_token(payload, key=SECRET_KEY):
+    signature = hmac.new(key, payload, hashlib.sha256).digest()[:SIGNATURE_BYTES]
+    return base64.urlsafe_b64encode(payload + signature).rstrip(b'=').decode('ascii')
+
+
+def verify_token(token, key=SECRET_KEY):
+    """Payload of a signed token; raises InvalidSessionToken when it was altered"""
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+    except (ValueError, TypeError) as e:
+        raise InvalidSessionToken(f"Malformed session token: {e}")
+    payload, signature = raw[:-SIGNATURE_BYTES], raw[-SIGNATURE_BYTES:]
+    expected = hmac.new(key, payload, hashlib.sha256).digest()[:SIGNATURE_BYTES]
+    if len(raw) <= SIGNATURE_BYTES or not hmac.compare_digest(signature, expected):
+        raise InvalidSessionToken("Session token signature mismatch")
+    return payload
+
+
+def restore_session(session_state, query_params):
+    """Rebuild a fresh session from the URL token once; returns True if state was restored"""
+    if not TOKENS_ENABLED or session_state.get('session_token_checked'):
+        return False
+    session_state['session_token_checked'] = True
+    token = query_params.get(TOKEN_PARAM)
+    if not token:
+        return False
+
+    try:
+        state = decode_session(verify_token(token))
+    except InvalidSessionToken as e:
+        logger.warning(f"Ignoring session token: {e}")
+        del query_params[TOKEN_PARAM]
+        return False
+
+    answers = get_session_answers(session_state)
+    for metric_id, value in state.pop('answers'):
+        answers.set(metric_id, value)
+    for key, value in state.items():
+        session_state[key] = value
+    session_state['session_token'] = token
+    logger.info(f"Restored session from a {len(token)} character token")
+    return True
+
+
+def save_session(session_state, query_params):
+    """Write the session's current token to the URL when it changed"""
+    if not TOKENS_ENABLED:
+        return
+    token = sign_token(encode_session(session_state))
+    if session_state.get('session_token') != token or query_params.get(TOKEN_PARAM) != token:
+        query_params[TOKEN_PARAM] = token
+        session_state['session_token'] = token
+
+
+def main():
+    from src.db_queries.metrics import get_profile_metrics
+
+    catalog = get_catalog()
+    profile, metrics = max(
+        (((stage_id, saas_type_id), get_profile_metrics(stage_id, saas_type_id))
+         for stage_id in catalog.growth_stages for saas_type_id in [None, *catalog.saas_types]),
+        key=lambda item: sum(len(pillar) for pillar in item[1].values()))
+
+    session = {
+        'growth_stage_id': profile[0], 'saas_type_id': profile[1], 'orientation_id': 1, 'industry_id': None,
+        'months_existed': 36, 'annual_revenue': 2.5, 'current_page': "report_page.py",
+        'page_history': list(PAGES), **{key: True for key in COMPLETION_FLAGS},
+    }
+    answers = get_session_answers(session)
+    for pillar in metrics.values():
+        for metric_id, metric in pillar.items():
+            answers.set(metric_id, (float(metric['lo_range_value']) + float(metric['hi_range_value'])) / 2)
+
+    payload = encode_session(session)
+    key = SECRET_KEY or secrets.token_bytes(32)
+    token = sign_token(payload, key)
+    restored = decode_session(verify_token(token, key))
+    drift = max(abs(value - answers.get(metric_id)) for metric_id, value in restored['answers'])
+    print(f"profile {profile}: {len(restored['answers'])} answers")
+    print(f"payload {len(payload)} bytes, token {len(token)} characters, max answer drift {drift:.4f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+-- Materialized metric ranges for every (growth stage, SaaS type, industry, pillar) profile.
+--
+-- saas_type_id = 0 / industry_id = 0 stand for "All SaaS Types" / "All Industries".
+-- For each profile and metric exactly one association row wins, by explicit precedence:
+--   1. an exact match on the profile's SaaS type outranks a generic (NULL) row, which
+--      outranks a type-specific row picked only because the profile left the type open;
+--   2. the same ordering is then applied to the industry;
+--   3. remaining ties go to the highest association id.
+DROP TABLE IF EXISTS resolved_metric_ranges;
+
+CREATE TABLE resolved_metric_ranges
+(
+    growth_stage_id        INTEGER        NOT NULL,
+    saas_type_id           INTEGER        NOT NULL,
+    industry_id            INTEGER        NOT NULL,
+    architecture_pillar_id INTEGER        NOT NULL,
+    metric_id              INTEGER        NOT NULL,
+    association_id         INTEGER        NOT NULL,
+    min_value              DECIMAL(12, 4) NOT NULL,
+    max_value              DECIMAL(12, 4) NOT NULL,
+    lo_range_value         DECIMAL(12, 4) NOT NULL,
+    hi_range_value         DECIMAL(12, 4) NOT NULL,
+    PRIMARY KEY (growth_stage_id, saas_type_id, industry_id, architecture_pillar_id, metric_id)
+) WITHOUT ROWID;
+
+INSERT INTO resolved_metric_ranges (growth_stage_id,
+                                    saas_type_id,
+                                    industry_id,
+                                    architecture_pillar_id,
+                                    metric_id,
+                                    association_id,
+                                    min_value,
+                                    max_value,
+                                    lo_range_value,
+                                    hi_range_value)
+WITH saas_profiles AS (SELECT 0 AS saas_type_id
+                       UNION ALL
+                       SELECT id
+                       FROM saas_types),
+     industry_profiles AS (SELECT 0 AS industry_id
+                           UNION ALL
+                           SELECT id
+                           FROM industries),
+     candidates AS (SELECT agsma.growth_stage_id,
+                           sp.saas_type_id,
+                           ip.industry_id,
+                           agsma.architecture_pillar_id,
+                           agsma.metric_id,
+                           agsma.id AS association_id,
+                           agsma.min_value,
+                           agsma.max_value,
+                           agsma.lo_range_value,
+                           agsma.hi_range_value,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY agsma.growth_stage_id,
+                                   sp.saas_type_id,
+                                   ip.industry_id,
+                                   agsma.architecture_pillar_id,
+                                   agsma.metric_id
+                               ORDER BY CASE
+                                            WHEN agsma.saas_type_id = sp.saas_type_id THEN 0
+                                            WHEN agsma.saas_type_id IS NULL THEN 1
+                                            ELSE 2 END,
+                                   CASE
+                                       WHEN agsma.industry_id = ip.industry_id THEN 0
+                                       WHEN agsma.industry_id IS NULL THEN 1
+                                       ELSE 2 END,
+                                   agsma.id DESC
+                               ) AS precedence
+                    FROM architecture_growth_stage_metric_associations agsma
+                             CROSS JOIN saas_profiles sp
+                             CROSS JOIN industry_profiles ip
+                    WHERE agsma.enabled = 1
+                      AND (agsma.saas_type_id IS NULL OR sp.saas_type_id = 0 OR agsma.saas_type_id = sp.saas_type_id)
+                      AND (agsma.industry_id IS NULL OR ip.industry_id = 0 OR agsma.industry_id = ip.industry_id))
+SELECT growth_stage_id,
+       saas_type_id,
+       industry_id,
+       architecture_pillar_id,
+       metric_id,
+       association_id,
+       min_value,
+       max_value,
+       lo_range_value,
+       hi_range_value
+FROM candidates
+WHERE precedence = 1;
@@ -0,0 +1,39 @@
+-- Full-text index over metric names, descriptions and recommendation text.
+--
+-- One row per metric (kind = 'metric') and per recommendation (kind = 'recommendation').
+-- metric_name is indexed on every row so a recommendation also matches its metric's name;
+-- the pillar is the one the metric is associated with (NULL when it has no association).
+-- Prefix indexes on 2 and 3 characters keep prefix queries off full term scans, and
+-- the default rank weights name matches over description and recommendation text.
+DROP TABLE IF EXISTS search_index;
+
+CREATE VIRTUAL TABLE search_index USING fts5
+(
+    kind UNINDEXED,
+    metric_id UNINDEXED,
+    pillar_id UNINDEXED,
+    metric_name,
+    body,
+    tokenize = 'porter unicode61 remove_diacritics 2',
+    prefix = '2 3'
+);
+
+INSERT INTO search_index (search_index, rank)
+VALUES ('rank', 'bm25(10.0, 2.0)');
+
+WITH metric_pillars AS (SELECT metric_id, MIN(architecture_pillar_id) AS pillar_id
+                        FROM architecture_growth_stage_metric_associations
+                        GROUP BY metric_id)
+INSERT
+INTO search_index (kind, metric_id, pillar_id, metric_name, body)
+SELECT 'metric', m.id, p.pillar_id, m.metric_name, m.description
+FROM metrics m
+         LEFT JOIN metric_pillars p ON p.metric_id = m.id
+UNION ALL
+SELECT 'recommendation', r.metric_id, p.pillar_id, m.metric_name, r.recommendation
+FROM recommendations r
+         JOIN metrics m ON m.id = r.metric_id
+         LEFT JOIN metric_pillars p ON p.metric_id = r.metric_id;
+
+INSERT INTO search_index (search_index)
+VALUES ('optimize');
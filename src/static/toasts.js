@@ -0,0 +1,45 @@
+// Client-side toast sequencer, injected into the app document once per session.
+// Delays run in the browser so the Streamlit script thread never waits on them.
+function ataShowToasts(toasts) {
+    if (window.ataToastsScheduled) {
+        return;
+    }
+    window.ataToastsScheduled = true;
+
+    var stack = document.createElement('div');
+    stack.setAttribute('aria-live', 'polite');
+    stack.style.cssText = 'position:fixed;right:1rem;bottom:1rem;z-index:100000;display:flex;' +
+        'flex-direction:column;gap:.5rem;max-width:22rem;font-family:inherit;';
+    document.body.appendChild(stack);
+
+    function escapeHtml(text) {
+        var div = document.createElement('div');
+        div.textContent = text;
+        return div.innerHTML;
+    }
+
+    function show(toast) {
+        var el = document.createElement('div');
+        el.style.cssText = 'background:#f0f2f6;color:#31333f;border-radius:.5rem;padding:.75rem 1rem;' +
+            'box-shadow:0 4px 12px rgba(0,0,0,.15);font-size:.9rem;line-height:1.4;opacity:0;' +
+            'transition:opacity .3s ease;';
+        // Messages use the same **bold** markdown as st.toast
+        el.innerHTML = escapeHtml(toast.icon + ' ' + toast.body).replace(/\*\*(.+?)\*\*/g, '<strong>$1</strong>');
+        stack.appendChild(el);
+        requestAnimationFrame(function () {
+            el.style.opacity = '1';
+        });
+        setTimeout(function () {
+            el.style.opacity = '0';
+            setTimeout(function () {
+                el.remove();
+            }, 300);
+        }, toast.duration);
+    }
+
+    toasts.forEach(function (toast) {
+        setTimeout(function () {
+            show(toast);
+        }, toast.delay);
+    });
+}
@@ -0,0 +1,186 @@
+"""Static asset pipeline: minify, fingerprint and precompress the app's CSS/JS/SVG.
+
+Every asset is processed once per process. Pages get either the minified content
+inlined once per session (installed into the app document, see
+``src.components.global_assets``), or (when ``ASSET_BASE_URL`` is set) a short
+``<link>``/``<img>`` reference to a content-hashed file that can be cached forever
+by the browser.
+
+Streamlit's own static serving (``/app/static``) sends CSS, JS and SVG as
+``text/plain`` with ``nosniff``, so browsers refuse them as stylesheets/scripts, and
+it sets no long-lived cache headers. Browser caching and precompression therefore
+only apply behind a CDN or reverse proxy: ``ASSET_BASE_URL`` points at it, and it
+serves the generated ``static/`` directory with proper types, the ``.gz``/``.br``
+siblings and ``Cache-Control: public, max-age=31536000, immutable``. Without one,
+nothing is written to disk.
+
+    python -m src.utils.assets   # write static/ and static/manifest.json for the CDN
+"""
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+from typing import NamedTuple
+
+import streamlit as st
+
+try:
+    import brotli
+except ImportError:  # optional: gzip copies are always written
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Where hashed/precompressed copies go, for the CDN/proxy behind ASSET_BASE_URL to serve
+ASSET_OUTPUT_DIR = os.environ.get('ATA_ASSET_DIR', 'static')
+# Public URL of ASSET_OUTPUT_DIR behind a CDN/proxy; empty means inline assets
+ASSET_BASE_URL = os.environ.get('ASSET_BASE_URL', '').rstrip('/')
+
+ASSET_SOURCES = {
+    'styles': 'src/static/styles.css',
+    'script': 'src/static/script.js',
+    'toasts': 'src/static/toasts.js',
+    'logo': 'src/media/Minimalist_Horizontal_Blue.svg',
+}
+
+MIME_TYPES = {
+    '.css': 'text/css',
+    '.js': 'text/javascript',
+    '.svg': 'image/svg+xml',
+}
+
+
+class Asset(NamedTuple):
+    name: str
+    file_name: str
+    mime_type: str
+    content: str
+    digest: str
+
+    @property
+    def url(self):
+        return f"{ASSET_BASE_URL}/{self.file_name}"
+
+    @property
+    def data_uri(self):
+        encoded = base64.b64encode(self.content.encode('utf-8')).decode('ascii')
+        return f"data:{self.mime_type};base64,{encoded}"
+
+
+def minify_css(text):
+    """Drop comments and insignificant whitespace (spaces before ':' are kept for selectors)"""
+    text = re.sub(r'/\*.*?\*/', '', text, flags=re.S)
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'\s*([{};,])\s*', r'\1', text)
+    text = re.sub(r':\s+', ':', text)
+    return text.replace(';}', '}').strip()
+
+
+def minify_js(text):
+    """Conservative: drop full-line comments, indentation and blank lines"""
+    lines = (line.strip() for line in text.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//'))
+
+
+def minify_svg(text):
+    text = re.sub(r'<!--.*?-->', '', text, flags=re.S)
+    text = re.sub(r'>\s+<', '><', text)
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+MINIFIERS = {
+    '.css': minify_css,
+    '.js': minify_js,
+    '.svg': minify_svg,
+}
+
+
+def build_asset(name, path):
+    """Minify and fingerprint a single source file"""
+    stem, ext = os.path.splitext(os.path.basename(path))
+    with open(path, encoding='utf-8') as f:
+        content = MINIFIERS[ext](f.read())
+    digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:12]
+    return Asset(name, f"{stem}.{digest}{ext}", MIME_TYPES[ext], content, digest)
+
+
+def write_asset(asset, out_dir=ASSET_OUTPUT_DIR):
+    """Write the hashed file plus precompressed siblings; skipped when already present"""
+    target = os.path.join(out_dir, asset.file_name)
+    if os.path.exists(target):
+        return False
+
+    data = asset.content.encode('utf-8')
+    variants = {target: data, f"{target}.gz": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[f"{target}.br"] = brotli.compress(data)
+
+    # Siblings first, the plain file last: its presence marks the asset complete
+    for path in sorted(variants, key=lambda p: p == target):
+        tmp_path = f"{path}.tmp{os.getpid()}"
+        with open(tmp_path, 'wb') as f:
+            f.write(variants[path])
+        os.replace(tmp_path, path)
+    return True
+
+
+def write_manifest(assets, out_dir=ASSET_OUTPUT_DIR):
+    manifest = {
+        asset.name: {'file': asset.file_name, 'sha256': asset.digest, 'bytes': len(asset.content.encode('utf-8'))}
+        for asset in assets.values()
+    }
+    tmp_path = os.path.join(out_dir, f"manifest.json.tmp{os.getpid()}")
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, os.path.join(out_dir, 'manifest.json'))
+
+
+def process_assets(sources=ASSET_SOURCES):
+    """Minify and fingerprint every asset in memory"""
+    return {name: build_asset(name, path) for name, path in sources.items()}
+
+
+def build_assets(sources=ASSET_SOURCES, out_dir=ASSET_OUTPUT_DIR):
+    """Process every asset and publish the hashed copies and manifest"""
+    assets = process_assets(sources)
+    os.makedirs(out_dir, exist_ok=True)
+    written = [asset.file_name for asset in assets.values() if write_asset(asset, out_dir)]
+    write_manifest(assets, out_dir)
+    if written:
+        logger.info(f"Published assets: {', '.join(written)}")
+    return assets
+
+
+@st.cache_resource
+def get_assets():
+    """All assets, processed once per process; reruns never touch the disk.
+
+    Files are published only for a CDN/proxy to serve; inlined assets stay in memory.
+    """
+    if not ASSET_BASE_URL:
+        return process_assets()
+    try:
+        return build_assets()
+    except OSError as e:
+        logger.warning(f"Could not publish static assets, the CDN must already hold them: {e}")
+        return process_assets()
+
+
+def get_asset(name):
+    return get_assets()[name]
+
+
+def main():
+    assets = build_assets()
+    for asset in assets.values():
+        print(f"{asset.name:8} {asset.file_name:40} {len(asset.content.encode('utf-8')):>7} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
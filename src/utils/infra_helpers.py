@@ -1,12 +1,13 @@
+import functools
 import logging
 import os
 
-import toml
-
 
 def setup_logging():
     """Configure logging based on .streamlit/config.toml settings"""
     try:
+        import toml
+
         # Attempt to load the config.toml file
         config_path = os.path.join('.streamlit', 'config.toml')
         if os.path.exists(config_path):
@@ -61,3 +62,9 @@ def setup_logging():
                             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         logging.error(f"Error setting up logging from config: {str(e)}")
         return False
+
+
+@functools.lru_cache(maxsize=None)
+def ensure_logging():
+    """Run ``setup_logging`` once per process, on first use instead of at import"""
+    return setup_logging()
@@ -0,0 +1,149 @@
+"""Prometheus instrumentation served on a local metrics port.
+
+    ata_page_rerun_seconds{page}            full-script reruns, per page
+    ata_loader_seconds{loader}              every src/db_queries loader call
+    ata_cache_miss_seconds{loader}          loader work on cache misses (recompute time)
+    ata_cache_requests_total{cache,result}  st.cache_resource hits and misses
+    ata_report_generations_total{outcome}   generate_report calls
+    ata_report_generation_seconds           generate_report latency
+    ata_sessions_created_total / ata_active_sessions
+
+The exporter listens on ``ATA_METRICS_PORT`` (default 9464, 0 disables).
+"""
+import functools
+import logging
+import os
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+
+import streamlit as st
+from prometheus_client import Counter, Gauge, Histogram, start_http_server
+
+logger = logging.getLogger(__name__)
+
+METRICS_PORT = int(os.environ.get('ATA_METRICS_PORT', 9464))
+METRICS_ADDR = os.environ.get('ATA_METRICS_ADDR', '127.0.0.1')
+
+LATENCY_BUCKETS = (.005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (.0001, .0005, .001, .0025, .005, .01, .025, .05, .1, .25, 1)
+
+PAGE_RERUN_SECONDS = Histogram(
+    'ata_page_rerun_seconds', 'Full-script rerun latency per page', ['page'], buckets=LATENCY_BUCKETS)
+LOADER_SECONDS = Histogram(
+    'ata_loader_seconds', 'Reference data loader latency, cache hits included', ['loader'], buckets=QUERY_BUCKETS)
+CACHE_MISS_SECONDS = Histogram(
+    'ata_cache_miss_seconds', 'Loader time spent recomputing on cache misses', ['loader'], buckets=QUERY_BUCKETS)
+CACHE_REQUESTS = Counter(
+    'ata_cache_requests', 'Cached loader lookups', ['cache', 'result'])
+REPORT_GENERATIONS = Counter(
+    'ata_report_generations', 'Report renders', ['outcome'])
+REPORT_SECONDS = Histogram(
+    'ata_report_generation_seconds', 'generate_report latency', buckets=LATENCY_BUCKETS)
+SESSIONS_CREATED = Counter(
+    'ata_sessions_created', 'Browser sessions initialized')
+ACTIVE_SESSIONS = Gauge(
+    'ata_active_sessions', 'Sessions whose state is still held by this server')
+
+# Per-thread stack of "did this loader call miss its cache" flags (loaders nest)
+_calls = threading.local()
+
+
+class _SessionMarker:
+    """Kept in a session's state; collected with it when the server drops the session"""
+    __slots__ = ('__weakref__',)
+
+
+@st.cache_resource
+def start_metrics_server():
+    """Start the exporter once per process; a busy port (another worker) is only logged"""
+    if not METRICS_PORT:
+        return False
+    try:
+        start_http_server(METRICS_PORT, addr=METRICS_ADDR)
+    except OSError as e:
+        logger.warning(f"Metrics exporter not started on {METRICS_ADDR}:{METRICS_PORT}: {e}")
+        return False
+    logger.info(f"Metrics exporter listening on {METRICS_ADDR}:{METRICS_PORT}")
+    return True
+
+
+def track_loader(func):
+    """Time a loader; when it wraps an ``st.cache_resource`` function, count hits/misses.
+
+    Cached loaders put ``cache_miss`` under ``st.cache_resource``::
+
+        @track_loader
+        @st.cache_resource
+        @cache_miss
+        def get_catalog(): ...
+    """
+    name = func.__name__
+    cached = hasattr(func, 'clear')
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        stack = _calls.__dict__.setdefault('stack', [])
+        stack.append(False)
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            LOADER_SECONDS.labels(name).observe(time.perf_counter() - started)
+            missed = stack.pop()
+            if cached:
+                CACHE_REQUESTS.labels(name, 'miss' if missed else 'hit').inc()
+
+    if cached:
+        wrapper.clear = func.clear
+    return wrapper
+
+
+def cache_miss(func):
+    """Runs only when the surrounding cache misses: flag it and time the recompute"""
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        stack = getattr(_calls, 'stack', None)
+        if stack:
+            stack[-1] = True
+        with CACHE_MISS_SECONDS.labels(name).time():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+@contextmanager
+def track_page(page):
+    """Observe one full-script run of ``page`` (page switches/stops included)"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        PAGE_RERUN_SECONDS.labels(page).observe(time.perf_counter() - started)
+
+
+@contextmanager
+def track_report():
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        REPORT_GENERATIONS.labels('error').inc()
+        raise
+    else:
+        REPORT_GENERATIONS.labels('success').inc()
+    finally:
+        REPORT_SECONDS.observe(time.perf_counter() - started)
+
+
+def record_session_start(session_state):
+    """Count a session the first time its state is initialized, and until its state is released"""
+    if 'telemetry_session' not in session_state:
+        marker = _SessionMarker()
+        session_state['telemetry_session'] = marker
+        SESSIONS_CREATED.inc()
+        ACTIVE_SESSIONS.inc()
+        weakref.finalize(marker, ACTIVE_SESSIONS.dec)